@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     test_arrow.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Test arrow module."""
+
+from __future__ import annotations
+
+import datetime
+import pathlib
+from typing import List
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from tzolkin_calendar.calculate import getTzolkinDay, gregorian2tzolkin
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+tzolkin_arrow = pytest.importorskip("tzolkin_calendar.arrow")
+
+
+################################################################################
+@settings(max_examples=100, deadline=None)
+@given(dates=st.lists(st.dates(), max_size=50))
+def test_toRecordBatch(dates: List[datetime.date]) -> None:
+    """Test `arrow.toRecordBatch` against `calculate.gregorian2tzolkin`."""
+    batch = tzolkin_arrow.toRecordBatch(dates)
+    assert batch.schema == tzolkin_arrow.TZOLKIN_SCHEMA  # nosec
+    good_rows = []
+    for date in dates:
+        tzolkin = gregorian2tzolkin(date)
+        good_rows.append(
+            {
+                "date": date,
+                "ordinal": date.toordinal(),
+                "year_day": getTzolkinDay(tzolkin),
+                "number": tzolkin.number,
+                "name_number": tzolkin.name,
+                "name": tzolkin.__repr__().split(" ")[1],
+                "label": tzolkin.__repr__(),
+            }
+        )
+    assert batch.to_pylist() == good_rows  # nosec
+
+
+################################################################################
+def test_sharedDictionaries() -> None:
+    """Test that all record batches share the same dictionaries."""
+    first, second = tzolkin_arrow.iterRecordBatches(
+        datetime.date(2021, 1, 1), datetime.date(2021, 1, 20), batch_size=10
+    )
+    assert first.column("name").dictionary.equals(  # nosec
+        second.column("name").dictionary
+    )
+    assert len(first.column("name").dictionary) == 20  # nosec
+    assert len(first.column("label").dictionary) == 260  # nosec
+
+
+################################################################################
+@pytest.mark.parametrize("row_group_size", [1, 100, 1000])
+def test_writeParquet(tmp_path: pathlib.Path, row_group_size: int) -> None:
+    """Test `arrow.writeParquet`."""
+    file_name = str(tmp_path / "tzolkin.parquet")
+    start = datetime.date(1999, 12, 1)
+    end = datetime.date(2000, 3, 1)
+    num_rows = (end - start).days + 1
+    assert (  # nosec
+        tzolkin_arrow.writeParquet(file_name, start, end, row_group_size) == num_rows
+    )
+
+    parquet_file = pq.ParquetFile(file_name)
+    assert parquet_file.metadata.num_rows == num_rows  # nosec
+    assert parquet_file.metadata.num_row_groups == -(  # nosec
+        -num_rows // row_group_size
+    )
+    table = parquet_file.read()
+    assert table.column("date").to_pylist() == [  # nosec
+        start + datetime.timedelta(days=idx) for idx in range(num_rows)
+    ]
+    assert table.column("label").to_pylist() == [  # nosec
+        gregorian2tzolkin(start + datetime.timedelta(days=idx)).__repr__()
+        for idx in range(num_rows)
+    ]
+    assert table.schema.metadata == tzolkin_arrow.TZOLKIN_SCHEMA.metadata  # nosec
+
+
+################################################################################
+def test_emptyRange(tmp_path: pathlib.Path) -> None:
+    """Test `arrow.writeParquet` with an end date before the start date."""
+    file_name = str(tmp_path / "tzolkin.parquet")
+    assert (  # nosec
+        tzolkin_arrow.writeParquet(
+            file_name, datetime.date(2000, 1, 2), datetime.date(2000, 1, 1)
+        )
+        == 0
+    )
+    assert pq.ParquetFile(file_name).metadata.num_rows == 0  # nosec
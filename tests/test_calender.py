@@ -10,19 +10,48 @@
 from __future__ import annotations
 
 import datetime
-from typing import List, Optional
+import itertools
+from typing import Dict, List, Optional
 
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
-from tzolkin_calendar import USED_DATEFMT, TzolkinDate, day_names, day_numbers
+from tzolkin_calendar import (
+    USED_DATEFMT,
+    TzolkinDate,
+    TzolkinException,
+    calculate,
+    day_glyphs,
+    day_names,
+    day_names_ascii,
+    day_names_colonial,
+    day_names_kiche,
+    day_names_nahuatl,
+    day_numbers,
+)
 from tzolkin_calendar.calculate import (
+    countTzolkinBetween,
+    getTzolkinDay,
+    getTzolkinDiff,
     gregorian2tzolkin,
+    iterTzolkin2gregorian,
     lastTzolkin,
+    makeLabelBytesTable,
+    makeLabelTable,
+    makeLookUpTable,
     nextTzolkin,
+    ordinal2tzolkin,
+    ordinal2TzolkinDay,
+    parseTzolkinName,
+    parseTzolkinNames,
+    registerTzolkinAlias,
     tzolkin2gregorian,
+    tzolkinDatesBetween,
+    tzolkinOrdinalLast,
+    tzolkinOrdinalNext,
 )
+from tzolkin_calendar.tzolkin import Tzolkin
 
 # Using https://maya.nmai.si.edu/calendar/maya-calendar-converter
 local_reference_dates = {
@@ -302,3 +331,402 @@ def test_lastTzolkin(tzolkin: TzolkinDate, gregorian: str, day_diff: int) -> Non
     given_date = datetime.datetime.strptime(gregorian, USED_DATEFMT).date()
     start_date = given_date + datetime.timedelta(days=day_diff)
     assert lastTzolkin(tzolkin=tzolkin, starting=start_date) == given_date  # nosec
+
+
+################################################################################
+def test_makeLookUpTable() -> None:
+    """Test the shared, read-only Tzolkin year of `makeLookUpTable`."""
+    table = makeLookUpTable()
+    assert table is makeLookUpTable()  # nosec
+    assert len(table) == len(day_names) * len(day_numbers)  # nosec
+    assert table[1] == TzolkinDate(number=1, name=1)  # nosec
+    assert table[260] == TzolkinDate(number=13, name=20)  # nosec
+    with pytest.raises(TypeError):
+        table[1] = TzolkinDate(number=2, name=2)  # type: ignore
+
+
+################################################################################
+@pytest.mark.parametrize("year_day", range(1, 261))
+def test_tzolkinDatePool(year_day: int) -> None:
+    """Test the shared instances of `TzolkinDate.of` and `TzolkinDate.fromYearDay`."""
+    tzolkin = TzolkinDate.fromYearDay(year_day)
+    assert tzolkin == makeLookUpTable()[year_day]  # nosec
+    assert tzolkin is makeLookUpTable()[year_day]  # nosec
+    assert tzolkin is TzolkinDate.of(number=tzolkin.number, name=tzolkin.name)  # nosec
+    assert getTzolkinDay(tzolkin) == year_day  # nosec
+    ordinal = next(o for o in range(1, 262) if ordinal2TzolkinDay(o) == year_day)
+    assert ordinal2tzolkin(ordinal) is tzolkin  # nosec
+    assert Tzolkin.fromDate(  # nosec
+        datetime.date(2021, 1, 1) + datetime.timedelta(days=year_day)
+    ).getTzolkinDate() is gregorian2tzolkin(
+        datetime.date(2021, 1, 1) + datetime.timedelta(days=year_day)
+    )
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "orthography, names",
+    [
+        ("modern", day_names),
+        ("ascii", day_names_ascii),
+        ("colonial", day_names_colonial),
+    ],
+)
+@pytest.mark.parametrize("glyphs", [False, True])
+def test_makeLabelTable(orthography: str, names: Dict[int, str], glyphs: bool) -> None:
+    """Test the precomputed Tzolkin date strings of `makeLabelTable`."""
+    labels = makeLabelTable(orthography=orthography, glyphs=glyphs)
+    assert labels is makeLabelTable(orthography=orthography, glyphs=glyphs)  # nosec
+    assert len(labels) == len(day_names) * len(day_numbers) + 1  # nosec
+    assert labels[0] == ""  # nosec
+    for year_day, tzolkin in makeLookUpTable().items():
+        label = "{number} {name}".format(
+            number=tzolkin.number, name=names[tzolkin.name]
+        )
+        if glyphs:
+            label += " ({glyph})".format(glyph=day_glyphs[tzolkin.name])
+        assert labels[year_day] == label  # nosec
+        if orthography == "modern" and not glyphs:
+            assert tzolkin.__repr__() is labels[year_day]  # nosec
+            assert str(tzolkin) is repr(tzolkin)  # nosec
+
+    label_bytes = makeLabelBytesTable(orthography=orthography, glyphs=glyphs)
+    assert label_bytes == tuple(label.encode("utf-8") for label in labels)  # nosec
+    assert all(label.isascii() for label in labels) == (  # nosec
+        orthography != "modern" and not glyphs
+    )
+
+
+################################################################################
+def test_makeLabelTableInvalid() -> None:
+    """Test `makeLabelTable` and `makeLabelBytesTable` with unknown orthographies."""
+    with pytest.raises(TzolkinException):
+        makeLabelTable(orthography="klingon")
+    with pytest.raises(TzolkinException):
+        makeLabelBytesTable(orthography="klingon", glyphs=True)
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "number, name",
+    [(0, 1), (14, 1), (1, 0), (1, 21), ("1", 1), (None, None), (True, 1), (1, True)],
+)
+def test_tzolkinDatePoolInvalid(number: int, name: int) -> None:
+    """Test `TzolkinDate.of` and `TzolkinDate.fromYearDay` with invalid values."""
+    with pytest.raises(TzolkinException):
+        TzolkinDate.of(number=number, name=name)
+
+
+################################################################################
+@pytest.mark.parametrize("year_day", [0, 261, -1, "5", 5.0, None, True, False])
+def test_tzolkinDateFromYearDayInvalid(year_day: int) -> None:
+    """Test `TzolkinDate.fromYearDay` with invalid days in the Tzolkin year."""
+    with pytest.raises(TzolkinException):
+        TzolkinDate.fromYearDay(year_day)
+
+
+################################################################################
+def test_getTzolkinDay() -> None:
+    """Test the reverse index of `getTzolkinDay`."""
+    for day, tzolkin in makeLookUpTable().items():
+        assert getTzolkinDay(tzolkin) == day  # nosec
+    assert getTzolkinDay(TzolkinDate(number=14, name=1)) == 0  # nosec
+
+
+################################################################################
+@settings(max_examples=500, deadline=None)
+@given(
+    day1=st.integers(min_value=1, max_value=260),
+    day2=st.integers(min_value=1, max_value=260),
+)
+def test_getTzolkinDiff(day1: int, day2: int) -> None:
+    """Test `getTzolkinDiff` against the days in the Tzolkin year."""
+    table = makeLookUpTable()
+    diff = getTzolkinDiff(start=table[day1], end=table[day2])
+    assert 1 <= diff <= 260  # nosec
+    assert (day1 + diff - day2) % 260 == 0  # nosec
+
+
+################################################################################
+@settings(max_examples=500, deadline=None)
+@given(date=st.dates())
+def test_ordinal2tzolkin(date: datetime.date) -> None:
+    """Test `ordinal2tzolkin` and `ordinal2TzolkinDay` against `gregorian2tzolkin`."""
+    ordinal = date.toordinal()
+    tzolkin = ordinal2tzolkin(ordinal)
+    assert tzolkin == gregorian2tzolkin(date)  # nosec
+    assert ordinal2TzolkinDay(ordinal) == getTzolkinDay(tzolkin)  # nosec
+
+
+################################################################################
+@settings(max_examples=500, deadline=None)
+@given(
+    ordinal=st.integers(min_value=1000, max_value=3000000),
+    day=st.integers(min_value=1, max_value=260),
+)
+def test_tzolkinOrdinalNextLast(ordinal: int, day: int) -> None:
+    """Test `tzolkinOrdinalNext` and `tzolkinOrdinalLast`."""
+    tzolkin = makeLookUpTable()[day]
+    next_ordinal = tzolkinOrdinalNext(tzolkin=tzolkin, ordinal=ordinal)
+    last_ordinal = tzolkinOrdinalLast(tzolkin=tzolkin, ordinal=ordinal)
+    assert ordinal < next_ordinal <= ordinal + 260  # nosec
+    assert ordinal - 260 <= last_ordinal < ordinal  # nosec
+    assert ordinal2tzolkin(next_ordinal) == tzolkin  # nosec
+    assert ordinal2tzolkin(last_ordinal) == tzolkin  # nosec
+    start = datetime.date.fromordinal(ordinal)
+    assert (  # nosec
+        nextTzolkin(tzolkin=tzolkin, starting=start).toordinal() == next_ordinal
+    )
+    assert (  # nosec
+        lastTzolkin(tzolkin=tzolkin, starting=start).toordinal() == last_ordinal
+    )
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(
+    date=st.dates(
+        min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9000, 1, 1)
+    ),
+    day=st.integers(min_value=1, max_value=260),
+    num_results=st.integers(min_value=-1, max_value=30),
+)
+def test_tzolkin2gregorianChained(
+    date: datetime.date, day: int, num_results: int
+) -> None:
+    """Test `tzolkin2gregorian` against chained calls of `nextTzolkin` and
+    `lastTzolkin`.
+    """
+    tzolkin = makeLookUpTable()[day]
+    chained_f: List[datetime.date] = []
+    chained_b: List[datetime.date] = []
+    start_f = date
+    start_b = date
+    for _ in range(0, num_results):
+        start_f = nextTzolkin(tzolkin=tzolkin, starting=start_f)
+        start_b = lastTzolkin(tzolkin=tzolkin, starting=start_b)
+        chained_f.append(start_f)
+        chained_b.append(start_b)
+
+    assert (  # nosec
+        tzolkin2gregorian(tzolkin=tzolkin, start=date, num_results=num_results)
+        == chained_f
+    )
+    assert (  # nosec
+        tzolkin2gregorian(
+            tzolkin=tzolkin, start=date, num_results=num_results, forward=False
+        )
+        == chained_b
+    )
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(
+    date=st.dates(
+        min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9000, 1, 1)
+    ),
+    day=st.integers(min_value=1, max_value=260),
+    num_results=st.integers(min_value=0, max_value=30),
+)
+def test_iterTzolkin2gregorian(date: datetime.date, day: int, num_results: int) -> None:
+    """Test `iterTzolkin2gregorian` against `tzolkin2gregorian`."""
+    tzolkin = makeLookUpTable()[day]
+    for forward in [True, False]:
+        date_list = tzolkin2gregorian(
+            tzolkin=tzolkin, start=date, num_results=num_results, forward=forward
+        )
+        date_iter = iterTzolkin2gregorian(tzolkin=tzolkin, start=date, forward=forward)
+        assert list(itertools.islice(date_iter, num_results)) == date_list  # nosec
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(
+    date=st.dates(
+        min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9000, 1, 1)
+    ),
+    day=st.integers(min_value=1, max_value=260),
+    days=st.integers(min_value=0, max_value=5000),
+)
+def test_iterTzolkin2gregorianStop(date: datetime.date, day: int, days: int) -> None:
+    """Test the stop date of `iterTzolkin2gregorian`."""
+    tzolkin = makeLookUpTable()[day]
+    stop_f = date + datetime.timedelta(days=days)
+    stop_b = date - datetime.timedelta(days=days)
+    list_f = list(iterTzolkin2gregorian(tzolkin=tzolkin, start=date, stop=stop_f))
+    list_b = list(
+        iterTzolkin2gregorian(tzolkin=tzolkin, start=date, forward=False, stop=stop_b)
+    )
+    max_results = days // 260 + 1
+    good_f = tzolkin2gregorian(tzolkin=tzolkin, start=date, num_results=max_results)
+    good_b = tzolkin2gregorian(
+        tzolkin=tzolkin, start=date, num_results=max_results, forward=False
+    )
+    assert list_f == [elem for elem in good_f if elem <= stop_f]  # nosec
+    assert list_b == [elem for elem in good_b if elem >= stop_b]  # nosec
+
+
+################################################################################
+def test_iterTzolkin2gregorianEnd() -> None:
+    """Test `iterTzolkin2gregorian` at the end of the range of `datetime.date`."""
+    tzolkin = TzolkinDate(number=8, name=11)
+    start = datetime.date.max - datetime.timedelta(days=1000)
+    date_list = list(iterTzolkin2gregorian(tzolkin=tzolkin, start=start))
+    assert 3 <= len(date_list) <= 4  # nosec
+    assert date_list[0] == nextTzolkin(tzolkin=tzolkin, starting=start)  # nosec
+
+
+################################################################################
+@settings(max_examples=300, deadline=None)
+@given(
+    start=st.dates(
+        min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9000, 1, 1)
+    ),
+    day=st.integers(min_value=1, max_value=260),
+    days=st.integers(min_value=-300, max_value=3000),
+)
+def test_tzolkinDatesBetween(start: datetime.date, day: int, days: int) -> None:
+    """Test `tzolkinDatesBetween` and `countTzolkinBetween` by checking all days."""
+    tzolkin = makeLookUpTable()[day]
+    end = start + datetime.timedelta(days=days)
+    good_list = [
+        start + datetime.timedelta(days=idx)
+        for idx in range(0, days + 1)
+        if gregorian2tzolkin(start + datetime.timedelta(days=idx)) == tzolkin
+    ]
+    assert (  # nosec
+        tzolkinDatesBetween(tzolkin=tzolkin, start=start, end=end) == good_list
+    )
+    assert countTzolkinBetween(tzolkin=tzolkin, start=start, end=end) == len(  # nosec
+        good_list
+    )
+
+
+################################################################################
+def test_tzolkinDatesBetweenInvalid() -> None:
+    """Test `tzolkinDatesBetween` and `countTzolkinBetween` with an invalid date."""
+    tzolkin = TzolkinDate(number=0, name=21)
+    start = datetime.date(2000, 1, 1)
+    end = datetime.date(2100, 1, 1)
+    assert tzolkinDatesBetween(tzolkin=tzolkin, start=start, end=end) == []  # nosec
+    assert countTzolkinBetween(tzolkin=tzolkin, start=start, end=end) == 0  # nosec
+
+
+################################################################################
+def __parseNameSlow(name_str: str) -> int:
+    """Reference implementation of `parseTzolkinName`, comparing with all names and
+    aliases.
+
+    Args:
+        name_str (str): The string to parse to get a Tzolkin day name.
+
+    Returns:
+        int: The number of the found Tzolkin day name. 0 on errors.
+    """
+    filtered = "".join([a for a in name_str.upper() if a.isascii() and a.isalpha()])
+    for names in (day_names, day_names_colonial, day_names_kiche, day_names_nahuatl):
+        for num, name in names.items():
+            if filtered == "".join(
+                [a for a in name.upper() if a.isascii() and a.isalpha()]
+            ):
+                return num
+
+    return 0
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "name_str, number",
+    [
+        ("Imix", 1),
+        ("Ikʼ", 2),
+        ("ik", 2),
+        ("Akʼbʼal", 3),
+        ("AK'B'AL", 3),
+        ("etz-nab", 18),
+        ("  Ajaw ", 20),
+        ("Ajaw1", 20),
+        ("", 0),
+        ("Ajawa", 0),
+        ("ʼʼ", 0),
+        ("Ahau", 20),
+        ("ahau", 20),
+        ("Kan", 4),
+        ("Kʼat", 4),
+        ("Chicchan", 5),
+        ("Cauac", 19),
+        ("Etznab", 18),
+        ("Imox", 1),
+        ("Ajpu", 20),
+        ("Cipactli", 1),
+        ("Xochitl", 20),
+    ],
+)
+def test_parseTzolkinName(name_str: str, number: int) -> None:
+    """Test `parseTzolkinName` and `parseTzolkinNames`."""
+    assert parseTzolkinName(name_str) == number  # nosec
+    assert parseTzolkinNames([name_str, name_str]).tolist() == [  # nosec
+        number,
+        number,
+    ]
+
+
+################################################################################
+@settings(max_examples=300, deadline=None)
+@given(
+    name_strs=st.lists(
+        st.one_of(
+            st.sampled_from(
+                list(day_names.values())
+                + list(day_names_colonial.values())
+                + list(day_names_kiche.values())
+                + list(day_names_nahuatl.values())
+            ),
+            st.text(max_size=10),
+        ),
+        max_size=30,
+    )
+)
+def test_parseTzolkinNames(name_strs: List[str]) -> None:
+    """Test `parseTzolkinName` and `parseTzolkinNames` against the slow reference
+    implementation.
+    """
+    result = parseTzolkinNames(iter(name_strs))
+    assert result.typecode == "B"  # nosec
+    assert result.tolist() == [__parseNameSlow(name) for name in name_strs]  # nosec
+    assert result.tolist() == [parseTzolkinName(name) for name in name_strs]  # nosec
+
+
+################################################################################
+def test_registerTzolkinAlias(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `registerTzolkinAlias`."""
+    # Register the aliases in a copy of the index of the day names, restored after
+    # the test, to not change the day names of the other tests.
+    monkeypatch.setattr(
+        calculate, "__day_name_index", dict(vars(calculate)["__day_name_index"])
+    )
+    assert parseTzolkinName("Ymix") == 0  # nosec
+    registerTzolkinAlias("Ymix", 1)
+    registerTzolkinAlias("y-mix", 1)
+    assert parseTzolkinName("ymix") == 1  # nosec
+    assert parseTzolkinNames(["YMIX", "Imix"]).tolist() == [1, 1]  # nosec
+    assert Tzolkin.getNameNumberFromName("Ymix") == 1  # nosec
+    assert Tzolkin(number=3, name_str="Ymix") == Tzolkin(  # nosec
+        number=3, name_str="Imix"
+    )
+
+    monkeypatch.undo()
+    assert parseTzolkinName("Ymix") == 0  # nosec
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "alias, number",
+    [("Ahau", 1), ("Kan", 5), ("Imix", 2), ("ʼʼ", 3), ("", 3), ("Foo", 0), ("Foo", 21)],
+)
+def test_registerTzolkinAliasInvalid(alias: str, number: int) -> None:
+    """Test `registerTzolkinAlias` with invalid and conflicting aliases."""
+    with pytest.raises(TzolkinException):
+        registerTzolkinAlias(alias, number)
+    assert parseTzolkinName("Foo") == 0  # nosec
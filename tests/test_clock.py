@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     test_clock.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Test the clock module."""
+
+from __future__ import annotations
+
+import datetime
+import time
+from unittest import mock
+
+from tzolkin_calendar import TzolkinDate
+from tzolkin_calendar.calculate import lastTzolkin, nextTzolkin
+from tzolkin_calendar.clock import freezeToday, setClock, systemToday, today
+from tzolkin_calendar.tzolkin import Tzolkin
+
+
+################################################################################
+def test_today() -> None:
+    """Test `today` using the system clock."""
+    before = datetime.date.today()
+    result = today()
+    assert before <= result <= datetime.date.today()  # nosec
+    assert systemToday() == result  # nosec
+
+
+################################################################################
+def test_systemTodayMidnight() -> None:
+    """Test the cache of `systemToday` at the day boundary."""
+    midnight = time.mktime(datetime.date(2021, 3, 21).timetuple())
+    with mock.patch.object(time, "time", return_value=midnight - 1.0):
+        assert systemToday() == datetime.date(2021, 3, 20)  # nosec
+        assert systemToday() == datetime.date(2021, 3, 20)  # nosec
+    with mock.patch.object(time, "time", return_value=midnight):
+        assert systemToday() == datetime.date(2021, 3, 21)  # nosec
+    with mock.patch.object(time, "time", return_value=midnight - 1.0):
+        assert systemToday() == datetime.date(2021, 3, 20)  # nosec
+    assert systemToday() == datetime.date.today()  # nosec
+
+
+################################################################################
+def test_freezeToday() -> None:
+    """Test the frozen dates of `freezeToday` and the defaults using them."""
+    date = datetime.date(2021, 3, 20)
+    tzolkin = Tzolkin(number=13, name_str="Ajaw")
+    with freezeToday(date) as frozen:
+        assert frozen == date  # nosec
+        assert today() == date  # nosec
+        assert Tzolkin.fromToday() == Tzolkin(number=12, name_str="Chuwen")  # nosec
+        next_date = nextTzolkin(TzolkinDate(number=13, name=20), date)
+        last_date = lastTzolkin(TzolkinDate(number=13, name=20), date)
+        assert nextTzolkin(TzolkinDate(number=13, name=20)) == next_date  # nosec
+        assert lastTzolkin(TzolkinDate(number=13, name=20)) == last_date  # nosec
+        assert tzolkin.getNextDate() == next_date  # nosec
+        assert tzolkin.getLastDate() == last_date  # nosec
+        assert tzolkin.getNextDateList(list_size=2) == [  # nosec
+            next_date,
+            next_date + datetime.timedelta(days=260),
+        ]
+        assert tzolkin.getLastDateList(list_size=1) == [last_date]  # nosec
+        assert next(tzolkin.iterNextDates()) == next_date  # nosec
+        assert next(tzolkin.iterLastDates()) == last_date  # nosec
+
+        with freezeToday(datetime.date(2000, 1, 1)):
+            assert today() == datetime.date(2000, 1, 1)  # nosec
+        assert today() == date  # nosec
+
+    assert today() == datetime.date.today()  # nosec
+
+
+################################################################################
+def test_setClock() -> None:
+    """Test `setClock`."""
+    dates = iter([datetime.date(2021, 3, 20), datetime.date(2021, 3, 21)])
+    setClock(lambda: next(dates))
+    try:
+        assert today() == datetime.date(2021, 3, 20)  # nosec
+        assert today() == datetime.date(2021, 3, 21)  # nosec
+    finally:
+        setClock()
+    assert today() == datetime.date.today()  # nosec
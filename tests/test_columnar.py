@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     test_columnar.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Test columnar module."""
+
+from __future__ import annotations
+
+import datetime
+import pathlib
+import struct
+from typing import List
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from tzolkin_calendar import TzolkinException
+from tzolkin_calendar.calculate import (
+    REFERENCE_ORDINAL,
+    REFERENCE_TZOLKIN_DAY,
+    getTzolkinDay,
+    gregorian2tzolkin,
+)
+from tzolkin_calendar.columnar import (
+    COLUMNAR_MAGIC,
+    COLUMNAR_VERSION,
+    ColumnarReader,
+    writeDates,
+    writeOrdinals,
+)
+
+
+################################################################################
+@settings(max_examples=100, deadline=None)
+@given(dates=st.lists(st.dates(), max_size=100))
+def test_roundTrip(
+    tmp_path_factory: pytest.TempPathFactory, dates: List[datetime.date]
+) -> None:
+    """Test writing and reading a columnar file."""
+    file_name = str(tmp_path_factory.mktemp("columnar") / "dates.tzc")
+    assert writeDates(file_name, dates) == len(dates)  # nosec
+    good_list = [gregorian2tzolkin(date) for date in dates]
+
+    with ColumnarReader(file_name) as reader:
+        assert len(reader) == len(dates)  # nosec
+        assert reader.getCorrelation() == (  # nosec
+            REFERENCE_ORDINAL,
+            REFERENCE_TZOLKIN_DAY,
+        )
+        assert reader.getOrdinals().tolist() == [  # nosec
+            date.toordinal() for date in dates
+        ]
+        assert reader.getYearDays().tolist() == [  # nosec
+            getTzolkinDay(tzolkin) for tzolkin in good_list
+        ]
+        assert list(reader.getTzolkinArray()) == good_list  # nosec
+        assert list(reader.getTzolkinArray(1, -1)) == good_list[1:-1]  # nosec
+        for idx, date in enumerate(dates):
+            assert reader.getDate(idx) == date  # nosec
+            assert reader.getTzolkinDate(idx) == good_list[idx]  # nosec
+
+
+################################################################################
+def test_slicesAfterClose(tmp_path: pathlib.Path) -> None:
+    """Test that slices can be used after closing the reader."""
+    file_name = str(tmp_path / "dates.tzc")
+    writeOrdinals(file_name, range(730000, 731000))
+    with ColumnarReader(file_name) as reader:
+        tzolkin_array = reader.getTzolkinArray(10, 20)
+        ordinals = reader.getOrdinals(10, 20)
+        assert ordinals.readonly  # nosec
+        with pytest.raises(expected_exception=TypeError):
+            ordinals[0] = 0  # type: ignore
+
+    assert ordinals.tolist() == list(range(730010, 730020))  # nosec
+    assert list(tzolkin_array) == [  # nosec
+        gregorian2tzolkin(datetime.date.fromordinal(ordinal))
+        for ordinal in range(730010, 730020)
+    ]
+    tzolkin_array.append(tzolkin_array[0])
+    assert len(tzolkin_array) == 11  # nosec
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"TZKC",
+        COLUMNAR_MAGIC + bytes(20),
+        b"XXXX" + b"\x01" + bytes(19),
+        struct.pack("<4sHHiHHQ", COLUMNAR_MAGIC, COLUMNAR_VERSION, 0, 0, 0, 0, 1),
+        struct.pack(
+            "<4sHHiHHQiH", COLUMNAR_MAGIC, COLUMNAR_VERSION, 0, 0, 0, 0, 1, 1, 0
+        ),
+        struct.pack(
+            "<4sHHiHHQiH", COLUMNAR_MAGIC, COLUMNAR_VERSION, 0, 0, 0, 0, 1, 1, 261
+        ),
+    ],
+)
+def test_invalidFile(tmp_path: pathlib.Path, content: bytes) -> None:
+    """Test reading files that aren't columnar files."""
+    file_name = tmp_path / "dates.tzc"
+    file_name.write_bytes(content)
+    with pytest.raises(expected_exception=TzolkinException):
+        ColumnarReader(str(file_name))
+
+
+################################################################################
+def test_ordinalOverflow(tmp_path: pathlib.Path) -> None:
+    """Test writing an ordinal that doesn't fit in 32 bits."""
+    with pytest.raises(expected_exception=TzolkinException):
+        writeOrdinals(str(tmp_path / "dates.tzc"), [1, 2**40])
@@ -0,0 +1,284 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     test_convert.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Test convert module."""
+
+from __future__ import annotations
+
+import datetime
+import io
+import pathlib
+from typing import List
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from tzolkin_calendar import USED_DATEFMT, TzolkinDate, TzolkinException
+from tzolkin_calendar.calculate import getTzolkinDay, gregorian2tzolkin
+from tzolkin_calendar.convert import (
+    convertCsv,
+    convertFileParallel,
+    convertFixedWidth,
+    convertLines,
+    parseFixedWidthFile,
+    writeYearDays,
+)
+
+
+################################################################################
+@settings(max_examples=100, deadline=None)
+@given(
+    dates=st.lists(
+        st.dates(
+            min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9999, 12, 31)
+        ),
+        max_size=50,
+    )
+)
+def test_convertLines(dates: List[datetime.date]) -> None:
+    """Test `convertLines` with ISO and 'DD.MM.YYYY' dates."""
+    in_lines = [
+        date.isoformat() if idx % 2 else date.strftime(USED_DATEFMT)
+        for idx, date in enumerate(dates)
+    ]
+    out_file = io.StringIO()
+    err_file = io.StringIO()
+    num_errors = convertLines(
+        io.StringIO("".join(line + "\n" for line in in_lines)), out_file, err_file
+    )
+    assert num_errors == 0  # nosec
+    assert err_file.getvalue() == ""  # nosec
+    assert out_file.getvalue() == "".join(  # nosec
+        "{tzolkin}\n".format(tzolkin=gregorian2tzolkin(date)) for date in dates
+    )
+
+
+################################################################################
+def test_convertLinesErrors() -> None:
+    """Test `convertLines` with lines that can't be converted."""
+    in_file = io.StringIO("23.05.2014\r\n\nfoo\n36.10.2000\n2021-03-20")
+    out_file = io.StringIO()
+    err_file = io.StringIO()
+    num_errors = convertLines(in_file, out_file, err_file)
+    assert num_errors == 2  # nosec
+    assert out_file.getvalue() == "2 Etzʼnabʼ\n\n\n\n12 Chuwen\n"  # nosec
+    assert err_file.getvalue() == (  # nosec
+        'error parsing date "foo" in line 3\n'
+        'error "day is out of range for month" parsing date "36.10.2000" in line 4\n'
+    )
+
+
+################################################################################
+def test_convertCsv() -> None:
+    """Test `convertCsv`."""
+    in_file = io.StringIO('id;date\n1;23.05.2014\n2;"bad"\n3;\n4;2021-03-20\n')
+    out_file = io.StringIO()
+    err_file = io.StringIO()
+    num_errors = convertCsv(in_file, out_file, err_file, column="date", delimiter=";")
+    assert num_errors == 1  # nosec
+    assert out_file.getvalue() == (  # nosec
+        "id;date;tzolkin\n"
+        "1;23.05.2014;2 Etzʼnabʼ\n"
+        "2;bad;\n"
+        "3;;\n"
+        "4;2021-03-20;12 Chuwen\n"
+    )
+    assert err_file.getvalue() == 'error parsing date "bad" in line 3\n'  # nosec
+
+
+################################################################################
+def test_convertCsvNoColumn() -> None:
+    """Test `convertCsv` with a missing column."""
+    err_file = io.StringIO()
+    num_errors = convertCsv(
+        io.StringIO("id,day\n1,23.05.2014\n"), io.StringIO(), err_file, column="date"
+    )
+    assert num_errors == -1  # nosec
+    assert (  # nosec
+        err_file.getvalue() == 'error: column "date" not found in CSV header\n'
+    )
+
+
+################################################################################
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+def test_convertFileParallel(tmp_path: pathlib.Path, chunk_size: int) -> None:
+    """Test that `convertFileParallel` yields the same output as `convertLines`."""
+    in_str = "23.05.2014\r\n\nfoo\n36.10.2000\n" + "".join(
+        "{date}\n".format(date=datetime.date.fromordinal(ordinal).isoformat())
+        for ordinal in range(735000, 735500)
+    )
+    in_str += "2021-03-20"
+    in_path = tmp_path / "dates.txt"
+    in_path.write_bytes(in_str.encode("utf-8"))
+
+    serial_out = io.StringIO()
+    serial_err = io.StringIO()
+    serial_errors = convertLines(
+        io.StringIO(in_str, newline=""), serial_out, serial_err
+    )
+
+    out_file = io.StringIO()
+    err_file = io.StringIO()
+    num_errors = convertFileParallel(
+        str(in_path), out_file, err_file, jobs=3, chunk_size=chunk_size
+    )
+    assert num_errors == serial_errors == 2  # nosec
+    assert out_file.getvalue() == serial_out.getvalue()  # nosec
+    assert err_file.getvalue() == serial_err.getvalue()  # nosec
+
+
+################################################################################
+@pytest.mark.parametrize("chunk_size", [1, 50, 1024 * 1024])
+def test_convertFileParallelCsv(tmp_path: pathlib.Path, chunk_size: int) -> None:
+    """Test that `convertFileParallel` yields the same output as `convertCsv`."""
+    in_str = "id;date\n" + "".join(
+        "{idx};{date}\n".format(
+            idx=idx,
+            date="bad" if idx % 17 == 0 else datetime.date.fromordinal(idx).isoformat(),
+        )
+        for idx in range(735000, 735300)
+    )
+    in_path = tmp_path / "dates.csv"
+    in_path.write_bytes(in_str.encode("utf-8"))
+
+    serial_out = io.StringIO()
+    serial_err = io.StringIO()
+    serial_errors = convertCsv(
+        io.StringIO(in_str, newline=""),
+        serial_out,
+        serial_err,
+        column="date",
+        delimiter=";",
+    )
+
+    out_file = io.StringIO()
+    err_file = io.StringIO()
+    num_errors = convertFileParallel(
+        str(in_path),
+        out_file,
+        err_file,
+        jobs=2,
+        column="date",
+        delimiter=";",
+        chunk_size=chunk_size,
+    )
+    assert num_errors == serial_errors > 0  # nosec
+    assert out_file.getvalue() == serial_out.getvalue()  # nosec
+    assert err_file.getvalue() == serial_err.getvalue()  # nosec
+
+
+################################################################################
+def test_convertFileParallelNoColumn(tmp_path: pathlib.Path) -> None:
+    """Test `convertFileParallel` with a missing CSV column."""
+    in_path = tmp_path / "dates.csv"
+    in_path.write_text("id,day\n1,23.05.2014\n", encoding="utf-8")
+    err_file = io.StringIO()
+    num_errors = convertFileParallel(
+        str(in_path), io.StringIO(), err_file, jobs=2, column="date"
+    )
+    assert num_errors == -1  # nosec
+    assert (  # nosec
+        err_file.getvalue() == 'error: column "date" not found in CSV header\n'
+    )
+
+
+################################################################################
+@settings(max_examples=100, deadline=None)
+@given(
+    dates=st.lists(
+        st.dates(
+            min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9999, 12, 31)
+        ),
+        max_size=50,
+    ),
+    newline=st.sampled_from(["\n", "\r\n"]),
+    last_newline=st.booleans(),
+)
+def test_parseFixedWidthFile(
+    tmp_path_factory: pytest.TempPathFactory,
+    dates: List[datetime.date],
+    newline: str,
+    last_newline: bool,
+) -> None:
+    """Test `parseFixedWidthFile` with ISO and 'DD.MM.YYYY' dates."""
+    in_str = newline.join(
+        date.isoformat() if idx % 2 else date.strftime(USED_DATEFMT)
+        for idx, date in enumerate(dates)
+    )
+    if last_newline and dates:
+        in_str += newline
+    in_path = tmp_path_factory.mktemp("fixed") / "dates.txt"
+    in_path.write_bytes(in_str.encode("ascii"))
+
+    year_days = parseFixedWidthFile(str(in_path))
+    assert year_days.typecode == "H"  # nosec
+    assert list(year_days) == [  # nosec
+        getTzolkinDay(gregorian2tzolkin(date)) for date in dates
+    ]
+
+
+################################################################################
+def test_convertFixedWidth(tmp_path: pathlib.Path) -> None:
+    """Test `convertFixedWidth` with invalid dates."""
+    in_path = tmp_path / "dates.txt"
+    in_path.write_bytes(
+        b"23.05.2014\n36.10.2000\n2021-02-29\n2020-02-29\nfoo-bar-ba\n"
+        b"2021-13-01\n0000-01-01\n2021-03-20"
+    )
+    out_file = io.StringIO()
+    err_file = io.StringIO()
+    num_errors = convertFixedWidth(str(in_path), out_file, err_file)
+    assert num_errors == 5  # nosec
+    assert out_file.getvalue() == "{first}\n\n\n{leap}\n\n\n\n{last}\n".format(  # nosec
+        first=gregorian2tzolkin(datetime.date(2014, 5, 23)),
+        leap=gregorian2tzolkin(datetime.date(2020, 2, 29)),
+        last=gregorian2tzolkin(datetime.date(2021, 3, 20)),
+    )
+    assert err_file.getvalue() == (  # nosec
+        'error parsing date "36.10.2000" in line 2\n'
+        'error parsing date "2021-02-29" in line 3\n'
+        'error parsing date "foo-bar-ba" in line 5\n'
+        'error parsing date "2021-13-01" in line 6\n'
+        'error parsing date "0000-01-01" in line 7\n'
+    )
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "content",
+    [b"23.5.2014\n", b"23.05.2014\n2021-3-20\n", b"23.05.2014\n21-03-20"],
+)
+def test_parseFixedWidthFileErrors(tmp_path: pathlib.Path, content: bytes) -> None:
+    """Test `parseFixedWidthFile` with lines of different width."""
+    in_path = tmp_path / "dates.txt"
+    in_path.write_bytes(content)
+    with pytest.raises(expected_exception=TzolkinException):
+        parseFixedWidthFile(str(in_path))
+
+
+################################################################################
+@settings(max_examples=50, deadline=None)
+@given(year_days=st.lists(st.integers(min_value=0, max_value=260), max_size=100))
+def test_writeYearDays(year_days: List[int]) -> None:
+    """Test `writeYearDays` against the strings of the Tzolkin dates."""
+    out_file = io.BytesIO()
+    assert writeYearDays(year_days, out_file) == len(year_days)  # nosec
+    assert out_file.getvalue().decode("utf-8") == "".join(  # nosec
+        "{tzolkin}\n".format(tzolkin=TzolkinDate.fromYearDay(day) if day else "")
+        for day in year_days
+    )
+
+
+################################################################################
+@pytest.mark.parametrize("year_days", [[1, 261], [-1], [1, None]])
+def test_writeYearDaysInvalid(year_days: List[int]) -> None:
+    """Test `writeYearDays` with invalid days in the Tzolkin year."""
+    out_file = io.BytesIO()
+    with pytest.raises(expected_exception=TzolkinException):
+        writeYearDays(year_days, out_file)
+    assert out_file.getvalue() == b""  # nosec
@@ -9,14 +9,25 @@
 
 from __future__ import annotations
 
+import contextlib
+import datetime
+import io
+import json
+import pathlib
 import runpy
+import subprocess  # nosec
 import sys
 from typing import List
 from unittest import mock
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
+import tzolkin_calendar.main
 from tzolkin_calendar import TzolkinDate
+from tzolkin_calendar.clock import freezeToday
+from tzolkin_calendar.tzolkin import Tzolkin
 
 # Using https://maya.nmai.si.edu/calendar/maya-calendar-converter
 local_reference_dates = {
@@ -178,6 +189,76 @@ def test_gregorian2tzolkin(
     )
 
 
+################################################################################
+def test_defaultToday(capsys: pytest.CaptureFixture) -> None:
+    """Test the conversion of the default date, today."""
+    with freezeToday(datetime.date(2021, 3, 20)):
+        with pytest.raises(expected_exception=SystemExit) as excp:
+            runTzolkinCalendar([])
+
+    assert excp.value.args[0] == 0  # nosec
+    captured = capsys.readouterr()
+    assert captured.err == ""  # nosec
+    assert (  # nosec
+        captured.out == 'Gregorian "20.03.2021" is "12 Chuwen" as Tzolk’in\n'
+    )
+
+
+################################################################################
+@settings(max_examples=50, deadline=None)
+@given(
+    date=st.dates(
+        min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9999, 12, 31)
+    ),
+    fmt=st.sampled_from(["%d.%m.%Y", "%Y-%m-%d"]),
+)
+def test_fastPath(date: datetime.date, fmt: str) -> None:
+    """Test the fast path of single dates against `Tzolkin.fromDate`."""
+    date_str = date.strftime(fmt)
+    out_file = io.StringIO()
+    with contextlib.redirect_stdout(out_file):
+        with pytest.raises(expected_exception=SystemExit) as excp:
+            runTzolkinCalendar([date_str])
+
+    assert excp.value.args[0] == 0  # nosec
+    assert out_file.getvalue() == (  # nosec
+        'Gregorian "{gregorian}" is "{tzolkin}" as Tzolk’in\n'.format(
+            gregorian=date_str, tzolkin=Tzolkin.fromDate(date)
+        )
+    )
+
+
+################################################################################
+@pytest.mark.parametrize("cmd_line_args", [[], ["20.03.2021"], ["2021-03-20"]])
+def test_importTime(cmd_line_args: List[str]) -> None:
+    """Test the import time of the fast path of the command line client, measured
+    using `-X importtime`. The budget is generous, to not fail on slow machines, but
+    catches imports of the command line parser and the converters.
+    """
+    result = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-m", "tzolkin_calendar"] + cmd_line_args,
+        cwd=pathlib.Path(__file__).parent.parent,
+        capture_output=True,
+        encoding="utf-8",
+        check=True,
+    )
+    imported = set()
+    package_time = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            imported.add(name.strip())
+            if name.startswith(" tzolkin_calendar"):
+                package_time += int(cumulative)
+
+    assert result.stdout.startswith("Gregorian ")  # nosec
+    for module in ["argparse", "tzolkin_calendar.convert", "tzolkin_calendar.tzolkin"]:
+        assert module not in imported  # nosec
+    assert 0 < package_time < 250000  # nosec
+
+
 ################################################################################
 def test_invalidDate(capsys: pytest.CaptureFixture) -> None:
     """Test  with an invalid gregorian date."""
@@ -474,3 +555,389 @@ def test_invalidTzolkinDateName(capsys: pytest.CaptureFixture) -> None:
     assert (  # nosec
         captured.out.find("usage: python -m tzolkin_calendar [-h] [--version]") == 0
     )
+
+
+################################################################################
+def test_convert(capsys: pytest.CaptureFixture, tmp_path: pathlib.Path) -> None:
+    """Test the subcommand `convert`."""
+    in_file = tmp_path / "dates.txt"
+    in_file.write_text("01.01.1800\n2021-03-20\nfoo\n", encoding="utf-8")
+    with pytest.raises(expected_exception=SystemExit) as excp:
+        runTzolkinCalendar(["convert", str(in_file)])
+
+    assert excp.value.args[0] == 2  # nosec
+    captured = capsys.readouterr()
+    assert captured.out == "{first}\n{second}\n\n".format(  # nosec
+        first=local_reference_dates["01.01.1800"],
+        second=local_reference_dates["20.03.2021"],
+    )
+    assert captured.err == 'error parsing date "foo" in line 3\n'  # nosec
+
+
+################################################################################
+def test_convertCsv(capsys: pytest.CaptureFixture, tmp_path: pathlib.Path) -> None:
+    """Test the subcommand `convert` with a CSV file."""
+    in_file = tmp_path / "dates.csv"
+    out_file = tmp_path / "tzolkin.csv"
+    in_file.write_text("id,date\n1,01.01.1800\n", encoding="utf-8")
+    with pytest.raises(expected_exception=SystemExit) as excp:
+        runTzolkinCalendar(
+            ["convert", "--column", "date", "--output", str(out_file), str(in_file)]
+        )
+
+    assert excp.value.args[0] == 0  # nosec
+    captured = capsys.readouterr()
+    assert captured.out == ""  # nosec
+    assert captured.err == ""  # nosec
+    assert out_file.read_text(  # nosec
+        encoding="utf-8"
+    ) == "id,date,tzolkin\n1,01.01.1800,{tzolkin}\n".format(
+        tzolkin=local_reference_dates["01.01.1800"]
+    )
+
+
+################################################################################
+def test_convertJobs(capsys: pytest.CaptureFixture, tmp_path: pathlib.Path) -> None:
+    """Test the subcommand `convert` using more than one process."""
+    in_file = tmp_path / "dates.txt"
+    in_file.write_text("01.01.1800\n2021-03-20\nfoo\n", encoding="utf-8")
+    with pytest.raises(expected_exception=SystemExit) as excp:
+        runTzolkinCalendar(["convert", "--jobs", "2", str(in_file)])
+
+    assert excp.value.args[0] == 2  # nosec
+    captured = capsys.readouterr()
+    assert captured.out == "{first}\n{second}\n\n".format(  # nosec
+        first=local_reference_dates["01.01.1800"],
+        second=local_reference_dates["20.03.2021"],
+    )
+    assert captured.err == 'error parsing date "foo" in line 3\n'  # nosec
+
+
+################################################################################
+def test_convertFixedWidth(
+    capsys: pytest.CaptureFixture, tmp_path: pathlib.Path
+) -> None:
+    """Test the subcommand `convert` with a file of fixed width dates."""
+    in_file = tmp_path / "dates.txt"
+    in_file.write_text("01.01.1800\r\n2021-03-20\r\n", encoding="utf-8")
+    with pytest.raises(expected_exception=SystemExit) as excp:
+        runTzolkinCalendar(["convert", "--fixed-width", str(in_file)])
+
+    assert excp.value.args[0] == 0  # nosec
+    captured = capsys.readouterr()
+    assert captured.out == "{first}\n{second}\n".format(  # nosec
+        first=local_reference_dates["01.01.1800"],
+        second=local_reference_dates["20.03.2021"],
+    )
+    assert captured.err == ""  # nosec
+
+    in_file.write_text("01.01.1800\n20.3.2021\n", encoding="utf-8")
+    with pytest.raises(expected_exception=SystemExit) as excp:
+        runTzolkinCalendar(["convert", "--fixed-width", str(in_file)])
+
+    assert excp.value.args[0] == 2  # nosec
+    assert capsys.readouterr().err.startswith("error: ")  # nosec
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "cmd_line_args,exit_code,out_start",
+    [
+        (["20.03.2021"], 0, 'Gregorian "20.03.2021" is "12 Chuwen" as Tzolk’in'),
+        (["2021", "03", "20"], 0, 'Gregorian "2021 03 20" is "12 Chuwen"'),
+        (["12 Chuwen"], 0, 'Tzolk’in date "12 Chuwen" next date is'),
+        (["--list", "2", "12 Chuwen"], 0, 'Tzolk’in date "12 Chuwen"\n next dates'),
+        (["--version"], 0, "tzolkin-calendar "),
+        (["--help"], 0, "usage: python -m tzolkin_calendar [-h] [--version]"),
+        (["1 HUGO"], 2, "usage: python -m tzolkin_calendar [-h] [--version]"),
+        (["15 8"], 2, "usage: python -m tzolkin_calendar [-h] [--version]"),
+        (["-x"], 2, ""),
+    ],
+)
+def test_mainInProcess(
+    capsys: pytest.CaptureFixture,
+    cmd_line_args: List[str],
+    exit_code: int,
+    out_start: str,
+) -> None:
+    """Test calling `main` in-process, the output goes to the given file."""
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(cmd_line_args, stdout=out_file) == exit_code
+    )
+    assert out_file.getvalue().startswith(out_start)  # nosec
+    captured = capsys.readouterr()
+    assert captured.out == ""  # nosec
+    assert (captured.err == "") == (exit_code == 0)  # nosec
+
+
+################################################################################
+def test_mainInProcessRepeated() -> None:
+    """Test calling `main` in-process many times, with the default date of today."""
+    out_file = io.StringIO()
+    with freezeToday(datetime.date(2021, 3, 20)):
+        for _ in range(1000):
+            assert tzolkin_calendar.main.main([], stdout=out_file) == 0  # nosec
+            assert tzolkin_calendar.main.main(["--year"], stdout=out_file) == 0  # nosec
+
+    assert out_file.getvalue().count('is "12 Chuwen"') == 2000  # nosec
+    assert out_file.getvalue().count("13 Ajaw\n") == 1000  # nosec
+
+
+################################################################################
+def test_mainInProcessConvert(tmp_path: pathlib.Path) -> None:
+    """Test calling the subcommand `convert` in-process, writing to the given file."""
+    in_file = tmp_path / "dates.txt"
+    in_file.write_text("01.01.1800\n2021-03-20\n", encoding="utf-8")
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(["convert", str(in_file)], stdout=out_file) == 0
+    )
+    assert out_file.getvalue() == "{first}\n{second}\n".format(  # nosec
+        first=local_reference_dates["01.01.1800"],
+        second=local_reference_dates["20.03.2021"],
+    )
+
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(
+            ["convert", "--jobs", "0", str(in_file)], stdout=out_file
+        )
+        == 2
+    )
+    assert out_file.getvalue() == ""  # nosec
+
+
+################################################################################
+def test_batch(capsys: pytest.CaptureFixture) -> None:
+    """Test the batch mode, each argument and line of stdin is a query of its own."""
+    in_file = io.StringIO("01.01.1800\n\nfoo\n36.10.2000\n15 8\n")
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(
+            ["--batch", "--start", "20.03.2021", "20.03.2021", "-", "12 Chuwen"],
+            stdout=out_file,
+            stdin=in_file,
+        )
+        == 2
+    )
+    assert out_file.getvalue().split("\n") == [  # nosec
+        'Gregorian "20.03.2021" is "12 Chuwen" as Tzolk’in',
+        'Gregorian "01.01.1800" is "{tzolkin}" as Tzolk’in'.format(
+            tzolkin=local_reference_dates["01.01.1800"]
+        ),
+        "",
+        "",
+        "",
+        "",
+        'Tzolk’in date "12 Chuwen" next date is "05.12.2021", last date has been "03.07.2020"',
+        "",
+    ]
+    captured = capsys.readouterr()
+    assert captured.out == ""  # nosec
+    errors = captured.err.splitlines()
+    assert len(errors) == 3  # nosec
+    assert errors[0] == 'error parsing date "foo" in line 4'  # nosec
+    assert errors[1].endswith('parsing date "36.10.2000" in line 5')  # nosec
+    assert errors[2].startswith('error "number 15 is not a valid Tzolkin')  # nosec
+    assert errors[2].endswith('parsing date "15 8" in line 6')  # nosec
+
+
+################################################################################
+def test_batchList(capsys: pytest.CaptureFixture) -> None:
+    """Test the batch mode with a list and the queries read from stdin."""
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(
+            ["--batch", "-l", "2", "-s", "20.03.2021"],
+            stdout=out_file,
+            stdin=io.StringIO("12 Chuwen\n2021-03-20\n"),
+        )
+        == 0
+    )
+    assert out_file.getvalue() == (  # nosec
+        'Tzolk’in date "12 Chuwen", next dates are '
+        "['05.12.2021', '22.08.2022'], last dates have been "
+        "['03.07.2020', '17.10.2019']\n"
+        'Gregorian "2021-03-20" is "12 Chuwen" as Tzolk’in\n'
+    )
+    assert capsys.readouterr().err == ""  # nosec
+
+    assert (  # nosec
+        tzolkin_calendar.main.main(
+            ["--batch", "-s", "foo", "12 Chuwen"], stdout=io.StringIO()
+        )
+        == 2
+    )
+    assert capsys.readouterr().err.endswith(  # nosec
+        'error: invalid start date "foo"\n'
+    )
+
+
+################################################################################
+@pytest.mark.parametrize("fmt", ["json", "ndjson", "csv"])
+def test_format(capsys: pytest.CaptureFixture, fmt: str) -> None:
+    """Test the machine-readable output formats of the command line."""
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(
+            ["--format", fmt, "-s", "2021-03-20", "-l", "2", "12 Chuwen"],
+            stdout=out_file,
+        )
+        == 0
+    )
+    output = out_file.getvalue()
+    if fmt == "csv":
+        assert output.splitlines()[1:] == [  # nosec
+            "next,12 Chuwen,2021-12-05,12 Chuwen,51,12,Chuwen,",
+            "next,12 Chuwen,2022-08-22,12 Chuwen,51,12,Chuwen,",
+            "last,12 Chuwen,2020-07-03,12 Chuwen,51,12,Chuwen,",
+            "last,12 Chuwen,2019-10-17,12 Chuwen,51,12,Chuwen,",
+        ]
+    else:
+        record = json.loads(output)[0] if fmt == "json" else json.loads(output)
+        assert record["next"] == ["2021-12-05", "2022-08-22"]  # nosec
+        assert record["last"] == ["2020-07-03", "2019-10-17"]  # nosec
+
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(["--format", fmt, "1 HUGO"], stdout=out_file) == 2
+    )
+    assert "usage:" not in out_file.getvalue()  # nosec
+    assert "error" in out_file.getvalue()  # nosec
+    assert "1 HUGO" in out_file.getvalue()  # nosec
+    assert capsys.readouterr().err == 'Error parsing date "1 HUGO"\n'  # nosec
+
+
+################################################################################
+def test_formatBatch(capsys: pytest.CaptureFixture) -> None:
+    """Test the batch mode with the year and the JSON format."""
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(
+            ["--batch", "--year", "--format", "json", "20.03.2021", "", "foo"],
+            stdout=out_file,
+        )
+        == 2
+    )
+    records = json.loads(out_file.getvalue())
+    assert len(records) == 262  # nosec
+    assert [a["type"] for a in records[258:]] == [  # nosec
+        "year",
+        "year",
+        "gregorian",
+        "error",
+    ]
+    assert records[260]["date"] == "2021-03-20"  # nosec
+    assert records[261]["query"] == "foo"  # nosec
+    assert capsys.readouterr().err == 'error parsing date "foo" in line 3\n'  # nosec
+
+
+################################################################################
+@pytest.mark.parametrize("fmt", ["text", "json", "ndjson", "csv"])
+@pytest.mark.parametrize(
+    "cmd_line_args",
+    [
+        ["-s", "30.12.9999", "8 Chuwen"],
+        ["-s", "01.06.9999", "-l", "3", "8 Chuwen"],
+        ["-s", "02.01.0001", "12 Chuwen"],
+    ],
+)
+def test_formatOutOfRange(
+    capsys: pytest.CaptureFixture, fmt: str, cmd_line_args: List[str]
+) -> None:
+    """Test Tzolkin dates with next or last dates outside of the range of dates."""
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(["--format", fmt] + cmd_line_args, stdout=out_file)
+        == 2
+    )
+    assert "next date" not in out_file.getvalue()  # nosec
+    assert "not all" in capsys.readouterr().err  # nosec
+    if fmt in ("json", "ndjson"):
+        record = json.loads(out_file.getvalue())
+        record = record[0] if fmt == "json" else record
+        assert record["type"] == "error"  # nosec
+        assert "next" not in record  # nosec
+    elif fmt == "csv":
+        assert out_file.getvalue().splitlines()[1].startswith("error,")  # nosec
+
+
+################################################################################
+@pytest.mark.parametrize("fmt", ["text", "ndjson"])
+def test_batchOutOfRange(capsys: pytest.CaptureFixture, fmt: str) -> None:
+    """Test the batch mode with dates outside of the range of dates, the queries
+    after them are answered.
+    """
+    out_file = io.StringIO()
+    assert (  # nosec
+        tzolkin_calendar.main.main(
+            ["--batch", "--format", fmt, "-s", "30.12.9999", "8 Chuwen", "20.03.2021"],
+            stdout=out_file,
+        )
+        == 2
+    )
+    lines = out_file.getvalue().splitlines()
+    assert len(lines) == 2  # nosec
+    if fmt == "text":
+        assert lines[0] == ""  # nosec
+        assert lines[1] == 'Gregorian "20.03.2021" is "12 Chuwen" as Tzolk’in'  # nosec
+    else:
+        assert json.loads(lines[0])["type"] == "error"  # nosec
+        assert json.loads(lines[1])["tzolkin"] == "12 Chuwen"  # nosec
+    assert capsys.readouterr().err.endswith(  # nosec
+        'parsing date "8 Chuwen" in line 1\n'
+    )
+
+    with mock.patch(
+        "tzolkin_calendar.main.parseGregorian",
+        side_effect=OverflowError("date value out of range"),
+    ):
+        assert (  # nosec
+            tzolkin_calendar.main.main(
+                ["--batch", "--format", fmt, "20.03.2021"], stdout=io.StringIO()
+            )
+            == 2
+        )
+    assert capsys.readouterr().err == (  # nosec
+        'error "date value out of range" parsing date "20.03.2021" in line 1\n'
+    )
+
+
+################################################################################
+class __NotStdout(io.StringIO):
+    """A file that fails if it is written to as `sys.stdout`."""
+
+    ############################################################################
+    def write(self, text: str) -> int:
+        """Write `text`, fail if this file has replaced `sys.stdout`.
+
+        Args:
+            text (str): The text to write.
+
+        Returns:
+            int: The number of written characters.
+        """
+        assert sys.stdout is not self  # nosec
+        return super().write(text)
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "cmd_line_args,out_start",
+    [
+        (["--help"], "usage: python -m tzolkin_calendar [-h] [--version]"),
+        (["--version"], "tzolkin-calendar "),
+        (["convert", "--help"], "usage: python -m tzolkin_calendar convert"),
+    ],
+)
+def test_mainInProcessNoRedirect(
+    capsys: pytest.CaptureFixture, cmd_line_args: List[str], out_start: str
+) -> None:
+    """Test that the help text and the version are printed to the given file
+    without replacing `sys.stdout` of the process.
+    """
+    out_file = __NotStdout()
+    assert tzolkin_calendar.main.main(cmd_line_args, stdout=out_file) == 0  # nosec
+    assert out_file.getvalue().startswith(out_start)  # nosec
+    assert capsys.readouterr().out == ""  # nosec
@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     test_output.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Test the output module."""
+
+from __future__ import annotations
+
+import csv
+import datetime
+import io
+import itertools
+import json
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from tzolkin_calendar import USED_DATEFMT, TzolkinException
+from tzolkin_calendar.calculate import makeLabelTable
+from tzolkin_calendar.output import (
+    CSV_COLUMNS,
+    OUTPUT_FORMATS,
+    JsonWriter,
+    ResultWriter,
+    TextWriter,
+    makeResultWriter,
+)
+from tzolkin_calendar.tzolkin import Tzolkin
+
+
+################################################################################
+def __writeAll(fmt: str, start_date: datetime.date, list_size: int) -> str:
+    """Write a record of each type using the writer of the format `fmt`.
+
+    Args:
+        fmt (str): The output format.
+        start_date (datetime.date): The start date of the search.
+        list_size (int): The number of next and last dates.
+
+    Returns:
+        str: The written output.
+    """
+    out_file = io.StringIO()
+    writer = makeResultWriter(fmt, out_file)
+    tzolkin = Tzolkin.fromDate(start_date)
+    writer.writeGregorian(
+        start_date.strftime(USED_DATEFMT), start_date, tzolkin.getTzolkinYearDay()
+    )
+    writer.writeTzolkin(
+        str(tzolkin),
+        tzolkin.getTzolkinYearDay(),
+        start_date,
+        itertools.islice(tzolkin.iterNextDates(start_date), list_size),
+        itertools.islice(tzolkin.iterLastDates(start_date), list_size),
+        as_list=True,
+    )
+    writer.writeYear()
+    writer.writeError("foo", 'error parsing date "foo"')
+    writer.close()
+
+    return out_file.getvalue()
+
+
+################################################################################
+def test_makeResultWriter() -> None:
+    """Test `makeResultWriter`."""
+    for fmt in OUTPUT_FORMATS:
+        writer = makeResultWriter(fmt, io.StringIO())
+        assert writer.machine_readable == (fmt != "text")  # nosec
+
+    with pytest.raises(expected_exception=TzolkinException):
+        makeResultWriter("xml", io.StringIO())
+
+
+################################################################################
+def test_resultWriterAbstract() -> None:
+    """Test that the base class of the writers can't be instantiated."""
+    with pytest.raises(expected_exception=TypeError):
+        ResultWriter(io.StringIO())  # type: ignore[abstract]
+
+
+################################################################################
+def test_textNoDates() -> None:
+    """Test the text format with empty iterators of the next and last dates."""
+    start_date = datetime.date(9999, 12, 30)
+    for batch in (False, True):
+        out_file = io.StringIO()
+        TextWriter(out_file, batch=batch).writeTzolkin(
+            "8 Chuwen",
+            Tzolkin.fromDate(start_date).getTzolkinYearDay(),
+            start_date,
+            iter([]),
+            iter([start_date]),
+            as_list=False,
+        )
+        assert out_file.getvalue() == "\n"  # nosec
+
+
+################################################################################
+@given(
+    start_date=st.dates(
+        min_value=datetime.date(100, 1, 1), max_value=datetime.date(9000, 12, 31)
+    ),
+    list_size=st.integers(min_value=0, max_value=20),
+)
+def test_textList(start_date: datetime.date, list_size: int) -> None:
+    """Test the list of the text format against the `repr` of the date lists."""
+    tzolkin = Tzolkin.fromDate(start_date)
+    next_dates = tzolkin.getNextDateList(start_date, list_size)
+    last_dates = tzolkin.getLastDateList(start_date, list_size)
+    for batch, separator in ((False, "\n "), (True, ", ")):
+        out_file = io.StringIO()
+        TextWriter(out_file, batch=batch).writeTzolkin(
+            "query",
+            tzolkin.getTzolkinYearDay(),
+            start_date,
+            iter(next_dates),
+            iter(last_dates),
+            as_list=True,
+        )
+        assert out_file.getvalue() == (  # nosec
+            'Tzolk’in date "{tzolk}"{sep}next dates are {next}{sep}last dates have been {last}\n'.format(
+                tzolk=tzolkin,
+                sep=separator,
+                next=[a.strftime(USED_DATEFMT) for a in next_dates],
+                last=[a.strftime(USED_DATEFMT) for a in last_dates],
+            )
+        )
+
+
+################################################################################
+@pytest.mark.parametrize("lines", [False, True])
+@given(
+    start_date=st.dates(
+        min_value=datetime.date(100, 1, 1), max_value=datetime.date(9000, 12, 31)
+    ),
+    list_size=st.integers(min_value=0, max_value=5),
+)
+def test_json(lines: bool, start_date: datetime.date, list_size: int) -> None:
+    """Test the JSON and NDJSON formats."""
+    output = __writeAll("ndjson" if lines else "json", start_date, list_size)
+    if lines:
+        records = [json.loads(line) for line in output.splitlines()]
+    else:
+        records = json.loads(output)
+
+    tzolkin = Tzolkin.fromDate(start_date)
+    assert len(records) == 263  # nosec
+    assert records[0] == {  # nosec
+        "type": "gregorian",
+        "query": start_date.strftime(USED_DATEFMT),
+        "date": start_date.isoformat(),
+        "tzolkin": str(tzolkin),
+        "year_day": tzolkin.getTzolkinYearDay(),
+        "number": tzolkin.getDayNumber(),
+        "name": tzolkin.getDayName(),
+    }
+    assert records[1]["type"] == "tzolkin"  # nosec
+    assert records[1]["start"] == start_date.isoformat()  # nosec
+    assert records[1]["next"] == [  # nosec
+        a.isoformat() for a in tzolkin.getNextDateList(start_date, list_size)
+    ]
+    assert records[1]["last"] == [  # nosec
+        a.isoformat() for a in tzolkin.getLastDateList(start_date, list_size)
+    ]
+    assert [a["tzolkin"] for a in records[2:-1]] == list(makeLabelTable()[1:])  # nosec
+    assert records[-1] == {  # nosec
+        "type": "error",
+        "query": "foo",
+        "error": 'error parsing date "foo"',
+    }
+
+
+################################################################################
+def test_jsonEmpty() -> None:
+    """Test the JSON and NDJSON formats without records."""
+    for lines, expected in ((False, []), (True, None)):
+        out_file = io.StringIO()
+        writer = JsonWriter(out_file, lines=lines)
+        writer.writeEmpty()
+        writer.close()
+        if expected is None:
+            assert out_file.getvalue() == ""  # nosec
+        else:
+            assert json.loads(out_file.getvalue()) == expected  # nosec
+
+
+################################################################################
+def test_csv() -> None:
+    """Test the CSV format."""
+    start_date = datetime.date(2021, 3, 20)
+    rows = list(csv.DictReader(io.StringIO(__writeAll("csv", start_date, 2))))
+
+    assert list(rows[0].keys()) == list(CSV_COLUMNS)  # nosec
+    assert rows[0] == {  # nosec
+        "type": "gregorian",
+        "query": "20.03.2021",
+        "date": "2021-03-20",
+        "tzolkin": "12 Chuwen",
+        "year_day": "51",
+        "number": "12",
+        "name": "Chuwen",
+        "error": "",
+    }
+    assert [(a["type"], a["date"]) for a in rows[1:5]] == [  # nosec
+        ("next", "2021-12-05"),
+        ("next", "2022-08-22"),
+        ("last", "2020-07-03"),
+        ("last", "2019-10-17"),
+    ]
+    assert [a["tzolkin"] for a in rows[5:-1]] == list(makeLabelTable()[1:])  # nosec
+    assert rows[-1]["type"] == "error"  # nosec
+    assert rows[-1]["tzolkin"] == ""  # nosec
+    assert rows[-1]["error"] == 'error parsing date "foo"'  # nosec
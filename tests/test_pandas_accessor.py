@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     test_pandas_accessor.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Test pandas_accessor module."""
+
+from __future__ import annotations
+
+import datetime
+from typing import List
+from unittest import mock
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from tzolkin_calendar import TzolkinDate, TzolkinException
+from tzolkin_calendar.calculate import (
+    getTzolkinDay,
+    gregorian2tzolkin,
+    lastTzolkin,
+    nextTzolkin,
+)
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("tzolkin_calendar.pandas_accessor")
+
+
+################################################################################
+@settings(max_examples=100, deadline=None)
+@given(
+    dates=st.lists(
+        st.dates(
+            min_value=datetime.date(1700, 1, 1), max_value=datetime.date(2200, 12, 31)
+        ),
+        max_size=50,
+    )
+)
+def test_accessor(dates: List[datetime.date]) -> None:
+    """Test the attributes of the accessor against `calculate.gregorian2tzolkin`."""
+    series = pd.Series(pd.to_datetime(dates), dtype="datetime64[ns]")
+    good_list = [gregorian2tzolkin(date) for date in dates]
+    assert series.tzolkin.number.tolist() == [  # nosec
+        tzolkin.number for tzolkin in good_list
+    ]
+    assert series.tzolkin.name_number.tolist() == [  # nosec
+        tzolkin.name for tzolkin in good_list
+    ]
+    assert series.tzolkin.year_day.tolist() == [  # nosec
+        getTzolkinDay(tzolkin) for tzolkin in good_list
+    ]
+    assert series.tzolkin.label.tolist() == [  # nosec
+        tzolkin.__repr__() for tzolkin in good_list
+    ]
+    assert series.tzolkin.name.tolist() == [  # nosec
+        tzolkin.__repr__().split(" ")[1] for tzolkin in good_list
+    ]
+
+
+################################################################################
+@settings(max_examples=100, deadline=None)
+@given(
+    dates=st.lists(
+        st.dates(
+            min_value=datetime.date(1700, 1, 1), max_value=datetime.date(2200, 12, 31)
+        ),
+        max_size=50,
+    ),
+    year_day=st.integers(min_value=1, max_value=260),
+)
+def test_nextLast(dates: List[datetime.date], year_day: int) -> None:
+    """Test `next` and `last` against `calculate.nextTzolkin` and `lastTzolkin`."""
+    series = pd.Series(pd.to_datetime(dates), dtype="datetime64[ns]")
+    tzolkin = TzolkinDate(number=(year_day - 1) % 13 + 1, name=(year_day - 1) % 20 + 1)
+    assert [  # nosec
+        timestamp.date() for timestamp in series.tzolkin.next(tzolkin)
+    ] == [nextTzolkin(tzolkin, date) for date in dates]
+    assert [  # nosec
+        timestamp.date() for timestamp in series.tzolkin.last(year_day)
+    ] == [lastTzolkin(tzolkin, date) for date in dates]
+
+
+################################################################################
+def test_missingValues() -> None:
+    """Test Series with missing values and time zones."""
+    series = pd.Series(
+        pd.to_datetime(["2014-05-23 23:30", None]).tz_localize("Europe/Vienna"),
+        index=["a", "b"],
+        name="date",
+    )
+    assert series.tzolkin.number.tolist() == [2, pd.NA]  # nosec
+    assert series.tzolkin.number.index.tolist() == ["a", "b"]  # nosec
+    assert series.tzolkin.number.name == "date"  # nosec
+    assert series.tzolkin.label.isna().tolist() == [False, True]  # nosec
+    assert series.tzolkin.label.cat.categories.size == 260  # nosec
+    assert series.tzolkin.name.cat.categories.size == 20  # nosec
+    assert series.tzolkin.next(pd.Series([260, 260])).isna().tolist() == [  # nosec
+        False,
+        True,
+    ]
+
+
+################################################################################
+def test_invalid() -> None:
+    """Test the accessor on non-datetime Series and invalid targets."""
+    with pytest.raises(AttributeError):
+        pd.Series([1, 2]).tzolkin  # pylint: disable=pointless-statement
+    with pytest.raises(TzolkinException):
+        pd.Series(pd.to_datetime(["2014-05-23"])).tzolkin.next(261)
+
+
+################################################################################
+def test_lazyYearDays() -> None:
+    """Test that the days in the Tzolkin year are calculated on first use only."""
+    from tzolkin_calendar import vectorized
+
+    series = pd.Series(pd.to_datetime(["2014-05-23", "2021-03-20"]))
+    with mock.patch.object(
+        vectorized,
+        "gregorian2TzolkinDay",
+        wraps=vectorized.gregorian2TzolkinDay,
+    ) as convert:
+        accessor = series.tzolkin
+        assert convert.call_count == 0  # nosec
+        accessor.next(TzolkinDate(number=13, name=20))
+        assert convert.call_count == 0  # nosec
+        assert accessor.number.tolist() == [2, 12]  # nosec
+        assert accessor.name.tolist() == ["Etzʼnabʼ", "Chuwen"]  # nosec
+        assert accessor.year_day.tolist() == [158, 51]  # nosec
+        assert convert.call_count == 1  # nosec
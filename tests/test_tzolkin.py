@@ -9,7 +9,10 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
+import itertools
+import pickle  # nosec
 
 import pytest
 from hypothesis import given, settings
@@ -19,6 +22,7 @@ from tzolkin_calendar import USED_DATEFMT, TzolkinDate, TzolkinException, day_na
 from tzolkin_calendar.calculate import (
     getTzolkinDay,
     getTzolkinDiff,
+    gregorian2tzolkin,
     lastTzolkin,
     makeLookUpTable,
     nextTzolkin,
@@ -827,7 +831,10 @@ def test_addDays(gregorian: str, tzolkin: TzolkinDate, days: int) -> None:
     tzolkin_start = Tzolkin.fromDate(date=gregorian_date).getTzolkinDate()
     assert tzolkin_start.number == tzolkin.number  # nosec
     assert tzolkin_start.name == tzolkin.name  # nosec
-    tzolkin_add = Tzolkin.fromDate(date=gregorian_date).addDays(days).getTzolkinDate()
+    with pytest.deprecated_call():
+        tzolkin_add = (
+            Tzolkin.fromDate(date=gregorian_date).addDays(days).getTzolkinDate()
+        )
     assert getTzolkinDiff(tzolkin_start, tzolkin_add) == days  # nosec
 
 
@@ -887,11 +894,12 @@ def test_addTimedelta(gregorian: str, tzolkin: TzolkinDate, days: int) -> None:
     tzolkin_start = Tzolkin.fromDate(date=gregorian_date).getTzolkinDate()
     assert tzolkin_start.number == tzolkin.number  # nosec
     assert tzolkin_start.name == tzolkin.name  # nosec
-    tzolkin_add = (
-        Tzolkin.fromDate(date=gregorian_date)
-        .addTimedelta(datetime.timedelta(days=days))
-        .getTzolkinDate()
-    )
+    with pytest.deprecated_call():
+        tzolkin_add = (
+            Tzolkin.fromDate(date=gregorian_date)
+            .addTimedelta(datetime.timedelta(days=days))
+            .getTzolkinDate()
+        )
     assert getTzolkinDiff(tzolkin_start, tzolkin_add) == days  # nosec
 
 
@@ -951,9 +959,10 @@ def test_getDayDiff(gregorian: str, tzolkin: TzolkinDate, days: int) -> None:
     tzolkin_start = Tzolkin.fromDate(date=gregorian_date)
     assert tzolkin_start.getTzolkinDate().number == tzolkin.number  # nosec
     assert tzolkin_start.getTzolkinDate().name == tzolkin.name  # nosec
-    tzolkin_add = Tzolkin.fromDate(date=gregorian_date).addTimedelta(
-        datetime.timedelta(days=days)
-    )
+    with pytest.deprecated_call():
+        tzolkin_add = Tzolkin.fromDate(date=gregorian_date).addTimedelta(
+            datetime.timedelta(days=days)
+        )
     assert tzolkin_start.getDayDiff(other=tzolkin_add) == days  # nosec
 
 
@@ -1013,9 +1022,10 @@ def test_getDayTimedelta(gregorian: str, tzolkin: TzolkinDate, days: int) -> Non
     tzolkin_start = Tzolkin.fromDate(date=gregorian_date)
     assert tzolkin_start.getTzolkinDate().number == tzolkin.number  # nosec
     assert tzolkin_start.getTzolkinDate().name == tzolkin.name  # nosec
-    tzolkin_add = Tzolkin.fromDate(date=gregorian_date).addTimedelta(
-        datetime.timedelta(days=days)
-    )
+    with pytest.deprecated_call():
+        tzolkin_add = Tzolkin.fromDate(date=gregorian_date).addTimedelta(
+            datetime.timedelta(days=days)
+        )
     assert tzolkin_start.getDayTimedelta(other=tzolkin_add).days == days  # nosec
 
 
@@ -1028,6 +1038,17 @@ def test_getNameNumberFromName() -> None:
         )
 
 
+################################################################################
+@pytest.mark.parametrize(
+    "name_str, number",
+    [("ajaw", 20), ("Ahau", 20), ("Etz'nab'", 18), ("Kame", 6), ("Coatl", 5)],
+)
+def test_getNameNumberFromNameAlias(name_str: str, number: int) -> None:
+    """Test `Tzolkin.getNameNumberFromName` and the constructor with aliases."""
+    assert Tzolkin.getNameNumberFromName(name_str=name_str) == number  # nosec
+    assert Tzolkin(number=1, name_str=name_str).getDayNameNumber() == number  # nosec
+
+
 ################################################################################
 def test_getNameNumberFromNameExc() -> None:
     """Test `Tzolkin.getNameNumberFromName`, raises excpention."""
@@ -1100,3 +1121,155 @@ def test_print(gregorian: str, tzolkin: TzolkinDate) -> None:
     """Test `Tzolkin.__repr__()`."""
     to_test = Tzolkin.fromDateString(date_str=gregorian, fmt=USED_DATEFMT)
     assert to_test.__repr__() == tzolkin.__repr__()  # nosec
+
+
+################################################################################
+@settings(max_examples=100, deadline=None)
+@given(
+    date=st.dates(
+        min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9000, 1, 1)
+    ),
+    days=st.integers(min_value=0, max_value=3000),
+)
+def test_iterNextLastDates(date: datetime.date, days: int) -> None:
+    """Test `Tzolkin.iterNextDates` and `Tzolkin.iterLastDates`."""
+    to_test = Tzolkin(number=7, name_number=19)
+    assert list(  # nosec
+        itertools.islice(to_test.iterNextDates(start_date=date), 20)
+    ) == to_test.getNextDateList(start_date=date, list_size=20)
+    assert list(  # nosec
+        itertools.islice(to_test.iterLastDates(start_date=date), 20)
+    ) == to_test.getLastDateList(start_date=date, list_size=20)
+    stop_date = date + datetime.timedelta(days=days)
+    for elem in to_test.iterNextDates(start_date=date, stop_date=stop_date):
+        assert date < elem <= stop_date  # nosec
+    stop_date = date - datetime.timedelta(days=days)
+    for elem in to_test.iterLastDates(start_date=date, stop_date=stop_date):
+        assert stop_date <= elem < date  # nosec
+
+
+################################################################################
+@settings(max_examples=100, deadline=None)
+@given(
+    date=st.dates(
+        min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9000, 1, 1)
+    ),
+    days=st.integers(min_value=-10, max_value=30000),
+)
+def test_getDatesBetween(date: datetime.date, days: int) -> None:
+    """Test `Tzolkin.getDatesBetween` and `Tzolkin.countDatesBetween`."""
+    to_test = Tzolkin(number=13, name_number=20)
+    end_date = date + datetime.timedelta(days=days)
+    good_list = list(
+        to_test.iterNextDates(
+            start_date=date - datetime.timedelta(days=1), stop_date=end_date
+        )
+    )
+    assert (  # nosec
+        to_test.getDatesBetween(start_date=date, end_date=end_date) == good_list
+    )
+    assert to_test.countDatesBetween(
+        start_date=date, end_date=end_date
+    ) == len(  # nosec
+        good_list
+    )
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(
+    year_day=st.integers(min_value=1, max_value=260),
+    days=st.integers(min_value=-100000, max_value=100000),
+)
+def test_valueType(year_day: int, days: int) -> None:
+    """Test equality, hashing, ordering and arithmetic of `Tzolkin` instances."""
+    tzolkin_date = makeLookUpTable()[year_day]
+    to_test = Tzolkin(number=tzolkin_date.number, name_number=tzolkin_date.name)
+    same = Tzolkin(number=tzolkin_date.number, name_str=day_names[tzolkin_date.name])
+    assert to_test == same  # nosec
+    assert hash(to_test) == hash(same)  # nosec
+    assert len({to_test, same}) == 1  # nosec
+    assert to_test.__index__() == year_day  # nosec
+    assert to_test != tzolkin_date  # nosec
+
+    added = to_test + days
+    assert added is days + to_test  # nosec
+    assert added is to_test + datetime.timedelta(days=days)  # nosec
+    with pytest.deprecated_call():
+        assert added is to_test.addDays(days)  # nosec
+    with pytest.deprecated_call():
+        assert added is to_test.addTimedelta(datetime.timedelta(days=days))  # nosec
+    assert added - days == to_test  # nosec
+    assert added - datetime.timedelta(days=days) == to_test  # nosec
+    assert to_test.getTzolkinDate() == tzolkin_date  # nosec
+    assert (to_test < added) == (year_day < added.getTzolkinYearDay())  # nosec
+    assert (to_test <= added) == (year_day <= added.getTzolkinYearDay())  # nosec
+    assert (to_test > added) == (year_day > added.getTzolkinYearDay())  # nosec
+    assert (to_test >= added) == (year_day >= added.getTzolkinYearDay())  # nosec
+
+
+################################################################################
+def test_immutable() -> None:
+    """Test that `Tzolkin` instances can't be changed."""
+    to_test = Tzolkin(number=8, name_str="Chuwen")
+    with pytest.raises(AttributeError):
+        to_test.number = 5  # type: ignore
+    with pytest.raises(AttributeError):
+        del to_test._Tzolkin__year_day  # type: ignore
+    assert not hasattr(to_test, "__dict__")  # nosec
+    with pytest.deprecated_call():
+        assert to_test.addDays(1) == Tzolkin(number=9, name_str="Ebʼ")  # nosec
+    assert to_test == Tzolkin(number=8, name_str="Chuwen")  # nosec
+    with pytest.raises(TypeError):
+        to_test + to_test  # type: ignore # pylint: disable=pointless-statement
+    assert list(range(300))[to_test] == 151  # nosec
+
+    shared = Tzolkin.fromDate(datetime.date(2021, 3, 20))
+    with pytest.raises(AttributeError):
+        shared.__init__(number=1, name_number=1)  # type: ignore[misc]
+    assert Tzolkin.fromDate(datetime.date(2021, 3, 20)) == Tzolkin(  # nosec
+        number=12, name_str="Chuwen"
+    )
+
+
+################################################################################
+def test_pickle() -> None:
+    """Test pickling and copying of `Tzolkin` instances."""
+    to_test = Tzolkin(number=8, name_str="Chuwen")
+    assert pickle.loads(pickle.dumps(to_test)) == to_test  # nosec
+    assert copy.copy(to_test) == to_test  # nosec
+    assert copy.deepcopy(to_test) == to_test  # nosec
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(
+    date=st.dates(
+        min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9999, 12, 31)
+    )
+)
+def test_fromYearDay(date: datetime.date) -> None:
+    """Test the trusted constructor `Tzolkin._fromYearDay` of the `from` methods."""
+    tzolkin_date = gregorian2tzolkin(date)
+    expected = Tzolkin(number=tzolkin_date.number, name_number=tzolkin_date.name)
+    from_date = Tzolkin.fromDate(date)
+    assert from_date == expected  # nosec
+    assert from_date is Tzolkin._fromYearDay(expected.getTzolkinYearDay())  # nosec
+    assert Tzolkin.fromIsoFormat(date.isoformat()) is from_date  # nosec
+    assert (  # nosec
+        Tzolkin.fromDateString(date.strftime("%d.%m.%Y"), "%d.%m.%Y") is from_date
+    )
+
+    class SubTzolkin(Tzolkin):
+        """Subclass of `Tzolkin`."""
+
+        __slots__ = ()
+
+    sub = SubTzolkin.fromDate(date)
+    assert type(sub) is SubTzolkin  # nosec
+    assert sub == expected  # nosec
+    assert sub.getTzolkinDate() is tzolkin_date  # nosec
+    assert type(sub + 1) is SubTzolkin  # nosec
+    assert type(1 + sub) is SubTzolkin  # nosec
+    assert type(sub - datetime.timedelta(days=1)) is SubTzolkin  # nosec
+    assert sub + 1 - 1 == expected  # nosec
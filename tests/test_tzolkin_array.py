@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     test_tzolkin_array.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Test tzolkin_array module."""
+
+from __future__ import annotations
+
+import datetime
+from array import array
+from typing import List
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from tzolkin_calendar import TzolkinDate, TzolkinException
+from tzolkin_calendar.calculate import getTzolkinDay, gregorian2tzolkin
+from tzolkin_calendar.tzolkin_array import TzolkinArray
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(dates=st.lists(st.dates(), max_size=100))
+def test_fromDates(dates: List[datetime.date]) -> None:
+    """Test `TzolkinArray.fromDates` and `TzolkinArray.fromOrdinals`."""
+    good_list = [gregorian2tzolkin(date) for date in dates]
+    tzolkin_array = TzolkinArray.fromDates(dates)
+    assert len(tzolkin_array) == len(dates)  # nosec
+    assert list(tzolkin_array) == good_list  # nosec
+    for idx, tzolkin in enumerate(good_list):
+        assert tzolkin_array[idx] == tzolkin  # nosec
+    assert (  # nosec
+        TzolkinArray.fromOrdinals(date.toordinal() for date in dates) == tzolkin_array
+    )
+    assert TzolkinArray(good_list) == tzolkin_array  # nosec
+    assert tzolkin_array.toYearDays().tolist() == [  # nosec
+        getTzolkinDay(tzolkin) for tzolkin in good_list
+    ]
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(
+    year_days=st.lists(st.integers(min_value=1, max_value=260), max_size=100),
+    start=st.integers(min_value=-120, max_value=120),
+    stop=st.integers(min_value=-120, max_value=120),
+    step=st.integers(min_value=-3, max_value=3).filter(lambda x: x != 0),
+)
+def test_slicing(year_days: List[int], start: int, stop: int, step: int) -> None:
+    """Test slicing of a `TzolkinArray`."""
+    tzolkin_array = TzolkinArray.fromYearDays(year_days)
+    sliced = tzolkin_array[start:stop:step]
+    assert isinstance(sliced, TzolkinArray)  # nosec
+    assert list(sliced) == list(tzolkin_array)[start:stop:step]  # nosec
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(year_days=st.lists(st.integers(min_value=1, max_value=260), max_size=100))
+def test_counting(year_days: List[int]) -> None:
+    """Test `TzolkinArray.count`, `TzolkinArray.countAll` and `TzolkinArray.index`."""
+    tzolkin_array = TzolkinArray.fromYearDays(year_days)
+    tzolkin_list = list(tzolkin_array)
+    counts = tzolkin_array.countAll()
+    assert sum(counts.values()) == len(year_days)  # nosec
+    for tzolkin, num in counts.items():
+        assert tzolkin_list.count(tzolkin) == num  # nosec
+        assert tzolkin_array.count(tzolkin) == num  # nosec
+        assert tzolkin_array.index(tzolkin) == tzolkin_list.index(tzolkin)  # nosec
+        assert tzolkin in tzolkin_array  # nosec
+
+
+################################################################################
+def test_buffer() -> None:
+    """Test the buffer of a `TzolkinArray`."""
+    tzolkin_array = TzolkinArray.fromYearDays([1, 2, 260])
+    view = tzolkin_array.getBuffer()
+    assert view.format == "H"  # nosec
+    assert view.itemsize == 2  # nosec
+    assert view.readonly  # nosec
+    assert view.tolist() == [1, 2, 260]  # nosec
+
+
+################################################################################
+def test_fromBuffer() -> None:
+    """Test `TzolkinArray.fromBuffer`."""
+    data = array("H", [1, 2, 260, 2])
+    tzolkin_array = TzolkinArray.fromBuffer(data)
+    assert tzolkin_array == TzolkinArray.fromYearDays(data)  # nosec
+    assert TzolkinArray.fromBuffer(data.tobytes()) == tzolkin_array  # nosec
+    assert tzolkin_array.index(TzolkinDate(number=2, name=2), 2) == 3  # nosec
+    assert tzolkin_array.count(TzolkinDate(number=2, name=2)) == 2  # nosec
+    tzolkin_array.append(TzolkinDate(number=1, name=1))
+    assert data.tolist() == [1, 2, 260, 2]  # nosec
+    assert tzolkin_array.toYearDays().tolist() == [1, 2, 260, 2, 1]  # nosec
+    with pytest.raises(TzolkinException):
+        TzolkinArray.fromBuffer(array("H", [0]))
+    with pytest.raises(TzolkinException):
+        TzolkinArray.fromBuffer(b"\x01")
+    with pytest.raises(TzolkinException):
+        TzolkinArray.fromBuffer(b"\x01", validate=False)
+    unchecked = TzolkinArray.fromBuffer(data, validate=False)
+    assert unchecked == TzolkinArray.fromYearDays(data)  # nosec
+
+
+################################################################################
+def test_appendExtend() -> None:
+    """Test `TzolkinArray.append` and `TzolkinArray.extend`."""
+    tzolkin_array = TzolkinArray()
+    tzolkin_array.append(TzolkinDate(number=1, name=1))
+    tzolkin_array.extend([TzolkinDate(number=2, name=2)])
+    tzolkin_array.extend(TzolkinArray.fromYearDays([260]))
+    assert tzolkin_array.toYearDays().tolist() == [1, 2, 260]  # nosec
+    assert TzolkinDate(number=3, name=3) not in tzolkin_array  # nosec
+    assert repr(tzolkin_array) == "TzolkinArray([1 Imix, 2 Ikʼ, 13 Ajaw])"  # nosec
+
+
+################################################################################
+@pytest.mark.parametrize(
+    "year_days",
+    [
+        pytest.param([0], id="0"),
+        pytest.param([261], id="261"),
+        pytest.param([-1], id="-1"),
+        pytest.param([70000], id="70000"),
+    ],
+)
+def test_invalidYearDays(year_days: List[int]) -> None:
+    """Test invalid days in the Tzolkin year."""
+    with pytest.raises(TzolkinException) as excp:
+        TzolkinArray.fromYearDays(year_days)
+    assert excp  # nosec
+
+
+################################################################################
+def test_invalidTzolkinDate() -> None:
+    """Test adding an invalid Tzolkin date."""
+    with pytest.raises(TzolkinException) as excp:
+        TzolkinArray([TzolkinDate(number=14, name=1)])
+    assert excp  # nosec
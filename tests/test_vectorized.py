@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     test_vectorized.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Test vectorized module."""
+
+from __future__ import annotations
+
+import datetime
+from typing import List
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from tzolkin_calendar import TzolkinDate, TzolkinException
+from tzolkin_calendar.calculate import (
+    getTzolkinDay,
+    gregorian2tzolkin,
+    lastTzolkin,
+    makeLookUpTable,
+    nextTzolkin,
+)
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("tzolkin_calendar.vectorized")
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(dates=st.lists(st.dates(), max_size=50))
+def test_gregorian2tzolkin(dates: List[datetime.date]) -> None:
+    """Test `vectorized.gregorian2tzolkin` against `calculate.gregorian2tzolkin`."""
+    date_array = np.array(dates, dtype="datetime64[D]")
+    numbers, names = vectorized.gregorian2tzolkin(date_array)
+    year_days = vectorized.gregorian2TzolkinDay(date_array)
+    assert numbers.dtype == np.uint8  # nosec
+    assert names.dtype == np.uint8  # nosec
+    assert year_days.dtype == np.uint16  # nosec
+    for idx, date in enumerate(dates):
+        tzolkin = gregorian2tzolkin(date)
+        assert numbers[idx] == tzolkin.number  # nosec
+        assert names[idx] == tzolkin.name  # nosec
+        assert year_days[idx] == getTzolkinDay(tzolkin)  # nosec
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(dates=st.lists(st.dates(), max_size=50))
+def test_ordinals(dates: List[datetime.date]) -> None:
+    """Test the conversion of ordinals and `datetime.date` objects."""
+    ordinals = np.array([date.toordinal() for date in dates], dtype=np.int64)
+    assert vectorized.toOrdinals(dates).tolist() == ordinals.tolist()  # nosec
+    assert (  # nosec
+        vectorized.gregorian2TzolkinDay(ordinals).tolist()
+        == vectorized.gregorian2TzolkinDay(dates).tolist()
+    )
+    numbers, names = vectorized.tzolkinDays2tzolkin(
+        vectorized.gregorian2TzolkinDay(ordinals)
+    )
+    good_numbers, good_names = vectorized.gregorian2tzolkin(ordinals)
+    assert numbers.tolist() == good_numbers.tolist()  # nosec
+    assert names.tolist() == good_names.tolist()  # nosec
+
+
+################################################################################
+def test_datetime64Units() -> None:
+    """Test `datetime64` arrays with other units than days."""
+    date_array = np.array(
+        ["1969-12-31T23:59", "2021-03-20T12:00"], dtype="datetime64[m]"
+    )
+    numbers, names = vectorized.gregorian2tzolkin(date_array)
+    assert (numbers.tolist(), names.tolist()) == ([12, 12], [4, 11])  # nosec
+
+
+################################################################################
+def test_invalidType() -> None:
+    """Test an array not holding dates."""
+    with pytest.raises(TzolkinException) as excp:
+        vectorized.gregorian2tzolkin(np.array([1.5, 2.5]))
+    assert excp  # nosec
+
+
+################################################################################
+@settings(max_examples=200, deadline=None)
+@given(
+    dates=st.lists(
+        st.dates(
+            min_value=datetime.date(1000, 1, 1), max_value=datetime.date(9000, 1, 1)
+        ),
+        max_size=30,
+    ),
+    days=st.lists(st.integers(min_value=1, max_value=260), min_size=30, max_size=30),
+)
+def test_nextLastOccurrence(dates: List[datetime.date], days: List[int]) -> None:
+    """Test `vectorized.nextOccurrence` and `vectorized.lastOccurrence` against
+    `calculate.nextTzolkin` and `calculate.lastTzolkin`.
+    """
+    table = makeLookUpTable()
+    date_array = np.array(dates, dtype="datetime64[D]")
+    targets = np.array(days[: len(dates)], dtype=np.uint16)
+    next_dates = vectorized.nextOccurrence(targets, date_array)
+    last_dates = vectorized.lastOccurrence(targets, date_array)
+    next_ordinals = vectorized.nextOccurrence(targets, vectorized.toOrdinals(dates))
+    assert next_dates.dtype == np.dtype("datetime64[D]")  # nosec
+    assert next_ordinals.dtype == np.int64  # nosec
+    for idx, date in enumerate(dates):
+        tzolkin = table[days[idx]]
+        assert next_dates[idx] == nextTzolkin(tzolkin=tzolkin, starting=date)  # nosec
+        assert last_dates[idx] == lastTzolkin(tzolkin=tzolkin, starting=date)  # nosec
+        assert (
+            next_ordinals[idx]
+            == nextTzolkin(tzolkin=tzolkin, starting=date).toordinal()  # nosec
+        )
+
+
+################################################################################
+def test_nextOccurrenceBroadcast() -> None:
+    """Test broadcasting a single Tzolkin date against the start dates, including a
+    start date with the same Tzolkin date.
+    """
+    tzolkin = TzolkinDate(number=13, name=5)
+    starts = np.array(["1970-01-01", "1970-01-02"], dtype="datetime64[D]")
+    assert vectorized.nextOccurrence(tzolkin, starts).tolist() == [  # nosec
+        datetime.date(1970, 9, 18),
+        datetime.date(1970, 9, 18),
+    ]
+    assert vectorized.lastOccurrence(tzolkin, starts).tolist() == [  # nosec
+        datetime.date(1969, 4, 16),
+        datetime.date(1970, 1, 1),
+    ]
+
+
+################################################################################
+def test_invalidTarget() -> None:
+    """Test an invalid day in the Tzolkin year."""
+    with pytest.raises(TzolkinException) as excp:
+        vectorized.nextOccurrence(np.array([0, 1]), np.array([730120, 730120]))
+    assert excp  # nosec
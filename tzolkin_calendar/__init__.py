@@ -8,8 +8,9 @@
 
 from __future__ import annotations
 
+import operator
 import sys
-from typing import Dict, NamedTuple
+from typing import Dict, NamedTuple, Tuple
 
 __all__ = ["calculate", "tzolkin"]
 
@@ -62,19 +63,94 @@ if sys.version_info.major >= 3 and sys.version_info.minor >= 8:
 
 ################################################################################
 class TzolkinDate(NamedTuple):
-    """Tuple that holds the Tzolkin day number and day name in `number` and `name`."""
+    """Tuple that holds the Tzolkin day number and day name in `number` and `name`.
+
+    There are only 260 different Tzolkin dates, `TzolkinDate.of` and
+    `TzolkinDate.fromYearDay` return shared instances of them instead of creating new
+    ones.
+    """
 
     number: int
     name: int
 
+    ############################################################################
+    @classmethod
+    def of(cls, number: int, name: int) -> TzolkinDate:
+        """Return the shared `TzolkinDate` instance of the Tzolkin date with the day
+        number `number` and day name number `name`.
+
+        Args:
+            number (int): The Tzolkin day number, between 1 and 13.
+            name (int): The Tzolkin day name number, between 1 and 20.
+
+        Raises:
+            TzolkinException: If `number` or `name` is not valid.
+
+        Returns:
+            TzolkinDate: The shared instance of the Tzolkin date.
+        """
+        try:
+            if isinstance(number, bool) or isinstance(name, bool):
+                raise TypeError("bool is not a valid Tzolkin day or name number")
+
+            return _tzolkin_pool[(number, name)]
+        except (KeyError, TypeError) as excp:
+            raise TzolkinException(
+                "({number}, {name}) is not a valid Tzolkin date".format(
+                    number=number, name=name
+                )
+            ) from excp
+
+    ############################################################################
+    @classmethod
+    def fromYearDay(cls, year_day: int) -> TzolkinDate:
+        """Return the shared `TzolkinDate` instance of the day `year_day` in the
+        Tzolkin year.
+        1 Imix, the first day in the Tzolkin year, is day 1, 13 Ajaw, the last day of
+        the Tzolkin year, is day 260.
+
+        Args:
+            year_day (int): The day in the Tzolkin year, between 1 and 260.
+
+        Raises:
+            TzolkinException: If `year_day` is not an integer between 1 and 260.
+
+        Returns:
+            TzolkinDate: The shared instance of the Tzolkin date.
+        """
+        try:
+            if isinstance(year_day, bool):
+                raise TypeError("bool is not a valid day in the Tzolkin year")
+
+            day = operator.index(year_day)
+        except TypeError as excp:
+            raise TzolkinException(
+                "{day!r} is not a valid day in the Tzolkin year, it must be an integer".format(
+                    day=year_day
+                )
+            ) from excp
+
+        if not 1 <= day < len(_tzolkin_dates):
+            raise TzolkinException(
+                "{day} is not a valid day in the Tzolkin year, it must be between 1 and 260 (including 1 and 260)".format(
+                    day=year_day
+                )
+            )
+
+        return _tzolkin_dates[day]
+
+    ############################################################################
     def __repr__(self) -> str:
-        """Return the Tzolkin date as day number and day name including the Unicode
-        glyph for the name.
+        """Return the Tzolkin date as day number and day name, like '8 Chuwen'.
+        The strings of the 260 valid Tzolkin dates are built only once.
 
         Returns:
-            str: The Tzolkin date as day number and day name and the day name
-                 Unicode glyph..
+            str: The Tzolkin date as day number and day name.
         """
+        label = _tzolkin_reprs.get(self)
+        if label is not None:
+            return label
+
         # TODO if Unicode adds the Tzolkin day name glyphs, add them here!
         # return "{number} {name} ({glyph})".format(
         #     number=day_numbers[self.number],
@@ -86,6 +162,8 @@ class TzolkinDate(NamedTuple):
             name=day_names[self.name],
         )
 
+    __str__ = __repr__
+
 
 # some reference days in Tzolkin, actually used is "01.01.1970"
 REFERENCE_DATES = {
@@ -138,6 +216,85 @@ day_names = {
     20: "Ajaw",
 }
 
+# The 20 names of a Tzolkin day using only ASCII characters, with an apostrophe
+# instead of the modifier letter apostrophe.
+day_names_ascii = {num: name.replace("ʼ", "'") for num, name in day_names.items()}
+
+# The 20 names of a Tzolkin day in the colonial Yucatec orthography, from Imix to
+# Ahau (including Imix and Ahau)
+day_names_colonial = {
+    1: "Imix",
+    2: "Ik",
+    3: "Akbal",
+    4: "Kan",
+    5: "Chicchan",
+    6: "Cimi",
+    7: "Manik",
+    8: "Lamat",
+    9: "Muluc",
+    10: "Oc",
+    11: "Chuen",
+    12: "Eb",
+    13: "Ben",
+    14: "Ix",
+    15: "Men",
+    16: "Cib",
+    17: "Caban",
+    18: "Etznab",
+    19: "Cauac",
+    20: "Ahau",
+}
+
+# The 20 Kʼicheʼ names of a Tzolkin day, from Imox to Ajpu (including Imox and Ajpu).
+# Attention: the Kʼicheʼ Kan is the day 5, the Yucatec Kan (Kʼan) the day 4.
+day_names_kiche = {
+    1: "Imox",
+    2: "Iqʼ",
+    3: "Aqʼabʼal",
+    4: "Kʼat",
+    5: "Kan",
+    6: "Kame",
+    7: "Kej",
+    8: "Qʼanil",
+    9: "Toj",
+    10: "Tzʼiʼ",
+    11: "Bʼatzʼ",
+    12: "E",
+    13: "Aj",
+    14: "Iʼx",
+    15: "Tzʼikin",
+    16: "Ajmaq",
+    17: "Noʼj",
+    18: "Tijax",
+    19: "Kawoq",
+    20: "Ajpu",
+}
+
+# The 20 Nahuatl (Aztec) names of a Tzolkin (Tonalpohualli) day, from Cipactli to
+# Xochitl (including Cipactli and Xochitl).
+day_names_nahuatl = {
+    1: "Cipactli",
+    2: "Ehecatl",
+    3: "Calli",
+    4: "Cuetzpalin",
+    5: "Coatl",
+    6: "Miquiztli",
+    7: "Mazatl",
+    8: "Tochtli",
+    9: "Atl",
+    10: "Itzcuintli",
+    11: "Ozomatli",
+    12: "Malinalli",
+    13: "Acatl",
+    14: "Ocelotl",
+    15: "Cuauhtli",
+    16: "Cozcacuauhtli",
+    17: "Ollin",
+    18: "Tecpatl",
+    19: "Quiahuitl",
+    20: "Xochitl",
+}
+
 # The 20 glyphs for the Tzolkin day names, from Imix to Ajaw (including Imix and Ajaw).
 #
 day_glyphs = {
@@ -162,3 +319,76 @@ day_glyphs = {
     19: "\U0001541D",
     20: "\U0001541F",
 }
+
+
+# The shared `TzolkinDate` instance of each day in the Tzolkin year, the day in the
+# Tzolkin year is the index. Index 0 is not used.
+_tzolkin_dates: Tuple[TzolkinDate, ...] = (TzolkinDate(number=0, name=0),) + tuple(
+    TzolkinDate(number=day % len(day_numbers) + 1, name=day % len(day_names) + 1)
+    for day in range(len(day_numbers) * len(day_names))
+)
+
+# The shared `TzolkinDate` instances by (day number, day name number).
+_tzolkin_pool: Dict[Tuple[int, int], TzolkinDate] = {
+    (tzolkin.number, tzolkin.name): tzolkin for tzolkin in _tzolkin_dates[1:]
+}
+
+# The day name tables of the orthographies of the Tzolkin date strings.
+_orthographies: Dict[str, Dict[int, str]] = {
+    "modern": day_names,
+    "ascii": day_names_ascii,
+    "colonial": day_names_colonial,
+}
+
+
+################################################################################
+def _buildLabels(orthography: str, glyphs: bool) -> Tuple[str, ...]:
+    """Return the string of each day in the Tzolkin year, see
+    `calculate.makeLabelTable`.
+
+    Args:
+        orthography (str): The orthography of the day names, a key of
+                           `_orthographies`.
+        glyphs (bool): Append the day name glyph in parentheses.
+
+    Returns:
+        Tuple[str, ...]: The 261 strings, the day in the Tzolkin year is the index,
+                        index 0 is the empty string.
+    """
+    names = _orthographies[orthography]
+    if glyphs:
+        return ("",) + tuple(
+            "{number} {name} ({glyph})".format(
+                number=day_numbers[tzolkin.number],
+                name=names[tzolkin.name],
+                glyph=day_glyphs[tzolkin.name],
+            )
+            for tzolkin in _tzolkin_dates[1:]
+        )
+
+    return ("",) + tuple(
+        "{number} {name}".format(
+            number=day_numbers[tzolkin.number], name=names[tzolkin.name]
+        )
+        for tzolkin in _tzolkin_dates[1:]
+    )
+
+
+# The string of each day in the Tzolkin year, by orthography and by with or without
+# day name glyph. Only the plain modern strings are built at import, all others on
+# first use by `calculate.makeLabelTable`.
+_tzolkin_labels: Dict[Tuple[str, bool], Tuple[str, ...]] = {
+    ("modern", False): _buildLabels("modern", False)
+}
+
+# The UTF-8 encoded strings of `_tzolkin_labels`, built on first use by
+# `calculate.makeLabelBytesTable`.
+_tzolkin_label_bytes: Dict[Tuple[str, bool], Tuple[bytes, ...]] = {}
+
+# The string returned by `TzolkinDate.__repr__` of each valid Tzolkin date.
+_tzolkin_reprs: Dict[TzolkinDate, str] = {
+    tzolkin: label
+    for tzolkin, label in zip(
+        _tzolkin_dates[1:], _tzolkin_labels[("modern", False)][1:]
+    )
+}
@@ -12,10 +12,11 @@
 
 from __future__ import print_function
 
-import platform
 import sys
 
 if sys.version_info.major < 3 or sys.version_info.minor < 8:
+    import platform
+
     print(
         "ERROR: Python version is too old, I need at least Python 3.8, this has a version of {version}".format(
             version=platform.python_version()
@@ -28,4 +29,4 @@ if sys.version_info.major < 3 or sys.version_info.minor < 8:
 if __name__ == "__main__":
     from tzolkin_calendar import main
 
-    main.main()
+    sys.exit(main.main())
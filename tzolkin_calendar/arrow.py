@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     arrow.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Export gregorian dates and their Tzolkin dates as Apache Arrow record batches
+and Parquet files.
+
+pyarrow is an optional dependency of tzolkin-calendar, install it using
+`pip install tzolkin-calendar[arrow]`. The Tzolkin dates are calculated using
+the functions of `tzolkin_calendar.vectorized`. The columns of the record batches
+are described by `TZOLKIN_SCHEMA`: the gregorian date, its ordinal, the day in the
+Tzolkin year, the Tzolkin day number, the day name number and the dictionary
+encoded day name and Tzolkin date string. All record batches share the same two
+dictionaries of the 20 day names and the 260 Tzolkin dates.
+
+Example:
+
+>>> import datetime
+>>> import tzolkin_calendar.arrow
+>>> tzolkin_calendar.arrow.writeParquet(
+        "tzolkin.parquet", datetime.date(1900, 1, 1), datetime.date(2099, 12, 31)
+    )
+73049
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, Iterator
+
+from tzolkin_calendar import day_names
+from tzolkin_calendar.calculate import (
+    REFERENCE_ORDINAL,
+    REFERENCE_TZOLKIN_DAY,
+    makeLabelTable,
+)
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from tzolkin_calendar import vectorized
+except ImportError as excp:  # pragma: no cover
+    raise ImportError(
+        "tzolkin_calendar.arrow needs pyarrow, install it using 'pip install tzolkin-calendar[arrow]'"
+    ) from excp
+
+# The default number of rows of a Parquet row group and a record batch.
+ROW_GROUP_SIZE = 1024 * 1024
+
+# The schema of the record batches, the metadata holds the correlation used.
+TZOLKIN_SCHEMA = pa.schema(
+    [
+        pa.field("date", pa.date32(), nullable=False),
+        pa.field("ordinal", pa.int32(), nullable=False),
+        pa.field("year_day", pa.uint16(), nullable=False),
+        pa.field("number", pa.uint8(), nullable=False),
+        pa.field("name_number", pa.uint8(), nullable=False),
+        pa.field("name", pa.dictionary(pa.int8(), pa.string()), nullable=False),
+        pa.field("label", pa.dictionary(pa.int16(), pa.string()), nullable=False),
+    ],
+    metadata={
+        "tzolkin.reference_ordinal": str(REFERENCE_ORDINAL),
+        "tzolkin.reference_year_day": str(REFERENCE_TZOLKIN_DAY),
+    },
+)
+
+# The dictionary of the day names, in the order of their numbers.
+_name_dictionary = pa.array(list(day_names.values()), type=pa.string())
+
+# The dictionary of the Tzolkin date strings, in the order of the days in the
+# Tzolkin year.
+_label_dictionary = pa.array(makeLabelTable()[1:], type=pa.string())
+
+# The ordinal of the first day of Arrow's `date32`, 1970-01-01.
+__date32_epoch: int = datetime.date(1970, 1, 1).toordinal()
+
+
+################################################################################
+def toRecordBatch(dates: Any) -> pa.RecordBatch:
+    """Return the record batch of the given gregorian dates and their Tzolkin dates.
+
+    Args:
+        dates (Any): The gregorian dates, see
+                     `tzolkin_calendar.vectorized.toOrdinals`.
+
+    Returns:
+        pa.RecordBatch: The record batch with the schema `TZOLKIN_SCHEMA`.
+    """
+    ordinals = vectorized.toOrdinals(dates).ravel()
+    year_days = vectorized.gregorian2TzolkinDay(ordinals)
+    numbers, names = vectorized.tzolkinDays2tzolkin(year_days)
+
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array((ordinals - __date32_epoch).astype(np.int32), type=pa.date32()),
+            pa.array(ordinals, type=pa.int32()),
+            pa.array(year_days, type=pa.uint16()),
+            pa.array(numbers, type=pa.uint8()),
+            pa.array(names, type=pa.uint8()),
+            pa.DictionaryArray.from_arrays(
+                pa.array(names.astype(np.int8) - 1, type=pa.int8()), _name_dictionary
+            ),
+            pa.DictionaryArray.from_arrays(
+                pa.array(year_days.astype(np.int16) - 1, type=pa.int16()),
+                _label_dictionary,
+            ),
+        ],
+        schema=TZOLKIN_SCHEMA,
+    )
+
+
+################################################################################
+def iterRecordBatches(
+    start: datetime.date, end: datetime.date, batch_size: int = ROW_GROUP_SIZE
+) -> Iterator[pa.RecordBatch]:
+    """Return the record batches of all gregorian dates between `start` and `end`,
+    including both, with at most `batch_size` rows each.
+
+    Args:
+        start (datetime.date): The first date.
+        end (datetime.date): The last date.
+        batch_size (int, optional): The maximum number of rows of a record batch.
+                                    Defaults to `ROW_GROUP_SIZE`.
+
+    Yields:
+        Iterator[pa.RecordBatch]: The record batches with the schema
+                                    `TZOLKIN_SCHEMA`.
+    """
+    end_ordinal = end.toordinal() + 1
+    for batch_start in range(start.toordinal(), end_ordinal, batch_size):
+        yield toRecordBatch(
+            np.arange(
+                batch_start, min(batch_start + batch_size, end_ordinal), dtype=np.int64
+            )
+        )
+
+
+################################################################################
+def writeParquet(
+    file_name: str,
+    start: datetime.date,
+    end: datetime.date,
+    row_group_size: int = ROW_GROUP_SIZE,
+) -> int:
+    """Write all gregorian dates between `start` and `end`, including both, and their
+    Tzolkin dates to the Parquet file `file_name`.
+    Each row group is calculated and written on its own, so only one row group is
+    held in memory at a time.
+
+    Args:
+        file_name (str): The name of the Parquet file to write.
+        start (datetime.date): The first date.
+        end (datetime.date): The last date.
+        row_group_size (int, optional): The number of rows of a row group. Defaults
+                                        to `ROW_GROUP_SIZE`.
+
+    Returns:
+        int: The number of rows written.
+    """
+    num_rows = 0
+    with pq.ParquetWriter(file_name, TZOLKIN_SCHEMA) as writer:
+        for batch in iterRecordBatches(start, end, row_group_size):
+            writer.write_batch(batch, row_group_size=row_group_size)
+            num_rows += batch.num_rows
+
+    return num_rows
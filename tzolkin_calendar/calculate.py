@@ -39,39 +39,157 @@ datetime.date(2021, 1, 5)
 from __future__ import annotations
 
 import datetime
-from typing import Dict, List, Tuple
+from array import array
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from tzolkin_calendar import (
     REFERENCE_DATES,
-    USED_DATEFMT,
     TzolkinDate,
+    TzolkinException,
+    _buildLabels,
+    _orthographies,
+    _tzolkin_label_bytes,
+    _tzolkin_labels,
     day_names,
+    day_names_colonial,
+    day_names_kiche,
+    day_names_nahuatl,
     day_numbers,
 )
+from tzolkin_calendar.clock import today
+
+# The number of days in a Tzolkin year, 13 day numbers times 20 day names.
+TZOLKIN_YEAR_LENGTH: int = len(day_names) * len(day_numbers)
 
 
 ################################################################################
-def makeLookUpTable() -> Dict[int, TzolkinDate]:
+def makeLookUpTable() -> Mapping[int, TzolkinDate]:
     """Return a dictionary holding all `TzolkinDate` instances of a tzolkin year.
-    The tzolkin year consists of all combinations of `day_names` and `ay_numbers`,
+    The tzolkin year consists of all combinations of `day_names` and `day_numbers`,
     `day_numbers` are the numbers from 1 to 13 and `day_names` the names from
     'Imix' to 'Ajaw'. So a Tzolkin year is: 1 Imix, 2 Ik', 3 Ak'b'al, ... and
     finishes at 12 Kawak and finally 13 Ajaw.
 
+    The table is built only once, the returned mapping is a read-only view of it.
+
+    Returns:
+        Mapping[int, TzolkinDate]: The read-only mapping of all tzolkin date
+                                   combinations in a tzolkin year (of 260 days).
+    """
+    return __tzolkin_year
+
+
+################################################################################
+def makeLabelTable(
+    orthography: str = "modern", glyphs: bool = False
+) -> Tuple[str, ...]:
+    """Return the strings of all days in a Tzolkin year, like '8 Chuwen', indexed by
+    the day in the Tzolkin year. Index 0 is the empty string.
+    The strings are built only once, on first use.
+
+    Orthographies of the day names:
+      - "modern": the names of `day_names`, like 'Etzʼnabʼ'
+      - "ascii": the names of `day_names_ascii`, like "Etz'nab'"
+      - "colonial": the colonial Yucatec names of `day_names_colonial`, like 'Etznab'
+
+    Args:
+        orthography (str, optional): The orthography of the day names. Defaults to
+                                     "modern".
+        glyphs (bool, optional): Append the day name glyph of `day_glyphs` in
+                                 parentheses. Defaults to False.
+
+    Raises:
+        TzolkinException: If `orthography` is not one of "modern", "ascii" or
+                          "colonial".
+
+    Returns:
+        Tuple[str, ...]: The 261 strings, the day in the Tzolkin year is the index.
+    """
+    key = (orthography, bool(glyphs))
+    labels = _tzolkin_labels.get(key)
+    if labels is None:
+        if orthography not in _orthographies:
+            raise TzolkinException(
+                "unknown orthography {orthography}, not one of {list}".format(
+                    orthography=orthography, list=list(_orthographies)
+                )
+            )
+        labels = _tzolkin_labels.setdefault(key, _buildLabels(*key))
+
+    return labels
+
+
+################################################################################
+def makeLabelBytesTable(
+    orthography: str = "modern", glyphs: bool = False
+) -> Tuple[bytes, ...]:
+    """Return the UTF-8 encoded strings of all days in a Tzolkin year, indexed by the
+    day in the Tzolkin year, see `makeLabelTable`. To write them to binary files
+    without encoding them again.
+
+    Args:
+        orthography (str, optional): The orthography of the day names. Defaults to
+                                     "modern".
+        glyphs (bool, optional): Append the day name glyph. Defaults to False.
+
+    Raises:
+        TzolkinException: If `orthography` is not one of "modern", "ascii" or
+                          "colonial".
+
+    Returns:
+        Tuple[bytes, ...]: The 261 UTF-8 encoded strings, the day in the Tzolkin year
+                            is the index.
+    """
+    key = (orthography, bool(glyphs))
+    label_bytes = _tzolkin_label_bytes.get(key)
+    if label_bytes is None:
+        label_bytes = _tzolkin_label_bytes.setdefault(
+            key,
+            tuple(
+                label.encode("utf-8")
+                for label in makeLabelTable(orthography=orthography, glyphs=glyphs)
+            ),
+        )
+
+    return label_bytes
+
+
+################################################################################
+def __buildLookUpTable() -> Dict[int, TzolkinDate]:
+    """Return a new dictionary holding all `TzolkinDate` instances of a tzolkin year,
+    see `makeLookUpTable`.
+
     Returns:
         Dict[int, TzolkinDate]: The dictionary of all tzolkin date combinations in a
                                 tzolkin year (of 260 days).
     """
     ret_val: Dict[int, TzolkinDate] = {}
-    num_elems = len(day_names) * len(day_numbers)
-    for day in range(0, num_elems):
-        tz_name = calculateTzolkinName(start_name=1, to_add=day)
-        tz_number = calculateTzolkinNumber(start_number=1, to_add=day)
-        ret_val[day + 1] = TzolkinDate(name=tz_name, number=tz_number)
+    for day in range(1, TZOLKIN_YEAR_LENGTH + 1):
+        ret_val[day] = TzolkinDate.fromYearDay(day)
 
     return ret_val
 
 
+# All days of a Tzolkin year, the day in the Tzolkin year as key, and the reverse
+# index, the day in the Tzolkin year of each `TzolkinDate`. Both are built once at
+# import and never changed.
+__tzolkin_year: Mapping[int, TzolkinDate] = MappingProxyType(__buildLookUpTable())
+__tzolkin_year_days: Mapping[TzolkinDate, int] = MappingProxyType(
+    {tzolkin: day for day, tzolkin in __tzolkin_year.items()}
+)
+
+# The reference date "01.01.1970" as ordinal, see `datetime.date.toordinal`, and
+# the day of its Tzolkin date in the Tzolkin year.
+REFERENCE_ORDINAL: int = datetime.date(1970, 1, 1).toordinal()
+REFERENCE_TZOLKIN_DAY: int = __tzolkin_year_days[REFERENCE_DATES["01.01.1970"]]
+
+# Add to an ordinal to get the (zero based) day in the Tzolkin year.
+ORDINAL_OFFSET: int = (
+    REFERENCE_TZOLKIN_DAY - 1 - REFERENCE_ORDINAL
+) % TZOLKIN_YEAR_LENGTH
+
+
 ################################################################################
 def getTzolkinDiff(start: TzolkinDate, end: TzolkinDate) -> int:
     """Return the difference in days between the two given Tzolkin dates.
@@ -100,128 +218,118 @@ def getTzolkinDiff(start: TzolkinDate, end: TzolkinDate) -> int:
         end (TzolkinDate): The Tzolkin date to calculate the time difference in days to.
 
     Returns:
-        int: The number of days between the two given dates. Never negative (0 if
+        int: The number of days between the two given dates. Never negative (260 if
         `start` and `end` are the same day).
     """
-    ret_val = 0
-
-    table = makeLookUpTable()
-
-    day1, day2 = __getDays(start, end, table)
-
-    num_elems = len(day_names) * len(day_numbers)
-    if day2 > day1:
-        ret_val = day2 - day1
-    else:
-        ret_val = num_elems - day1 + day2
+    day1 = getTzolkinDay(start)
+    day2 = getTzolkinDay(end)
 
-    return ret_val
+    return (day2 - day1 - 1) % TZOLKIN_YEAR_LENGTH + 1
 
 
 ################################################################################
-def __getDays(
-    start: TzolkinDate, end: TzolkinDate, table: Dict[int, TzolkinDate]
-) -> Tuple[int, int]:
-    """Return the day indices of each day in the Tzolkin year.
+def getTzolkinDay(tzolkin: TzolkinDate) -> int:
+    """Return the day number in the Tzolkin year, in the interval [1,260] (including
+    both 1 and 260).
+    That is, the index of the given Tzolkin date in the 260 day Tzolkin year.
+    `1 Imix` yields 1 (the first day of the year), `13 Ajaw` yields 260, the last day
+    of the Tzolkin year. If the given date `tzolkin` does not exist, `0` is returned.
 
     Args:
-        start (TzolkinDate): The first Tzolkin date to get the day index of.
-        end (TzolkinDate): The second Tzolkin date to get the day index of.
-        table (Dict[int, TzolkinDate]): The dictionary containing all 260 Tzolkin days
-                                     of a Tzolkin year.
+        tzolkin (TzolkinDate): The Tzolkin date to get the day in the year of.
 
     Returns:
-        Tuple[int, int]: the indices of the days `start` in the first element and
-                            `end` in the second.
+        int: The day of the given date in the Tzolkin year, a positive integer between
+            and including 1 and 260.
+            If the given date does not exist, `0` is returned.
     """
-    day1 = 0
-    day2 = 0
-    for day in table:
-        ret_val = __getDayIdx(start, table, day)
-        if ret_val:
-            day1 = ret_val
-        ret_val = __getDayIdx(end, table, day)
-        if ret_val:
-            day2 = ret_val
-
-    return day1, day2
+    return __tzolkin_year_days.get(tzolkin, 0)
 
 
 ################################################################################
-def __getDayIdx(tzolkin: TzolkinDate, table: Dict[int, TzolkinDate], day: int) -> int:
-    """Return the day's number in the Tzolkin year if the given day is the same as
-    the Tzolkin date.
+def gregorian2tzolkin(date: datetime.date) -> TzolkinDate:
+    """Return the Tzolkin date of the given gregorian date.
 
     Args:
-        tzolkin (TzolkinDate): The Tzolkin date to search for in the Tzolkin year.
-        table (Dict[int, TzolkinDate]): The dictionary of Tzolkin dates in a Tzolkin year.
-        day (int): The current key in the Tzolkin year dict to check.
+        date (datetime.date): The gregorian date to convert to Tzolkin.
 
     Returns:
-        int: The index of the current date in the Tzolkin year if it is the same as
-                `tzolkin`, 0 else.
+        TzolkinDate: The Tzolkin date of the given day `date`.
     """
-    ret_val: int = 0
-    if table[day].name == tzolkin.name and table[day].number == tzolkin.number:
-        ret_val = day
-
-    return ret_val
+    return ordinal2tzolkin(date.toordinal())
 
 
 ################################################################################
-def getTzolkinDay(tzolkin: TzolkinDate) -> int:
-    """Return the day number in the Tzolkin year, in the interval [1,260] (including
-    both 1 and 260).
-    That is, the index of the given Tzolkin date in the 260 day Tzolkin year.
-    `1 Imix` yields 1 (the first day of the year), `13 Ajaw` yields 260, the last day
-    of the Tzolkin year. If the given date `tzolkin` does not exist, `0` is returned.
+def ordinal2tzolkin(ordinal: int) -> TzolkinDate:
+    """Return the Tzolkin date of the gregorian date with the given ordinal.
+    The ordinal of a gregorian date is the one returned by `datetime.date.toordinal`,
+    the 1st of January of year 1 has the ordinal 1.
 
     Args:
-        tzolkin (TzolkinDate): The Tzolkin date to get the day in the year of.
+        ordinal (int): The ordinal of the gregorian date to convert to Tzolkin.
 
     Returns:
-        int: The day of the given date in the Tzolkin year, a positive integer between
-            and including 1 and 260.
-            If the given date does not exist, `0` is returned.
+        TzolkinDate: The Tzolkin date of the day with the ordinal `ordinal`.
     """
-    ret_val = 0
+    return __tzolkin_year[(ordinal + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH + 1]
 
-    table = makeLookUpTable()
 
-    for day in table:
-        if table[day].name == tzolkin.name and table[day].number == tzolkin.number:
-            ret_val = day
+################################################################################
+def ordinal2TzolkinDay(ordinal: int) -> int:
+    """Return the day in the Tzolkin year of the gregorian date with the given
+    ordinal, see `ordinal2tzolkin` and `getTzolkinDay`.
 
-    return ret_val
+    Args:
+        ordinal (int): The ordinal of the gregorian date, as returned by
+                       `datetime.date.toordinal`.
+
+    Returns:
+        int: The day of the Tzolkin date of the gregorian day with the ordinal
+            `ordinal` in the Tzolkin year, between 1 and 260 (including 1 and 260).
+    """
+    return (ordinal + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH + 1
 
 
 ################################################################################
-def gregorian2tzolkin(date: datetime.date) -> TzolkinDate:
-    """Return the Tzolkin date of the given gregorian date.
+def tzolkinOrdinalNext(tzolkin: TzolkinDate, ordinal: int) -> int:
+    """Return the ordinal of the next gregorian date after the day with the ordinal
+    `ordinal` that has a Tzolkin date of `tzolkin`.
+    If the day `ordinal` has the Tzolkin date `tzolkin`, the ordinal 260 days later is
+    returned. See `nextTzolkin`.
 
     Args:
-        date (datetime.date): The gregorian date to convert to Tzolkin.
+        tzolkin (TzolkinDate): The Tzolkin date to search for.
+        ordinal (int): The ordinal of the gregorian date to start the search, as
+                       returned by `datetime.date.toordinal`.
 
     Returns:
-        TzolkinDate: The Tzolkin date of the given day `date`.
+        int: The ordinal of the next gregorian date with the Tzolkin date `tzolkin`
+            after the day `ordinal`.
     """
-    ref_date_str = "01.01.1970"
-    reference_date = datetime.datetime.strptime(ref_date_str, USED_DATEFMT)
-    date_diff = date - reference_date.date()
+    start_day = (ordinal + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH + 1
+
+    return ordinal + (getTzolkinDay(tzolkin) - start_day - 1) % TZOLKIN_YEAR_LENGTH + 1
 
-    diff_days = date_diff.days + getTzolkinDay(REFERENCE_DATES[ref_date_str])
 
-    num_elems = len(day_names) * len(day_numbers)
-    tzolkin_date = diff_days % num_elems
+################################################################################
+def tzolkinOrdinalLast(tzolkin: TzolkinDate, ordinal: int) -> int:
+    """Return the ordinal of the last gregorian date before the day with the ordinal
+    `ordinal` that has a Tzolkin date of `tzolkin`.
+    If the day `ordinal` has the Tzolkin date `tzolkin`, the ordinal 260 days before
+    is returned. See `lastTzolkin`.
+
+    Args:
+        tzolkin (TzolkinDate): The Tzolkin date to search for.
+        ordinal (int): The ordinal of the gregorian date to start the search, as
+                       returned by `datetime.date.toordinal`.
 
-    tzolkin_name = tzolkin_date % len(day_names)
-    if tzolkin_name == 0:
-        tzolkin_name = len(day_names)
-    tzolkin_number = tzolkin_date % len(day_numbers)
-    if tzolkin_number == 0:
-        tzolkin_number = len(day_numbers)
+    Returns:
+        int: The ordinal of the last gregorian date with the Tzolkin date `tzolkin`
+            before the day `ordinal`.
+    """
+    start_day = (ordinal + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH + 1
 
-    return TzolkinDate(number=tzolkin_number, name=tzolkin_name)
+    return ordinal - (start_day - getTzolkinDay(tzolkin) - 1) % TZOLKIN_YEAR_LENGTH - 1
 
 
 ################################################################################
@@ -252,47 +360,116 @@ def tzolkin2gregorian(
     if num_results < 1:
         return ret_val
     if forward:
-        ret_val = [nextTzolkin(tzolkin=tzolkin, starting=start)]
-        __forward(tzolkin, num_results, ret_val)
+        first_date = nextTzolkin(tzolkin=tzolkin, starting=start)
+        step = datetime.timedelta(days=TZOLKIN_YEAR_LENGTH)
     else:
-        ret_val = [lastTzolkin(tzolkin=tzolkin, starting=start)]
-        __backward(tzolkin, num_results, ret_val)
+        first_date = lastTzolkin(tzolkin=tzolkin, starting=start)
+        step = datetime.timedelta(days=-TZOLKIN_YEAR_LENGTH)
+
+    ret_val = [first_date + step * idx for idx in range(0, num_results)]
 
     return ret_val
 
 
 ################################################################################
-def __backward(
-    tzolkin: TzolkinDate, num_results: int, ret_val: List[datetime.date]
-) -> None:
-    """Search forward in time for Tzolkin date `tzolkin` and append to the list.
+def tzolkinDatesBetween(
+    tzolkin: TzolkinDate, start: datetime.date, end: datetime.date
+) -> List[datetime.date]:
+    """Return the list of all dates between `start` and `end` having the same Tzolkin
+    date as the given date `tzolkin`.
+    Both `start` and `end` are included, the list is sorted forward in time. If `end`
+    is before `start` or `tzolkin` is not a valid Tzolkin date, an empty list is
+    returned.
 
     Args:
         tzolkin (TzolkinDate): The Tzolkin date to search for.
-        num_results (int): The number of dates to search.
-        ret_val (List[datetime.date]): The list of found dates with the same Tzolkin date.
+        start (datetime.date): The first gregorian date of the search interval.
+        end (datetime.date): The last gregorian date of the search interval.
+
+    Returns:
+        List[datetime.date]: The list of gregorian dates between `start` and `end`
+                            having the same Tzolkin date as `tzolkin`.
     """
-    results = 0
-    while results < num_results - 1:
-        ret_val.append(lastTzolkin(tzolkin=tzolkin, starting=ret_val[-1]))
-        results += 1
+    num_results = countTzolkinBetween(tzolkin=tzolkin, start=start, end=end)
+    if num_results < 1:
+        return []
+
+    start_ordinal = start.toordinal()
+    first_ordinal = tzolkinOrdinalNext(tzolkin=tzolkin, ordinal=start_ordinal - 1)
+    first_date = start + datetime.timedelta(days=first_ordinal - start_ordinal)
+    step = datetime.timedelta(days=TZOLKIN_YEAR_LENGTH)
+
+    return [first_date + step * idx for idx in range(0, num_results)]
 
 
 ################################################################################
-def __forward(
-    tzolkin: TzolkinDate, num_results: int, ret_val: List[datetime.date]
-) -> None:
-    """Search backwards in time for Tzolkin date `tzolkin` and append to the list.
+def countTzolkinBetween(
+    tzolkin: TzolkinDate, start: datetime.date, end: datetime.date
+) -> int:
+    """Return the number of dates between `start` and `end` having the same Tzolkin
+    date as the given date `tzolkin`.
+    Both `start` and `end` are included. If `end` is before `start` or `tzolkin` is
+    not a valid Tzolkin date, 0 is returned.
 
     Args:
         tzolkin (TzolkinDate): The Tzolkin date to search for.
-        num_results (int): The number of dates to search.
-        ret_val (List[datetime.date]): The list of found dates with the same Tzolkin date.
+        start (datetime.date): The first gregorian date of the search interval.
+        end (datetime.date): The last gregorian date of the search interval.
+
+    Returns:
+        int: The number of gregorian dates between `start` and `end` having the same
+            Tzolkin date as `tzolkin`.
     """
-    results = 0
-    while results < num_results - 1:
-        ret_val.append(nextTzolkin(tzolkin=tzolkin, starting=ret_val[-1]))
-        results += 1
+    if getTzolkinDay(tzolkin) == 0:
+        return 0
+
+    first_ordinal = tzolkinOrdinalNext(tzolkin=tzolkin, ordinal=start.toordinal() - 1)
+    end_ordinal = end.toordinal()
+    if first_ordinal > end_ordinal:
+        return 0
+
+    return (end_ordinal - first_ordinal) // TZOLKIN_YEAR_LENGTH + 1
+
+
+################################################################################
+def iterTzolkin2gregorian(
+    tzolkin: TzolkinDate,
+    start: datetime.date,
+    forward: bool = True,
+    stop: Optional[datetime.date] = None,
+) -> Iterator[datetime.date]:
+    """Return an iterator over the dates having the same Tzolkin date as the given
+    date `tzolkin`.
+    The dates are generated on demand, the same dates as returned by
+    `tzolkin2gregorian` in the same order. If `stop` is `None`, the iterator ends at
+    the first or last date that `datetime.date` can hold.
+
+    Args:
+        tzolkin (TzolkinDate): The Tzolkin date to search for.
+        start (datetime.date): The gregorian date to start the search from.
+        forward (bool, optional): The direction in time to search. Either forward (if
+        `forward` is `True`) or backwards (if `forward` is `False`). Defaults to True.
+        stop (Optional[datetime.date], optional): The date to stop the search at. No
+                    dates after `stop` (or before `stop`, if searching backwards) are
+                    returned, `stop` itself is included. Defaults to None.
+
+    Yields:
+        Iterator[datetime.date]: The gregorian dates having the same Tzolkin date as
+                                `tzolkin`.
+    """
+    try:
+        if forward:
+            date = nextTzolkin(tzolkin=tzolkin, starting=start)
+            step = datetime.timedelta(days=TZOLKIN_YEAR_LENGTH)
+        else:
+            date = lastTzolkin(tzolkin=tzolkin, starting=start)
+            step = datetime.timedelta(days=-TZOLKIN_YEAR_LENGTH)
+
+        while stop is None or (date <= stop if forward else date >= stop):
+            yield date
+            date += step
+    except OverflowError:
+        return
 
 
 ################################################################################
@@ -341,6 +518,9 @@ def calculateTzolkinNumber(start_number: int, to_add: int) -> int:
 def parseTzolkinName(name_str: str) -> int:
     """Parse the given string to get a Tzolkin day name.
     Ignores lower- and uppercase, ignores all non-alphanumberic characters.
+    Accepts the names of `day_names`, the aliases of `day_names_colonial`,
+    `day_names_kiche` and `day_names_nahuatl` and the ones added using
+    `registerTzolkinAlias`.
 
     Returns 0 if no name has been found
 
@@ -350,20 +530,122 @@ def parseTzolkinName(name_str: str) -> int:
     Returns:
         int: The number of the found Tzolkin day name. 0 on errors.
     """
-    ret_val = 0
+    return __day_name_index.get(__normalizeName(name_str), 0)
+
+
+################################################################################
+def parseTzolkinNames(name_strs: Iterable[str]) -> array:
+    """Parse each of the given strings to get a Tzolkin day name, see
+    `parseTzolkinName`.
+    Each distinct string is parsed only once, repeated strings are looked up.
+
+    Args:
+        name_strs (Iterable[str]): The strings to parse to get Tzolkin day names.
+
+    Returns:
+        array: The `array.array` of type 'B' holding the number of the found Tzolkin
+                day name of each string, 0 if no name has been found.
+    """
+    cache: Dict[str, int] = {}
+
+    def parseCached(name_str: str) -> int:
+        num = cache.get(name_str)
+        if num is None:
+            num = __day_name_index.get(__normalizeName(name_str), 0)
+            if len(cache) < __name_cache_size:
+                cache[name_str] = num
+
+        return num
 
-    for num, name in day_names.items():
-        if "".join(
-            [a for a in name_str.upper() if a.isascii() and a.isalpha()]
-        ) == "".join([a for a in name.upper() if a.isascii() and a.isalpha()]):
-            ret_val: int = num
+    return array("B", map(parseCached, name_strs))
+
+
+################################################################################
+def __normalizeName(name_str: str) -> str:
+    """Return the normalized form of a Tzolkin day name, in uppercase and without
+    all characters that are not ASCII letters.
+
+    Args:
+        name_str (str): The day name to normalize.
+
+    Returns:
+        str: The normalized day name.
+    """
+    name_upper = name_str.upper()
+    if name_upper.isascii() and name_upper.isalpha():
+        return name_upper
+
+    return "".join([a for a in name_upper if a.isascii() and a.isalpha()])
+
+
+################################################################################
+def registerTzolkinAlias(alias: str, number: int) -> None:
+    """Add the alias `alias` of the Tzolkin day name with the number `number`.
+    Like the day names, the alias is matched ignoring lower- and uppercase and all
+    non-alphanumberic characters, by `parseTzolkinName`, `parseTzolkinNames`,
+    `Tzolkin.getNameNumberFromName` and the `Tzolkin` constructor.
+
+    Args:
+        alias (str): The alias of the Tzolkin day name.
+        number (int): The number of the Tzolkin day name, between 1 and 20
+                      (including 1 and 20).
+
+    Raises:
+        TzolkinException: If `number` is not a valid day name number, `alias` does
+                          not contain any ASCII letter or already is the name or
+                          alias of another day name.
+    """
+    if number not in day_names:
+        raise TzolkinException(
+            "{number} is not a valid Tzolkin day name number, it must be between 1 and 20 (including 1 and 20)".format(
+                number=number
+            )
+        )
+
+    normalized = __normalizeName(alias)
+    if normalized == "":
+        raise TzolkinException(
+            'alias "{alias}" does not contain any ASCII letter'.format(alias=alias)
+        )
+
+    old_number = __day_name_index.setdefault(normalized, number)
+    if old_number != number:
+        raise TzolkinException(
+            'alias "{alias}" is already the name of the Tzolkin day name {name}'.format(
+                alias=alias, name=day_names[old_number]
+            )
+        )
+
+
+################################################################################
+def __buildNameIndex() -> Dict[str, int]:
+    """Return the index of the normalized day names and aliases of
+    `day_names_colonial`, `day_names_kiche` and `day_names_nahuatl`.
+    If an alias is already the name of another day, like the Kʼicheʼ Kan (5) and the
+    colonial Yucatec Kan (4), the first one is used.
+
+    Returns:
+        Dict[str, int]: The number of each Tzolkin day name, the normalized name is
+                        the key.
+    """
+    ret_val: Dict[str, int] = {}
+    for names in (day_names, day_names_colonial, day_names_kiche, day_names_nahuatl):
+        for num, name in names.items():
+            ret_val.setdefault(__normalizeName(name), num)
 
     return ret_val
 
 
+# The number of each Tzolkin day name and alias, the normalized name is the key.
+__day_name_index: Dict[str, int] = __buildNameIndex()
+
+# The maximum number of distinct strings `parseTzolkinNames` remembers.
+__name_cache_size: int = 65536
+
+
 ################################################################################
 def nextTzolkin(
-    tzolkin: TzolkinDate, starting: datetime.date = datetime.date.today()
+    tzolkin: TzolkinDate, starting: Optional[datetime.date] = None
 ) -> datetime.date:
     """Return the next gregorian date after `starting`, that has a Tzolkin date of
     `tzolkin`.
@@ -371,29 +653,26 @@ def nextTzolkin(
 
     Args:
         tzolkin (TzolkinDate): The Tzolkin date to search for.
-        starting (datetime.date, optional): The date to start the search. Defaults to
-                                            `datetime.date.today()`.
+        starting (Optional[datetime.date], optional): The date to start the search.
+                                    Defaults to None, the date of today, see
+                                    `clock.today`.
 
     Returns:
         datetime.date: The next gregorian date with the given Tzolkin date `tzolkin`
                         after `starting`.
     """
-    tzolkin_start_date = gregorian2tzolkin(starting)
-
-    days_diff = getTzolkinDiff(start=tzolkin_start_date, end=tzolkin)
+    if starting is None:
+        starting = today()
+    ordinal = starting.toordinal()
 
-    if days_diff == 0:
-        num_elems = len(day_names) * len(day_numbers)
-        days_diff = num_elems
-
-    day_diff_delta = datetime.timedelta(days=days_diff)
-
-    return starting + day_diff_delta
+    return starting + datetime.timedelta(
+        days=tzolkinOrdinalNext(tzolkin=tzolkin, ordinal=ordinal) - ordinal
+    )
 
 
 ################################################################################
 def lastTzolkin(
-    tzolkin: TzolkinDate, starting: datetime.date = datetime.date.today()
+    tzolkin: TzolkinDate, starting: Optional[datetime.date] = None
 ) -> datetime.date:
     """Return the last gregorian date before `starting`, that has a Tzolkin date of
     `tzolkin`.
@@ -401,17 +680,18 @@ def lastTzolkin(
 
     Args:
         tzolkin (TzolkinDate): The Tzolkin date to search for.
-        starting (datetime.date, optional): The date to start the search. Defaults to
-                                            `datetime.date.today()`.
+        starting (Optional[datetime.date], optional): The date to start the search.
+                                    Defaults to None, the date of today, see
+                                    `clock.today`.
 
     Returns:
         datetime.date: The last gregorian date with the given Tzolkin date `tzolkin`
                         before `starting`.
     """
-    tzolkin_start_date = gregorian2tzolkin(starting)
-
-    days_diff = getTzolkinDiff(start=tzolkin, end=tzolkin_start_date)
-
-    day_diff_delta = datetime.timedelta(days=(-1) * days_diff)
+    if starting is None:
+        starting = today()
+    ordinal = starting.toordinal()
 
-    return starting + day_diff_delta
+    return starting + datetime.timedelta(
+        days=tzolkinOrdinalLast(tzolkin=tzolkin, ordinal=ordinal) - ordinal
+    )
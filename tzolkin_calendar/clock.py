@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     clock.py
+# Date:     18.Oct.2026
+###############################################################################
+"""The clock returning the date of today, used as default start date of all date
+searches.
+
+`today` is evaluated on each call, so long running programs get the right date after
+midnight. The date is cached until the next local midnight, so most calls only need
+`time.time()` instead of `datetime.date.today()`.
+The clock can be replaced using `setClock`, to use a frozen date in tests and
+benchmarks use `freezeToday`.
+
+Example:
+
+>>> import datetime
+>>> import tzolkin_calendar.clock
+>>> with tzolkin_calendar.clock.freezeToday(datetime.date(2021, 3, 20)):
+...     tzolkin_calendar.clock.today()
+...
+datetime.date(2021, 3, 20)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import time
+from typing import Any, Callable, Iterator, List, Optional
+
+
+################################################################################
+def today() -> datetime.date:
+    """Return the date of today, using the clock set by `setClock`.
+
+    Returns:
+        datetime.date: The date of today.
+    """
+    return __clock[0]()
+
+
+################################################################################
+def setClock(clock: Optional[Callable[[], datetime.date]] = None) -> None:
+    """Set the clock `today` uses to get the date of today.
+
+    Args:
+        clock (Optional[Callable[[], datetime.date]], optional): The function
+                    returning the date of today. Defaults to None, the system clock
+                    in local time, see `systemToday`.
+    """
+    __clock[0] = systemToday if clock is None else clock
+
+
+################################################################################
+@contextlib.contextmanager
+def freezeToday(date: datetime.date) -> Iterator[datetime.date]:
+    """Set the date `today` returns to `date`, until the end of the `with` block.
+    The clock used before is restored at the end of the `with` block.
+
+    Args:
+        date (datetime.date): The date `today` returns.
+
+    Yields:
+        Iterator[datetime.date]: The date `date`.
+    """
+    old_clock = __clock[0]
+    __clock[0] = lambda: date
+    try:
+        yield date
+    finally:
+        __clock[0] = old_clock
+
+
+################################################################################
+def systemToday() -> datetime.date:
+    """Return the date of today of the system clock in local time, the default clock
+    of `today`.
+    The date is cached until the next local midnight, if the system time is before
+    the start of the cached date, the date is calculated again too.
+
+    Returns:
+        datetime.date: The date of today.
+    """
+    now = time.time()
+    valid_from, valid_until, date = __cached_today
+    if valid_from <= now < valid_until:
+        return date
+
+    date = datetime.date.fromtimestamp(now)
+    __cached_today[:] = [
+        time.mktime(date.timetuple()),
+        time.mktime((date + datetime.timedelta(days=1)).timetuple()),
+        date,
+    ]
+
+    return date
+
+
+# The cached date of `systemToday` and the start and end of its validity as seconds
+# since the epoch, like `time.time()`. Replaced as a whole when the day changes.
+__cached_today: List[Any] = [0.0, 0.0, datetime.date.min]
+
+# The clock used by `today`.
+__clock: List[Callable[[], datetime.date]] = [systemToday]
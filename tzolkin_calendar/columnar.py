@@ -0,0 +1,373 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     columnar.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Binary columnar file format of gregorian dates and their Tzolkin dates.
+
+A columnar file is much smaller and faster to read than a text file of Tzolkin date
+strings. It starts with a header of 24 bytes, followed by two columns, all values
+are little endian:
+
+=======  ======  ===============================================================
+Offset   Type    Content
+=======  ======  ===============================================================
+0        4s      The magic bytes `COLUMNAR_MAGIC`, b"TZKC".
+4        uint16  The version of the format, `COLUMNAR_VERSION`.
+6        uint16  Reserved, 0.
+8        int32   The reference (epoch) ordinal of the correlation used.
+12       uint16  The day in the Tzolkin year of the reference ordinal.
+14       uint16  Reserved, 0.
+16       uint64  The number of rows N.
+24       int32   N gregorian date ordinals, as returned by `datetime.date.toordinal`.
+24 + 4N  uint16  N days in the Tzolkin year, between 1 and 260.
+=======  ======  ===============================================================
+
+`ColumnarReader` memory maps the file and returns the columns as `memoryview` or
+`TzolkinArray` slices without copying them.
+
+Example:
+
+>>> import datetime
+>>> from tzolkin_calendar.columnar import ColumnarReader, writeDates
+>>> writeDates("dates.tzc", [datetime.date(2014, 5, 23), datetime.date(2021, 3, 20)])
+2
+>>> with ColumnarReader("dates.tzc") as reader:
+...     reader.getTzolkinArray()
+...
+TzolkinArray([2 Etzʼnabʼ, 12 Chuwen])
+"""
+
+from __future__ import annotations
+
+import datetime
+import itertools
+import mmap
+import struct
+import sys
+from array import array
+from types import TracebackType
+from typing import Any, Iterable, Optional, Tuple, Type
+
+from tzolkin_calendar import TzolkinDate, TzolkinException, _tzolkin_dates
+from tzolkin_calendar.calculate import (
+    REFERENCE_ORDINAL,
+    REFERENCE_TZOLKIN_DAY,
+    TZOLKIN_YEAR_LENGTH,
+    ordinal2TzolkinDay,
+)
+from tzolkin_calendar.tzolkin_array import TzolkinArray
+
+# The magic bytes at the start of a columnar file.
+COLUMNAR_MAGIC = b"TZKC"
+
+# The version of the columnar file format.
+COLUMNAR_VERSION = 1
+
+# The layout of the header: magic, version, reserved, reference ordinal, day in
+# the Tzolkin year of the reference ordinal, reserved and number of rows.
+_header_struct = struct.Struct("<4sHHiHHQ")
+
+# The number of ordinals converted and written at once.
+_batch_size = 65536
+
+
+################################################################################
+def writeOrdinals(file_name: str, ordinals: Iterable[int]) -> int:
+    """Write the gregorian date ordinals `ordinals` and their Tzolkin dates to the
+    columnar file `file_name`.
+    The ordinals are written in batches, only the days in the Tzolkin year are kept
+    in memory until all ordinals have been written, two bytes per date.
+
+    Args:
+        file_name (str): The name of the file to write.
+        ordinals (Iterable[int]): The ordinals of the gregorian dates, as returned
+                                  by `datetime.date.toordinal`.
+
+    Raises:
+        TzolkinException: If an ordinal does not fit in a 32 bit integer.
+
+    Returns:
+        int: The number of rows written.
+    """
+    year_days = array("H")
+    ordinal_iter = iter(ordinals)
+    with open(file_name, "wb") as out_file:
+        out_file.write(_header_struct.pack(COLUMNAR_MAGIC, 0, 0, 0, 0, 0, 0))
+        while True:
+            try:
+                batch = array("i", itertools.islice(ordinal_iter, _batch_size))
+            except OverflowError as excp:
+                raise TzolkinException(
+                    "the ordinals must fit in a signed 32 bit integer"
+                ) from excp
+            if not batch:
+                break
+
+            year_days.extend(map(ordinal2TzolkinDay, batch))
+            __writeLittleEndian(out_file, batch)
+
+        __writeLittleEndian(out_file, year_days)
+        out_file.seek(0)
+        out_file.write(
+            _header_struct.pack(
+                COLUMNAR_MAGIC,
+                COLUMNAR_VERSION,
+                0,
+                REFERENCE_ORDINAL,
+                REFERENCE_TZOLKIN_DAY,
+                0,
+                len(year_days),
+            )
+        )
+
+    return len(year_days)
+
+
+################################################################################
+def writeDates(file_name: str, dates: Iterable[datetime.date]) -> int:
+    """Write the gregorian dates `dates` and their Tzolkin dates to the columnar file
+    `file_name`, see `writeOrdinals`.
+
+    Args:
+        file_name (str): The name of the file to write.
+        dates (Iterable[datetime.date]): The gregorian dates to write.
+
+    Returns:
+        int: The number of rows written.
+    """
+    return writeOrdinals(file_name, map(datetime.date.toordinal, dates))
+
+
+################################################################################
+def __writeLittleEndian(out_file: Any, data: array) -> None:
+    """Write the array `data` to `out_file` in little endian byte order.
+
+    Args:
+        out_file (Any): The binary file to write to.
+        data (array): The array to write.
+    """
+    if sys.byteorder != "little":  # pragma: no cover
+        data = array(data.typecode, data)
+        data.byteswap()
+
+    out_file.write(data)
+
+
+################################################################################
+class ColumnarReader:
+    """Reader of columnar files, memory maps the file.
+
+    The returned `memoryview` and `TzolkinArray` slices use the mapped file as
+    storage. The mapping is removed after `close` has been called and the last
+    returned slice has been deleted.
+    The days in the Tzolkin year are checked once when opening the file, so
+    returning a slice does not depend on its length.
+    """
+
+    ############################################################################
+    def __init__(self, file_name: str) -> None:
+        """Open and memory map the columnar file `file_name`.
+
+        Args:
+            file_name (str): The name of the columnar file to read.
+
+        Raises:
+            TzolkinException: If the file is not a columnar file or holds an invalid
+                              day in the Tzolkin year.
+        """
+        with open(file_name, "rb") as in_file:
+            header = in_file.read(_header_struct.size)
+            if len(header) < _header_struct.size:
+                raise TzolkinException(
+                    "{file} is not a Tzolkin columnar file".format(file=file_name)
+                )
+            self.__map = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            _,
+            self.__reference_ordinal,
+            self.__reference_tzolkin_day,
+            _,
+            self.__num_rows,
+        ) = _header_struct.unpack(header)
+
+        if (
+            magic != COLUMNAR_MAGIC
+            or version != COLUMNAR_VERSION
+            or len(self.__map) != _header_struct.size + 6 * self.__num_rows
+        ):
+            self.__map.close()
+            raise TzolkinException(
+                "{file} is not a Tzolkin columnar file of version {version}".format(
+                    file=file_name, version=COLUMNAR_VERSION
+                )
+            )
+
+        data = memoryview(self.__map)
+        ordinals_start = _header_struct.size
+        ordinals_end = ordinals_start + 4 * self.__num_rows
+        self.__ordinals = self.__column(data[ordinals_start:ordinals_end], "i")
+        self.__year_days = self.__column(data[ordinals_end:], "H")
+        data.release()
+
+        if self.__year_days and (
+            min(self.__year_days) < 1 or max(self.__year_days) > TZOLKIN_YEAR_LENGTH
+        ):
+            self.close()
+            raise TzolkinException(
+                "{file} holds an invalid day in the Tzolkin year".format(file=file_name)
+            )
+
+    ############################################################################
+    @staticmethod
+    def __column(data: memoryview, typecode: str) -> memoryview:
+        """Return the column `data` as read-only `memoryview` of the given type.
+
+        Args:
+            data (memoryview): The bytes of the column, in little endian byte order.
+            typecode (str): The type of the values, 'i' or 'H'.
+
+        Returns:
+            memoryview: The read-only view of the values of the column.
+        """
+        if sys.byteorder != "little":  # pragma: no cover
+            column = array(typecode, data.tobytes())
+            column.byteswap()
+            return memoryview(column).toreadonly()
+
+        return data.cast(typecode)
+
+    ############################################################################
+    def __len__(self) -> int:
+        """Return the number of rows of the file.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self.__num_rows
+
+    ############################################################################
+    def getCorrelation(self) -> Tuple[int, int]:
+        """Return the correlation the Tzolkin dates of the file have been calculated
+        with, as reference ordinal and its day in the Tzolkin year.
+
+        Returns:
+            Tuple[int, int]: The reference ordinal and its day in the Tzolkin year.
+        """
+        return self.__reference_ordinal, self.__reference_tzolkin_day
+
+    ############################################################################
+    def getOrdinals(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """Return the gregorian date ordinals of the rows `start` to `stop`, without
+        copying them.
+
+        Args:
+            start (int, optional): The index of the first row. Defaults to 0.
+            stop (Optional[int], optional): The index after the last row. Defaults to
+                                            None, the number of rows.
+
+        Returns:
+            memoryview: The read-only view of the ordinals, of format 'i'.
+        """
+        return self.__ordinals[start:stop]
+
+    ############################################################################
+    def getYearDays(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """Return the days in the Tzolkin year of the rows `start` to `stop`, without
+        copying them.
+
+        Args:
+            start (int, optional): The index of the first row. Defaults to 0.
+            stop (Optional[int], optional): The index after the last row. Defaults to
+                                            None, the number of rows.
+
+        Returns:
+            memoryview: The read-only view of the days in the Tzolkin year, of format
+                        'H'.
+        """
+        return self.__year_days[start:stop]
+
+    ############################################################################
+    def getTzolkinArray(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> TzolkinArray:
+        """Return the Tzolkin dates of the rows `start` to `stop` as `TzolkinArray`
+        using the mapped file as storage.
+
+        Args:
+            start (int, optional): The index of the first row. Defaults to 0.
+            stop (Optional[int], optional): The index after the last row. Defaults to
+                                            None, the number of rows.
+
+        Returns:
+            TzolkinArray: The Tzolkin dates of the rows.
+        """
+        return TzolkinArray.fromBuffer(self.__year_days[start:stop], validate=False)
+
+    ############################################################################
+    def getDate(self, index: int) -> datetime.date:
+        """Return the gregorian date of the row `index`.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            datetime.date: The gregorian date of the row.
+        """
+        return datetime.date.fromordinal(self.__ordinals[index])
+
+    ############################################################################
+    def getTzolkinDate(self, index: int) -> TzolkinDate:
+        """Return the Tzolkin date of the row `index`.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            TzolkinDate: The Tzolkin date of the row.
+        """
+        return _tzolkin_dates[self.__year_days[index]]
+
+    ############################################################################
+    def close(self) -> None:
+        """Close the file. The mapping is removed when no returned slice is used
+        anymore.
+        """
+        self.__ordinals.release()
+        self.__year_days.release()
+        try:
+            self.__map.close()
+        except BufferError:
+            # Returned slices still use the mapping, it is closed when the last of
+            # them is deleted.
+            pass
+
+    ############################################################################
+    def __enter__(self) -> ColumnarReader:
+        """Return this reader, to use it as context manager.
+
+        Returns:
+            ColumnarReader: This reader.
+        """
+        return self
+
+    ############################################################################
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the file at the end of the `with` block.
+
+        Args:
+            exc_type (Optional[Type[BaseException]]): The type of the raised exception.
+            exc_value (Optional[BaseException]): The raised exception.
+            traceback (Optional[TracebackType]): The traceback of the exception.
+        """
+        self.close()
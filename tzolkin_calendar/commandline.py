@@ -7,14 +7,15 @@
 ###############################################################################
 """All  functions to parse the command line arguments of the program."""
 
-
 from __future__ import annotations
 
 import argparse
-import datetime
-from typing import Tuple
+import sys
+from typing import List, Optional, TextIO, Tuple
 
 from tzolkin_calendar import VERSION
+from tzolkin_calendar.clock import today
+from tzolkin_calendar.output import OUTPUT_FORMATS
 
 __description = """A Tzolk’in date converter and calculator.
 
@@ -46,23 +47,91 @@ To get the Tzolk’in date of the 16th april 2016, use one of these date formats
     python -m tzolkin_calendar 2016 04 16
     python -m tzolkin_calendar 04/16/2016
 
+To convert or search many dates at once, each argument and each line read from stdin
+for the argument '-' is a date of its own, one line is printed for each:
+
+    python -m tzolkin_calendar --batch 16.04.2016 "8 Chuwen" 2016-04-17
+    cat dates.txt | python -m tzolkin_calendar --batch -
+
+To get machine-readable output with ISO dates, use the format JSON, NDJSON or CSV:
+
+    python -m tzolkin_calendar --format json 8 Chuwen --list 10
+    cat dates.txt | python -m tzolkin_calendar --batch --format ndjson -
+
+To convert a file of gregorian dates, one per line, see:
+
+    python -m tzolkin_calendar convert --help
+
+"""
+
+__convert_description = """Convert gregorian dates to Tzolk’in dates, one date per line.
+
+The same date formats as for the single date are accepted. For each line of the input, a
+line with the Tzolk’in date is written to the output, lines that can't be parsed are
+reported and left empty in the output.
+
+Examples:
+
+ python -m tzolkin_calendar convert dates.txt
+ python -m tzolkin_calendar convert dates.txt --output tzolkin.txt
+ cat dates.txt | python -m tzolkin_calendar convert
+ python -m tzolkin_calendar convert --column date events.csv
+ python -m tzolkin_calendar convert --jobs 4 dates.txt --output tzolkin.txt
+ python -m tzolkin_calendar convert --fixed-width dates.txt --output tzolkin.txt
+
 """
 
 
 ################################################################################
-def parseCommandline() -> Tuple[argparse.ArgumentParser, argparse.Namespace]:
+class _ArgumentParser(argparse.ArgumentParser):
+    """An `argparse.ArgumentParser` printing the help text and the version to the
+    file `out_file` instead of `sys.stdout`, without replacing `sys.stdout` of the
+    whole process. Errors are printed to `sys.stderr`.
+    """
+
+    # The file to print the help text and the version to, `None` for `sys.stdout`.
+    out_file: Optional[TextIO] = None
+
+    ############################################################################
+    def _print_message(self, message: str, file: Optional[TextIO] = None) -> None:
+        """Print `message` to `file`, to `out_file` instead of `sys.stdout`.
+
+        Args:
+            message (str): The message to print.
+            file (Optional[TextIO], optional): The file `argparse` prints to.
+                                               Defaults to None, `sys.stderr`.
+        """
+        if file is sys.stdout and self.out_file is not None:
+            file = self.out_file
+
+        super()._print_message(message, file)
+
+
+################################################################################
+def parseCommandline(
+    argv: Optional[List[str]] = None, out_file: Optional[TextIO] = None
+) -> Tuple[argparse.ArgumentParser, argparse.Namespace]:
     """Parse the command line the program has been called with.
 
+    Args:
+        argv (Optional[List[str]], optional): The command line arguments to parse,
+                                              without the program name. Defaults to
+                                              None, `sys.argv[1:]`.
+        out_file (Optional[TextIO], optional): The file to print the help and
+                                                version to. Defaults to None,
+                                                `sys.stdout`.
+
     Returns:
         Tuple[argparse.ArgumentParser, argparse.Namespace]: The command line parser
                 instance and an object holding the parsed command line arguments.
     """
-    cmd_line_parser = argparse.ArgumentParser(
+    cmd_line_parser = _ArgumentParser(
         prog="python -m tzolkin_calendar",
         formatter_class=argparse.RawTextHelpFormatter,
         description=__description,
         epilog="See website https://github.com/Release-Candidate/tzolkin_calendar for a detailed description.",
     )
+    cmd_line_parser.out_file = out_file
     cmd_line_parser.add_argument(
         "--version",
         action="version",
@@ -94,14 +163,110 @@ def parseCommandline() -> Tuple[argparse.ArgumentParser, argparse.Namespace]:
         dest="display_year",
         default=False,
     )
+    cmd_line_parser.add_argument(
+        "-b",
+        "--batch",
+        action="store_true",
+        help="Convert or search each DATE on its own instead of joining them to a single date, '-' reads one date per line from stdin. Without DATE all dates are read from stdin. One line is printed for each date, dates that can't be parsed are reported and left empty in the output.",
+        dest="batch",
+        default=False,
+    )
+    cmd_line_parser.add_argument(
+        "--format",
+        metavar="FORMAT",
+        help="The output format, one of {formats}. The machine-readable formats use ISO dates 'YYYY-MM-DD' and write an error record instead of the help text on errors. The default is 'text'.".format(
+            formats=", ".join(OUTPUT_FORMATS)
+        ),
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default=OUTPUT_FORMATS[0],
+    )
     cmd_line_parser.add_argument(
         "date",
         metavar="DATE",
         nargs="*",
         help="The date to parse and convert. Either a Tzolk’in date or a gregorian date can be given. The default is the date of today.",
-        default=datetime.date.today().strftime("%d.%m.%Y"),
+        default=today().strftime("%d.%m.%Y"),
+    )
+
+    cmdline_args = cmd_line_parser.parse_args(argv)
+
+    return cmd_line_parser, cmdline_args
+
+
+################################################################################
+def parseConvertCommandline(
+    argv: List[str], out_file: Optional[TextIO] = None
+) -> Tuple[argparse.ArgumentParser, argparse.Namespace]:
+    """Parse the command line of the subcommand `convert`.
+
+    Args:
+        argv (List[str]): The arguments after the subcommand `convert`.
+        out_file (Optional[TextIO], optional): The file to print the help to.
+                                                Defaults to None, `sys.stdout`.
+
+    Returns:
+        Tuple[argparse.ArgumentParser, argparse.Namespace]: The command line parser
+                instance and an object holding the parsed command line arguments.
+    """
+    cmd_line_parser = _ArgumentParser(
+        prog="python -m tzolkin_calendar convert",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=__convert_description,
+    )
+    cmd_line_parser.out_file = out_file
+    cmd_line_parser.add_argument(
+        "-o",
+        "--output",
+        metavar="OUT_FILE",
+        help="The file to write the Tzolk’in dates to. The default is '-', stdout.",
+        dest="out_file",
+        type=str,
+        default="-",
+    )
+    cmd_line_parser.add_argument(
+        "-c",
+        "--column",
+        metavar="COLUMN",
+        help="Read the input as CSV file and convert the dates in the column named COLUMN. A column 'tzolkin' holding the Tzolk’in dates is added to each row.",
+        dest="column",
+        type=str,
+        default=None,
+    )
+    cmd_line_parser.add_argument(
+        "-d",
+        "--delimiter",
+        metavar="DELIMITER",
+        help="The delimiter of the CSV columns. The default is ','.",
+        dest="delimiter",
+        type=str,
+        default=",",
+    )
+    cmd_line_parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="JOBS",
+        help="Convert the input file using JOBS processes. The output is the same as with a single process. Only used if IN_FILE is a file, not stdin. CSV files must not contain line breaks inside of columns. The default is 1.",
+        dest="jobs",
+        type=int,
+        default=1,
+    )
+    cmd_line_parser.add_argument(
+        "-f",
+        "--fixed-width",
+        help="Memory map the input file and parse it as fixed width dates, each line holding exactly one date in the format YYYY-MM-DD or DD.MM.YYYY. Fast for big files, IN_FILE must be a file, not stdin.",
+        dest="fixed_width",
+        action="store_true",
+        default=False,
+    )
+    cmd_line_parser.add_argument(
+        "in_file",
+        metavar="IN_FILE",
+        nargs="?",
+        help="The file to read the gregorian dates from. The default is '-', stdin.",
+        default="-",
     )
 
-    cmdline_args = cmd_line_parser.parse_args()
+    cmdline_args = cmd_line_parser.parse_args(argv)
 
     return cmd_line_parser, cmdline_args
@@ -0,0 +1,762 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     convert.py
+# Date:     18.Oct.2026
+###############################################################################
+r"""Functions to convert files of gregorian dates to Tzolkin dates.
+
+The input is read line by line and the output is written after each line, so the
+memory usage does not depend on the size of the input. Lines that can't be parsed
+as gregorian date are reported, but do not stop the conversion.
+Big files can be converted using more than one process with `convertFileParallel`,
+files of fixed width dates are memory mapped and parsed from the bytes by
+`parseFixedWidthFile` and `convertFixedWidth`. `writeYearDays` writes the UTF-8
+encoded Tzolkin date strings of days in the Tzolkin year to binary files.
+
+Example:
+
+>>> import io
+>>> import sys
+>>> import tzolkin_calendar.convert
+>>> tzolkin_calendar.convert.convertLines(io.StringIO("23.05.2014\n2021-03-20\n"), sys.stdout, sys.stderr)
+2 Etzʼnabʼ
+12 Chuwen
+0
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import contextlib
+import csv
+import io
+import itertools
+import mmap
+import os
+from array import array
+from typing import (
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from tzolkin_calendar import TzolkinException
+from tzolkin_calendar.calculate import (
+    ORDINAL_OFFSET,
+    TZOLKIN_YEAR_LENGTH,
+    makeLabelBytesTable,
+    makeLabelTable,
+    ordinal2TzolkinDay,
+)
+from tzolkin_calendar.parse import parseGregorianDate
+
+# The name of the column added to CSV files holding the Tzolkin dates.
+TZOLKIN_COLUMN = "tzolkin"
+
+# The default size in bytes of the chunks of a file to convert in parallel.
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# The number of bytes of a fixed width date, without the line break.
+FIXED_DATE_WIDTH = 10
+
+# The number of days in the (non leap) year before the first day of each month,
+# index 0 is not used.
+__days_before_month: Tuple[int, ...] = (
+    0,
+    0,
+    31,
+    59,
+    90,
+    120,
+    151,
+    181,
+    212,
+    243,
+    273,
+    304,
+    334,
+    365,
+)
+
+# The Tzolkin date string of each day in the Tzolkin year.
+__tzolkin_labels: Tuple[str, ...] = makeLabelTable()
+
+# The output line of each day in the Tzolkin year, index 0 is the empty line of an
+# invalid date.
+__tzolkin_lines: Tuple[str, ...] = tuple(
+    "{tzolkin}\n".format(tzolkin=label) for label in makeLabelTable()
+)
+
+
+################################################################################
+def convertLines(
+    lines: Iterable[str], out_file: TextIO, err_file: TextIO, first_line: int = 1
+) -> int:
+    """Convert each of the given lines holding a gregorian date to a Tzolkin date and
+    write it as a line to `out_file`.
+    For each line of `lines` a line is written to `out_file`. If a line can't be
+    parsed as gregorian date, an empty line is written and the error is reported to
+    `err_file`. Empty lines are written as empty lines without reporting an error.
+
+    Args:
+        lines (Iterable[str]): The lines holding gregorian dates to convert. The same
+                               date formats as on the command line are accepted.
+        out_file (TextIO): The file to write the Tzolkin dates to.
+        err_file (TextIO): The file to write error messages to.
+        first_line (int, optional): The line number of the first line, used in the
+                                    error messages. Defaults to 1.
+
+    Returns:
+        int: The number of lines that could not be converted.
+    """
+    num_errors, _ = __convertLines(
+        lines=lines,
+        out_file=out_file,
+        on_error=lambda line, error: __printError(err_file, line, error),
+        first_line=first_line,
+    )
+
+    return num_errors
+
+
+################################################################################
+def convertCsv(
+    in_file: TextIO,
+    out_file: TextIO,
+    err_file: TextIO,
+    column: str,
+    delimiter: str = ",",
+) -> int:
+    """Convert the gregorian dates in the column `column` of the CSV file `in_file`
+    to Tzolkin dates.
+    Each row of `in_file` is written to `out_file` with the Tzolkin date appended as
+    additional column named `TZOLKIN_COLUMN`. If a date can't be parsed, the error is
+    reported to `err_file` and the Tzolkin date of this row is left empty. Rows
+    without a date are written without a Tzolkin date, but not reported.
+
+    Args:
+        in_file (TextIO): The CSV file to read, the first row must be the header.
+        out_file (TextIO): The file to write the CSV rows to.
+        err_file (TextIO): The file to write error messages to.
+        column (str): The name of the column holding the gregorian dates.
+        delimiter (str, optional): The delimiter of the CSV columns. Defaults to ",".
+
+    Returns:
+        int: The number of rows that could not be converted. -1 if the column
+            `column` does not exist.
+    """
+    reader = csv.reader(in_file, delimiter=delimiter)
+
+    column_idx = __writeCsvHeader(
+        next(reader, None), out_file, err_file, column, delimiter
+    )
+    if column_idx < 0:
+        return -1
+
+    num_errors, _ = __convertCsvRows(
+        reader=reader,
+        out_file=out_file,
+        on_error=lambda line, error: __printError(err_file, line, error),
+        column_idx=column_idx,
+        delimiter=delimiter,
+        first_line=0,
+    )
+
+    return num_errors
+
+
+################################################################################
+def convertFileParallel(
+    file_name: str,
+    out_file: TextIO,
+    err_file: TextIO,
+    jobs: int,
+    column: Optional[str] = None,
+    delimiter: str = ",",
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """Convert the file `file_name` using `jobs` processes.
+    The file is split into chunks of about `chunk_size` bytes, which end at line
+    boundaries. The chunks are converted in parallel and written in their original
+    order to `out_file`, the output and error messages are the same as those of
+    `convertLines` or, if `column` is not `None`, of `convertCsv`. At most two chunks
+    per process are converted or waiting to be written at the same time.
+    CSV files must not contain line breaks inside of columns.
+
+    Args:
+        file_name (str): The name of the UTF-8 encoded file to convert.
+        out_file (TextIO): The file to write the Tzolkin dates or CSV rows to.
+        err_file (TextIO): The file to write error messages to.
+        jobs (int): The number of processes to use.
+        column (Optional[str], optional): The name of the CSV column holding the
+                gregorian dates, `None` if the file holds one date per line.
+                Defaults to None.
+        delimiter (str, optional): The delimiter of the CSV columns. Defaults to ",".
+        chunk_size (int, optional): The size of the chunks in bytes. Defaults to
+                                    `CHUNK_SIZE`.
+
+    Returns:
+        int: The number of lines or rows that could not be converted. -1 if the
+            column `column` does not exist.
+    """
+    data_start = 0
+    column_idx = -1
+    line_offset = 0
+    if column is not None:
+        with open(file_name, "rb") as in_file:
+            header_line = in_file.readline()
+        data_start = len(header_line)
+        line_offset = 1
+        header = next(
+            csv.reader([header_line.decode("utf-8")], delimiter=delimiter), None
+        )
+        column_idx = __writeCsvHeader(header, out_file, err_file, column, delimiter)
+        if column_idx < 0:
+            return -1
+
+    num_errors = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: Deque[concurrent.futures.Future] = collections.deque()
+        for chunk_start, chunk_end in itertools.chain(
+            __chunkBoundaries(file_name, data_start, chunk_size), [(-1, -1)]
+        ):
+            if chunk_start >= 0:
+                pending.append(
+                    executor.submit(
+                        _convertChunk,
+                        file_name,
+                        chunk_start,
+                        chunk_end,
+                        column_idx,
+                        delimiter,
+                    )
+                )
+            while pending and (len(pending) >= 2 * jobs or chunk_start < 0):
+                out_str, errors, num_lines = pending.popleft().result()
+                out_file.write(out_str)
+                for line, error in errors:
+                    __printError(err_file, line + line_offset, error)
+                num_errors += len(errors)
+                line_offset += num_lines
+
+    return num_errors
+
+
+################################################################################
+def _convertChunk(
+    file_name: str, start: int, end: int, column_idx: int, delimiter: str
+) -> Tuple[str, List[Tuple[int, str]], int]:
+    """Convert the lines between the byte positions `start` and `end` of the file
+    `file_name`.
+    This is the function run in the worker processes of `convertFileParallel`.
+
+    Args:
+        file_name (str): The name of the file to convert.
+        start (int): The position of the first byte to convert.
+        end (int): The position after the last byte to convert.
+        column_idx (int): The index of the CSV column holding the dates, -1 if the
+                          file holds one date per line.
+        delimiter (str): The delimiter of the CSV columns.
+
+    Returns:
+        Tuple[str, List[Tuple[int, str]], int]: The converted output, the list of
+                errors as tuples of line number in the chunk and error message and the
+                number of lines in the chunk.
+    """
+    with open(file_name, "rb") as in_file:
+        in_file.seek(start)
+        in_str = in_file.read(end - start).decode("utf-8")
+
+    out_file = io.StringIO()
+    errors: List[Tuple[int, str]] = []
+    if column_idx < 0:
+        _, num_lines = __convertLines(
+            lines=io.StringIO(in_str, newline=""),
+            out_file=out_file,
+            on_error=lambda line, error: errors.append((line, error)),
+            first_line=1,
+        )
+    else:
+        _, num_lines = __convertCsvRows(
+            reader=csv.reader(io.StringIO(in_str, newline=""), delimiter=delimiter),
+            out_file=out_file,
+            on_error=lambda line, error: errors.append((line, error)),
+            column_idx=column_idx,
+            delimiter=delimiter,
+            first_line=0,
+        )
+
+    return out_file.getvalue(), errors, num_lines
+
+
+################################################################################
+def __chunkBoundaries(
+    file_name: str, start: int, chunk_size: int
+) -> Iterator[Tuple[int, int]]:
+    """Return the start and end positions of the chunks of the file `file_name`.
+    Each chunk ends after a newline or at the end of the file.
+
+    Args:
+        file_name (str): The name of the file to split into chunks.
+        start (int): The position of the first chunk.
+        chunk_size (int): The minimum size of a chunk in bytes.
+
+    Yields:
+        Iterator[Tuple[int, int]]: The start position and the position after the last
+                                    byte of each chunk.
+    """
+    file_size = os.path.getsize(file_name)
+    with open(file_name, "rb") as in_file:
+        chunk_start = start
+        while chunk_start < file_size:
+            chunk_end = chunk_start + max(chunk_size, 1)
+            if chunk_end < file_size:
+                in_file.seek(chunk_end - 1)
+                in_file.readline()
+                chunk_end = in_file.tell()
+            chunk_end = min(chunk_end, file_size)
+            yield chunk_start, chunk_end
+            chunk_start = chunk_end
+
+
+################################################################################
+def __convertLines(
+    lines: Iterable[str],
+    out_file: TextIO,
+    on_error: Callable[[int, str], None],
+    first_line: int,
+) -> Tuple[int, int]:
+    """Convert the lines holding gregorian dates and write the Tzolkin dates to
+    `out_file`, see `convertLines`.
+
+    Args:
+        lines (Iterable[str]): The lines holding gregorian dates to convert.
+        out_file (TextIO): The file to write the Tzolkin dates to.
+        on_error (Callable[[int, str], None]): Called with the line number and the
+                                                error message for each error.
+        first_line (int): The line number of the first line.
+
+    Returns:
+        Tuple[int, int]: The number of lines that could not be converted and the
+                        number of lines.
+    """
+    num_errors = 0
+    num_lines = 0
+    for num_lines, line in enumerate(lines, start=1):
+        date_str = line.strip()
+        tzolkin_str = ""
+        if date_str:
+            tzolkin_str, error = __convertDate(date_str)
+            if error:
+                num_errors += 1
+                on_error(num_lines + first_line - 1, error)
+
+        out_file.write(tzolkin_str)
+        out_file.write("\n")
+
+    return num_errors, num_lines
+
+
+################################################################################
+def __convertCsvRows(
+    reader: Iterator[List[str]],
+    out_file: TextIO,
+    on_error: Callable[[int, str], None],
+    column_idx: int,
+    delimiter: str,
+    first_line: int,
+) -> Tuple[int, int]:
+    """Convert the CSV rows and write them with the additional Tzolkin date column
+    to `out_file`, see `convertCsv`.
+
+    Args:
+        reader (Iterator[List[str]]): The `csv.reader` of the rows to convert.
+        out_file (TextIO): The file to write the CSV rows to.
+        on_error (Callable[[int, str], None]): Called with the line number and the
+                                                error message for each error.
+        column_idx (int): The index of the column holding the gregorian dates.
+        delimiter (str): The delimiter of the CSV columns.
+        first_line (int): The number of lines before the first line `reader` reads.
+
+    Returns:
+        Tuple[int, int]: The number of rows that could not be converted and the
+                        number of lines read.
+    """
+    writer = csv.writer(out_file, delimiter=delimiter, lineterminator="\n")
+
+    num_errors = 0
+    for row in reader:
+        date_str = row[column_idx].strip() if column_idx < len(row) else ""
+        tzolkin_str = ""
+        if date_str:
+            tzolkin_str, error = __convertDate(date_str)
+            if error:
+                num_errors += 1
+                on_error(reader.line_num + first_line, error)  # type: ignore
+
+        writer.writerow(row + [tzolkin_str])
+
+    return num_errors, reader.line_num  # type: ignore
+
+
+################################################################################
+def __writeCsvHeader(
+    header: Optional[List[str]],
+    out_file: TextIO,
+    err_file: TextIO,
+    column: str,
+    delimiter: str,
+) -> int:
+    """Write the CSV header with the additional Tzolkin date column to `out_file`
+    and return the index of the column `column`.
+
+    Args:
+        header (Optional[List[str]]): The CSV header, `None` if the file is empty.
+        out_file (TextIO): The file to write the header to.
+        err_file (TextIO): The file to write the error message to.
+        column (str): The name of the column holding the gregorian dates.
+        delimiter (str): The delimiter of the CSV columns.
+
+    Returns:
+        int: The index of the column `column`, -1 if it does not exist.
+    """
+    if header is None or column not in header:
+        print(
+            'error: column "{column}" not found in CSV header'.format(column=column),
+            file=err_file,
+        )
+        return -1
+
+    writer = csv.writer(out_file, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(header + [TZOLKIN_COLUMN])
+
+    return header.index(column)
+
+
+################################################################################
+def __convertDate(date_str: str) -> Tuple[str, str]:
+    """Return the Tzolkin date of the given gregorian date string as string.
+
+    Args:
+        date_str (str): The gregorian date string to convert.
+
+    Returns:
+        Tuple[str, str]: The Tzolkin date and the empty string on success, the empty
+                        string and the error message on errors.
+    """
+    try:
+        date = parseGregorianDate(date_str)
+        if date is not None:
+            return __tzolkin_labels[ordinal2TzolkinDay(date.toordinal())], ""
+
+        return "", 'error parsing date "{date}"'.format(date=date_str)
+    except ValueError as excp:
+        return "", 'error "{error}" parsing date "{date}"'.format(
+            error=excp, date=date_str
+        )
+
+
+################################################################################
+def __printError(err_file: TextIO, line_num: int, error: str) -> None:
+    """Print the error message with the line number to `err_file`.
+
+    Args:
+        err_file (TextIO): The file to print the error message to.
+        line_num (int): The line number of the error.
+        error (str): The error message.
+    """
+    print("{error} in line {line}".format(error=error, line=line_num), file=err_file)
+
+
+################################################################################
+def parseFixedWidthFile(file_name: str) -> array:
+    r"""Return the days in the Tzolkin year of the fixed width dates in the file
+    `file_name`.
+    Each line of the file must hold exactly one date, either in ISO format
+    'YYYY-MM-DD' or as 'DD.MM.YYYY', followed by '\n' or '\r\n'. The file is
+    memory mapped and parsed directly from the bytes, without generating a string
+    object per line, the results are stored in a preallocated `array.array`.
+
+    Args:
+        file_name (str): The name of the file to convert.
+
+    Raises:
+        TzolkinException: If the lines of the file are not of the same width or the
+                          width is not the one of a date.
+
+    Returns:
+        array: The `array.array` of type 'H' holding the day in the Tzolkin year of
+                the date in each line, 0 if the line does not hold a valid date.
+    """
+    with __mapFile(file_name) as data:
+        year_days, _ = __parseFixedWidth(data, file_name)
+
+    return year_days
+
+
+################################################################################
+def convertFixedWidth(file_name: str, out_file: TextIO, err_file: TextIO) -> int:
+    """Convert the file `file_name` of fixed width dates to Tzolkin dates.
+    The file is parsed using `parseFixedWidthFile`. For each line of the file a line
+    is written to `out_file`, same as `convertLines`. If a line doesn't hold a valid
+    date, an empty line is written and the error is reported to `err_file`.
+
+    Args:
+        file_name (str): The name of the file to convert.
+        out_file (TextIO): The file to write the Tzolkin dates to.
+        err_file (TextIO): The file to write error messages to.
+
+    Raises:
+        TzolkinException: If the lines of the file are not of the same width or the
+                          width is not the one of a date.
+
+    Returns:
+        int: The number of lines that could not be converted.
+    """
+    with __mapFile(file_name) as data:
+        year_days, line_length = __parseFixedWidth(data, file_name)
+        num_errors = year_days.count(0)
+        if num_errors > 0:
+            for line_idx, year_day in enumerate(year_days):
+                if year_day == 0:
+                    start = line_idx * line_length
+                    end = start + FIXED_DATE_WIDTH
+                    date_str = data[start:end].decode("utf-8", errors="replace").strip()
+                    __printError(
+                        err_file,
+                        line_idx + 1,
+                        'error parsing date "{date}"'.format(date=date_str),
+                    )
+
+    for start in range(0, len(year_days), 65536):
+        end = start + 65536
+        out_file.write("".join(map(__tzolkin_lines.__getitem__, year_days[start:end])))
+
+    return num_errors
+
+
+################################################################################
+def writeYearDays(
+    year_days: Iterable[int],
+    out_file: BinaryIO,
+    orthography: str = "modern",
+    glyphs: bool = False,
+) -> int:
+    """Write the Tzolkin date string of each day in the Tzolkin year in `year_days`
+    as line to the binary file `out_file`, UTF-8 encoded. A day of 0 yields an empty
+    line, like the invalid dates of `parseFixedWidthFile`.
+    The strings are the pre-encoded ones of `makeLabelBytesTable`, nothing is encoded
+    while writing.
+
+    Args:
+        year_days (Iterable[int]): The days in the Tzolkin year, between 0 and 260.
+        out_file (BinaryIO): The binary file to write the lines to.
+        orthography (str, optional): The orthography of the day names, see
+                                     `makeLabelTable`. Defaults to "modern".
+        glyphs (bool, optional): Append the day name glyph. Defaults to False.
+
+    Raises:
+        TzolkinException: If a day in the Tzolkin year is not between 0 and 260 or
+                            `orthography` is not known.
+
+    Returns:
+        int: The number of lines written.
+    """
+    lines = tuple(
+        label + b"\n" for label in makeLabelBytesTable(orthography, glyphs=glyphs)
+    )
+    day_iter = iter(year_days)
+    num_lines = 0
+    while True:
+        chunk = list(itertools.islice(day_iter, 65536))
+        if not chunk:
+            break
+
+        try:
+            if min(chunk) < 0:
+                raise IndexError
+            data = b"".join(map(lines.__getitem__, chunk))
+        except (IndexError, TypeError) as excp:
+            raise TzolkinException(
+                "the days in the Tzolkin year must be between 0 and {max}".format(
+                    max=TZOLKIN_YEAR_LENGTH
+                )
+            ) from excp
+
+        out_file.write(data)
+        num_lines += len(chunk)
+
+    return num_lines
+
+
+################################################################################
+def __monthData(year_month: int) -> Tuple[int, int]:
+    """Return the zero based day in the Tzolkin year of the day before the first day
+    of the given month and the number of days of the month.
+
+    Args:
+        year_month (int): The year times 100 plus the month.
+
+    Returns:
+        Tuple[int, int]: The zero based day in the Tzolkin year of the day before the
+                        first day of the month, and the number of days of the month.
+                        The number of days is 0, if the month is not valid.
+    """
+    year, month = divmod(year_month, 100)
+    if year == 0 or not 1 <= month <= 12:
+        return 0, 0
+
+    is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    leap_days = 1 if is_leap and month > 2 else 0
+    month_length = __days_before_month[month + 1] - __days_before_month[month]
+    if is_leap and month == 2:
+        month_length += 1
+
+    prev_year = year - 1
+    ordinal = (
+        prev_year * 365
+        + prev_year // 4
+        - prev_year // 100
+        + prev_year // 400
+        + __days_before_month[month]
+        + leap_days
+    )
+
+    return (ordinal + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH, month_length
+
+
+################################################################################
+@contextlib.contextmanager
+def __mapFile(file_name: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Memory map the file `file_name` read-only.
+
+    Args:
+        file_name (str): The name of the file to map.
+
+    Yields:
+        Iterator[Union[mmap.mmap, bytes]]: The mapped file, empty `bytes` if the file
+                                            is empty, as empty files can't be mapped.
+    """
+    with open(file_name, "rb") as in_file:
+        if os.fstat(in_file.fileno()).st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+################################################################################
+def __parseFixedWidth(
+    data: Union[mmap.mmap, bytes], file_name: str
+) -> Tuple[array, int]:
+    """Return the days in the Tzolkin year of the fixed width dates in `data`, see
+    `parseFixedWidthFile`.
+
+    Args:
+        data (Union[mmap.mmap, bytes]): The content of the file to parse.
+        file_name (str): The name of the file, used in error messages.
+
+    Raises:
+        TzolkinException: If the lines are not of the same width or the width is not
+                          the one of a date.
+
+    Returns:
+        Tuple[array, int]: The `array.array` of type 'H' holding the day in the
+                Tzolkin year of each line, 0 if the line does not hold a valid date,
+                and the length of a line including the line break in bytes.
+    """
+    size = len(data)
+    if size == 0:
+        return array("H"), 0
+
+    line_length = data.find(b"\n") + 1
+    if line_length == 0:
+        line_length = size + 1
+    if line_length - 1 not in (FIXED_DATE_WIDTH, FIXED_DATE_WIDTH + 1):
+        raise TzolkinException(
+            "{file} is not a file of fixed width dates, the first line has {width} bytes".format(
+                file=file_name, width=line_length - 1
+            )
+        )
+    newline_length = line_length - FIXED_DATE_WIDTH
+    num_lines = size // line_length
+    if size % line_length == FIXED_DATE_WIDTH and data[size - 1] != 10:
+        num_lines += 1
+    elif size % line_length != 0:
+        raise TzolkinException(
+            "{file} is not a file of fixed width dates, the last line has {width} bytes".format(
+                file=file_name, width=size % line_length
+            )
+        )
+
+    year_days = array("H", bytes(2 * num_lines))
+    # The zero based day in the Tzolkin year of the day before the first day of the
+    # month and the length of the month, by year and month.
+    month_cache: Dict[int, Tuple[int, int]] = {}
+    for line_idx in range(num_lines):
+        pos = line_idx * line_length
+        end = pos + FIXED_DATE_WIDTH
+        if end < size and (
+            data[end + newline_length - 1] != 10
+            or (newline_length == 2 and data[end] != 13)
+        ):
+            raise TzolkinException(
+                "{file} is not a file of fixed width dates, line {line} is not {width} bytes long".format(
+                    file=file_name, line=line_idx + 1, width=FIXED_DATE_WIDTH
+                )
+            )
+
+        # 45 is '-', 46 is '.' and 48 to 57 are the digits '0' to '9'.
+        if data[pos + 4] == 45 and data[pos + 7] == 45:
+            year_pos = pos
+            month_pos = pos + 5
+            day_pos = pos + 8
+        elif data[pos + 2] == 46 and data[pos + 5] == 46:
+            year_pos = pos + 6
+            month_pos = pos + 3
+            day_pos = pos
+        else:
+            continue
+
+        y0 = data[year_pos]
+        y1 = data[year_pos + 1]
+        y2 = data[year_pos + 2]
+        y3 = data[year_pos + 3]
+        m0 = data[month_pos]
+        m1 = data[month_pos + 1]
+        if not (
+            48 <= y0 <= 57
+            and 48 <= y1 <= 57
+            and 48 <= y2 <= 57
+            and 48 <= y3 <= 57
+            and 48 <= m0 <= 49
+            and 48 <= m1 <= 57
+        ):
+            continue
+
+        month_key = (y0 * 1000 + y1 * 100 + y2 * 10 + y3) * 100 + m0 * 10 + m1
+        month_data = month_cache.get(month_key)
+        if month_data is None:
+            # Subtract the value of the bytes of '0000' and '00'.
+            month_data = __monthData(month_key - 48 * 111100 - 48 * 11)
+            month_cache[month_key] = month_data
+
+        d0 = data[day_pos] - 48
+        d1 = data[day_pos + 1] - 48
+        day = d0 * 10 + d1
+        if 0 <= d0 <= 9 and 0 <= d1 <= 9 and 1 <= day <= month_data[1]:
+            year_days[line_idx] = (month_data[0] + day) % TZOLKIN_YEAR_LENGTH + 1
+
+    return year_days, line_length
@@ -11,365 +11,765 @@ as a script.
 
 from __future__ import annotations
 
-import argparse
+import contextlib
 import datetime
-import re
+import itertools
 import sys
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TextIO
 
 from tzolkin_calendar import USED_DATEFMT, TzolkinDate, TzolkinException
-from tzolkin_calendar.calculate import makeLookUpTable, parseTzolkinName
-from tzolkin_calendar.commandline import parseCommandline
+from tzolkin_calendar.calculate import (
+    TZOLKIN_YEAR_LENGTH,
+    makeLabelTable,
+    ordinal2TzolkinDay,
+)
+from tzolkin_calendar.clock import today
+from tzolkin_calendar.parse import parseGregorian, parseGregorianDate, parseTzolkin
 
-from .tzolkin import Tzolkin
+# `argparse`, `Tzolkin`, the command line parsers, the converters and the output
+# formats are imported when they are needed, to keep the startup of the common
+# cases fast.
+if TYPE_CHECKING:  # pragma: no cover
+    import argparse
 
-# Regexes to parse date strings, gregorian and Tzolkin dates.
-__gregorian_regex1 = re.compile(
-    r"^([0-3]?[0-9])[\t .\-]([0-1]?[0-9])[\t .\-]([0-9][0-9][0-9][0-9])",
-)
-__gregorian_regex2 = re.compile(
-    r"^([0-9][0-9][0-9][0-9])[\t .\-/]([0-1]?[0-9])[\t .\-/]([0-3]?[0-9])"
-)
-__gregorian_regex3 = re.compile(r"^([0-1]?[0-9])/([0-3]?[0-9])/([0-9][0-9][0-9][0-9])")
-__tzolkin_regex1 = re.compile(r"([0-1]?[0-9])[\t .\-/]([0-2]?[0-9])")
-__tzolkin_regex2 = re.compile(r"([0-1]?[0-9])[\t .\-/](\S+)")
+    from tzolkin_calendar.output import ResultWriter
+    from tzolkin_calendar.tzolkin import Tzolkin
 
 
 ################################################################################
-def main() -> None:
-    """Main function, called if this is called as a script and not imported."""
-    cmd_line_parser, cmdline_args = parseCommandline()
+def main(
+    argv: Optional[List[str]] = None,
+    stdout: Optional[TextIO] = None,
+    stdin: Optional[TextIO] = None,
+) -> int:
+    """Main function, called if this is called as a script and not imported.
+    Can be called in-process too, it never exits the process but returns the exit
+    code.
 
-    date_str = ""
-    if isinstance(cmdline_args.date, list):
-        date_str = " ".join(cmdline_args.date)
-    else:
-        date_str = cmdline_args.date
+    Args:
+        argv (Optional[List[str]], optional): The command line arguments, without the
+                                              program name. Defaults to None,
+                                              `sys.argv[1:]`.
+        stdout (Optional[TextIO], optional): The file to print the results and the
+                                             help text to. Defaults to None,
+                                             `sys.stdout`.
+        stdin (Optional[TextIO], optional): The file to read from if an input file
+                                            is '-'. Defaults to None, `sys.stdin`.
+
+    Returns:
+        int: The exit code, 0 on success, 2 on errors.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    out_file = sys.stdout if stdout is None else stdout
+    in_file = sys.stdin if stdin is None else stdin
+
+    try:
+        if argv[:1] == ["convert"]:
+            return __convert(argv[1:], out_file, in_file)
+
+        if __printTzolkinFast(argv, out_file):
+            return 0
+
+        return __runCommandline(argv, out_file, in_file)
+    except SystemExit as excp:
+        # `argparse` exits after printing the help, the version or an error.
+        return __exitCode(excp)
+
+
+################################################################################
+def __runCommandline(argv: List[str], out_file: TextIO, in_file: TextIO) -> int:
+    """Parse the command line `argv` and print the result.
+
+    Args:
+        argv (List[str]): The command line arguments, without the program name.
+        out_file (TextIO): The file to print the results to.
+        in_file (TextIO): The file to read the dates from in batch mode.
 
-    __displayYear(cmdline_args)
+    Returns:
+        int: The exit code, 0 on success, 2 on errors.
+    """
+    from tzolkin_calendar.commandline import parseCommandline
+    from tzolkin_calendar.output import makeResultWriter
 
-    __date2gregorian(cmd_line_parser, date_str)
+    cmd_line_parser, cmdline_args = parseCommandline(argv, out_file=out_file)
 
-    tzolkin_number, tzolkin_day_number = __date2Tzolkin(
-        cmd_line_parser, cmdline_args, date_str
+    writer = makeResultWriter(
+        cmdline_args.output_format, out_file, batch=cmdline_args.batch
     )
+    try:
+        if cmdline_args.display_year:
+            writer.writeYear()
+
+        if cmdline_args.batch:
+            return __batch(cmd_line_parser, cmdline_args, in_file, writer)
+
+        date_str = ""
+        if isinstance(cmdline_args.date, list):
+            date_str = " ".join(cmdline_args.date)
+        else:
+            date_str = cmdline_args.date
+
+        exit_code = __date2gregorian(cmd_line_parser, date_str, writer)
+        if exit_code is None:
+            exit_code = __date2Tzolkin(cmd_line_parser, cmdline_args, date_str, writer)
+        if exit_code is None:
+            exit_code = __nothingFound(cmd_line_parser, date_str, writer)
+
+        return exit_code
+    finally:
+        writer.close()
+
+
+################################################################################
+def __exitCode(excp: SystemExit) -> int:
+    """Return the exit code of the `SystemExit` exception `excp`, like the
+    interpreter does.
+
+    Args:
+        excp (SystemExit): The exception raised by `sys.exit`.
+
+    Returns:
+        int: The exit code, 0 if `excp` has no code, 1 if the code is a message.
+    """
+    if excp.code is None:
+        return 0
+    if isinstance(excp.code, int):
+        return excp.code
+
+    print(excp.code, file=sys.stderr)
+    return 1
 
-    __nothingFound(
-        cmd_line_parser=cmd_line_parser,
-        date_str=date_str,
-        tzolkin_number=tzolkin_number,
-        tzolkin_day_number=tzolkin_day_number,
+
+################################################################################
+def __printTzolkinFast(argv: List[str], out_file: TextIO) -> bool:
+    """Print the Tzolkin date of today, if `argv` is empty, or of the gregorian date
+    `argv` if it is a single valid date of the form 'DD.MM.YYYY' or 'YYYY-MM-DD'.
+    The output is the same as the one of `__printTzolkinSingle`, but neither the
+    command line parser nor `Tzolkin` are needed.
+
+    Args:
+        argv (List[str]): The command line arguments.
+        out_file (TextIO): The file to print the result to.
+
+    Returns:
+        bool: `True` if the Tzolkin date has been printed, `False` if `argv` has to be
+                parsed by the command line parser.
+    """
+    if not argv:
+        date: Optional[datetime.date] = today()
+        date_str = date.strftime(USED_DATEFMT)
+    elif len(argv) == 1:
+        date_str = argv[0]
+        date = __parseSimpleDate(date_str)
+    else:
+        return False
+
+    if date is None:
+        return False
+
+    print(
+        'Gregorian "{greg}" is "{tzolk}" as Tzolk’in'.format(
+            greg=date_str,
+            tzolk=makeLabelTable()[ordinal2TzolkinDay(date.toordinal())],
+        ),
+        file=out_file,
     )
+    return True
 
 
 ################################################################################
-def __date2Tzolkin(
-    cmd_line_parser: argparse.ArgumentParser,
-    cmdline_args: argparse.Namespace,
-    date_str: str,
-) -> Tuple[int, int]:
-    """Try to parse the given date string as a Tzolkin date and display the next and
-    last gregorian dates with the same Tzolkin date.
+def __parseSimpleDate(date_str: str) -> Optional[datetime.date]:
+    """Return the date of a string of the form 'DD.MM.YYYY' or 'YYYY-MM-DD'.
 
     Args:
-        cmd_line_parser (argparse.ArgumentParser): The command line parser object.
-        cmdline_args (argparse.Namespace): The object holding all command line arguments.
-        date_str (str): The Tzolkin date string to parse.
+        date_str (str): The string to parse.
 
     Returns:
-        Tuple[int, int]: The Tzolkin day number and day name number on success, the
-        tuple (0, 0) if no Tzolkin date could be parsed.
+        Optional[datetime.date]: The date, `None` if `date_str` is not a valid date
+                                of one of the two forms.
     """
-    tzolkin_number, tzolkin_day_number = __parseTzolkin(date_str=date_str)
-    if tzolkin_number * tzolkin_day_number != 0:
-        __searchTzolkinDates(
-            cmd_line_parser,
-            cmdline_args,
-            date_str,
-            TzolkinDate(number=tzolkin_number, name=tzolkin_day_number),
-        )
+    if len(date_str) != 10 or not date_str.isascii():
+        return None
 
-    return tzolkin_number, tzolkin_day_number
+    if date_str[2] == "." and date_str[5] == ".":
+        day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+    elif date_str[4] == "-" and date_str[7] == "-":
+        year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+    else:
+        return None
+
+    if not (day.isdigit() and month.isdigit() and year.isdigit()):
+        return None
+
+    try:
+        return datetime.date(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
 
 ################################################################################
-def __searchTzolkinDates(
+def __convert(argv: List[str], std_out: TextIO, std_in: TextIO) -> int:
+    """Run the subcommand `convert`, convert a file of gregorian dates to Tzolkin
+    dates.
+
+    Args:
+        argv (List[str]): The command line arguments after `convert`.
+        std_out (TextIO): The file to write to if the output file is '-'.
+        std_in (TextIO): The file to read from if the input file is '-'.
+
+    Returns:
+        int: The exit code, 0 on success, 2 if a date could not be converted.
+    """
+    from tzolkin_calendar.commandline import parseConvertCommandline
+
+    cmd_line_parser, convert_args = parseConvertCommandline(argv, out_file=std_out)
+
+    if convert_args.jobs < 1:
+        cmd_line_parser.error("the number of jobs must be at least 1")
+
+    if convert_args.fixed_width:
+        if convert_args.in_file == "-" or convert_args.column is not None:
+            cmd_line_parser.error(
+                "--fixed-width needs an input file and can't be used with --column"
+            )
+        return __convertFixedWidth(convert_args, std_out)
+
+    if convert_args.jobs > 1 and convert_args.in_file != "-":
+        return __convertParallel(convert_args, std_out)
+
+    with contextlib.ExitStack() as stack:
+        try:
+            in_file = __openFile(stack, convert_args.in_file, "r", std_in)
+            out_file = __openFile(stack, convert_args.out_file, "w", std_out)
+        except OSError as excp:
+            print('error "{error}" opening file'.format(error=excp), file=sys.stderr)
+            return 2
+
+        from tzolkin_calendar.convert import convertCsv, convertLines
+
+        if convert_args.column is None:
+            num_errors = convertLines(in_file, out_file, sys.stderr)
+        else:
+            num_errors = convertCsv(
+                in_file,
+                out_file,
+                sys.stderr,
+                column=convert_args.column,
+                delimiter=convert_args.delimiter,
+            )
+
+    return 0 if num_errors == 0 else 2
+
+
+################################################################################
+def __convertParallel(convert_args: argparse.Namespace, std_out: TextIO) -> int:
+    """Run the subcommand `convert` using more than one process.
+
+    Args:
+        convert_args (argparse.Namespace): The parsed command line arguments of
+                                            `convert`.
+        std_out (TextIO): The file to write to if the output file is '-'.
+
+    Returns:
+        int: The exit code, 0 on success, 2 if a date could not be converted.
+    """
+    from tzolkin_calendar.convert import convertFileParallel
+
+    with contextlib.ExitStack() as stack:
+        try:
+            out_file = __openFile(stack, convert_args.out_file, "w", std_out)
+            num_errors = convertFileParallel(
+                convert_args.in_file,
+                out_file,
+                sys.stderr,
+                jobs=convert_args.jobs,
+                column=convert_args.column,
+                delimiter=convert_args.delimiter,
+            )
+        except OSError as excp:
+            print('error "{error}" opening file'.format(error=excp), file=sys.stderr)
+            return 2
+
+    return 0 if num_errors == 0 else 2
+
+
+################################################################################
+def __convertFixedWidth(convert_args: argparse.Namespace, std_out: TextIO) -> int:
+    """Run the subcommand `convert` on a memory mapped file of fixed width dates.
+
+    Args:
+        convert_args (argparse.Namespace): The parsed command line arguments of
+                                            `convert`.
+        std_out (TextIO): The file to write to if the output file is '-'.
+
+    Returns:
+        int: The exit code, 0 on success, 2 if a date could not be converted.
+    """
+    from tzolkin_calendar.convert import convertFixedWidth
+
+    with contextlib.ExitStack() as stack:
+        try:
+            out_file = __openFile(stack, convert_args.out_file, "w", std_out)
+            num_errors = convertFixedWidth(convert_args.in_file, out_file, sys.stderr)
+        except OSError as excp:
+            print('error "{error}" opening file'.format(error=excp), file=sys.stderr)
+            return 2
+        except TzolkinException as excp:
+            print("error: {error}".format(error=excp), file=sys.stderr)
+            return 2
+
+    return 0 if num_errors == 0 else 2
+
+
+################################################################################
+def __openFile(
+    stack: contextlib.ExitStack, file_name: str, mode: str, std_file: TextIO
+) -> TextIO:
+    """Return the opened file `file_name`, or `std_file` if `file_name` is '-'.
+
+    Args:
+        stack (contextlib.ExitStack): The stack that closes the opened file.
+        file_name (str): The name of the file to open, '-' for `std_file`.
+        mode (str): The mode to open the file with, 'r' or 'w'.
+        std_file (TextIO): The file to return if `file_name` is '-'.
+
+    Returns:
+        TextIO: The opened file.
+    """
+    if file_name == "-":
+        return std_file
+
+    return stack.enter_context(open(file_name, mode, encoding="utf-8", newline=""))
+
+
+################################################################################
+def __batch(
     cmd_line_parser: argparse.ArgumentParser,
     cmdline_args: argparse.Namespace,
-    date_str: str,
-    tzolkin_date: TzolkinDate,
-) -> None:
-    """Search for gregorian dates with the same Tzolkin date as the given one.
+    in_file: TextIO,
+    writer: ResultWriter,
+) -> int:
+    """Answer each date argument as a query of its own, in batch mode. The argument
+    '-' reads one query per line from `in_file`, without arguments all queries are
+    read from `in_file`.
+    For each query a result is written using `writer`, in the text format a single
+    line. If a query can't be answered, the error is written, in the text format an
+    empty line, and reported to stderr. Empty queries are written as empty lines in
+    the text format without reporting an error.
 
     Args:
         cmd_line_parser (argparse.ArgumentParser): The command line parser object.
         cmdline_args (argparse.Namespace): The object holding all command line arguments.
-        date_str (str): The Tzolkin date string to parse.
-        tzolkin_date (TzolkinDate): The Tzolkin date to search for.
+        in_file (TextIO): The file to read the queries from for the argument '-'.
+        writer (ResultWriter): The writer of the output format.
+
+    Returns:
+        int: The exit code, 0 on success, 2 if a query could not be answered.
     """
     try:
-        if cmdline_args.start_date is not None:
-            start_date = datetime.datetime.strptime(
-                __parseGregorian(cmdline_args.start_date), USED_DATEFMT
-            ).date()
-        else:
-            start_date = datetime.date.today()
-        tzolkin = Tzolkin(number=tzolkin_date.number, name_number=tzolkin_date.name)
-        if cmdline_args.list_size is None:
-            __printTzolkin(start_date=start_date, tzolkin=tzolkin)
-        else:
-            __printTzolkinList(
-                cmdline_args=cmdline_args,
-                start_date=start_date,
-                tzolkin=tzolkin,
-            )
+        start_date = __startDate(cmdline_args)
     except TzolkinException as excp:
-        __errorParsingTzolkin(cmd_line_parser, date_str, excp)
+        cmd_line_parser.error(str(excp))
+
+    queries = cmdline_args.date if isinstance(cmdline_args.date, list) else []
+
+    num_errors = 0
+    for line_num, query in enumerate(__iterQueries(queries or ["-"], in_file), 1):
+        date_str = query.strip()
+        if not date_str:
+            writer.writeEmpty()
+            continue
+
+        error = __answerQuery(cmdline_args, start_date, date_str, writer)
+        if error:
+            num_errors += 1
+            writer.writeError(date_str, error)
+            print(
+                "{error} in line {line}".format(error=error, line=line_num),
+                file=sys.stderr,
+            )
+
+    return 0 if num_errors == 0 else 2
 
 
 ################################################################################
-def __date2gregorian(cmd_line_parser: argparse.ArgumentParser, date_str: str) -> None:
-    """Try to parse the given date as a gregorian date and convert it to a Tzolkin date.
+def __iterQueries(queries: Iterable[str], in_file: TextIO) -> Iterator[str]:
+    """Return the queries of batch mode, the query '-' is replaced by the lines of
+    `in_file`.
 
     Args:
-        cmd_line_parser (argparse.ArgumentParser): The command line parser object.
-        date_str (str): The string to try to parse as a gregorian date.
+        queries (Iterable[str]): The date arguments of the command line.
+        in_file (TextIO): The file to read the queries from for the argument '-'.
+
+    Yields:
+        Iterator[str]: The queries.
     """
-    parsed_date = __parseGregorian(date_str=date_str)
+    for query in queries:
+        if query == "-":
+            yield from in_file
+        else:
+            yield query
+
+
+################################################################################
+def __answerQuery(
+    cmdline_args: argparse.Namespace,
+    start_date: datetime.date,
+    date_str: str,
+    writer: ResultWriter,
+) -> str:
+    """Write the result of the gregorian or Tzolkin date `date_str` in batch mode,
+    the same as without batch mode.
+
+    Args:
+        cmdline_args (argparse.Namespace): The object holding all command line arguments.
+        start_date (datetime.date): The gregorian date to start the search on.
+        date_str (str): The gregorian or Tzolkin date string to parse.
+        writer (ResultWriter): The writer of the output format.
+
+    Returns:
+        str: The empty string on success, the error message on errors, including
+             dates outside of the range of `datetime.date`.
+    """
+    from tzolkin_calendar.tzolkin import Tzolkin
+
     try:
+        parsed_date = parseGregorian(date_str=date_str)
         if parsed_date is not None:
-            __printTzolkinSingle(date_str, parsed_date)
-    except Exception as excp:
-        __errorParsingDate(cmd_line_parser, parsed_date, excp)
+            __writeGregorian(writer, date_str, parsed_date)
+            return ""
+
+        tzolkin_number, tzolkin_day_number = parseTzolkin(date_str=date_str)
+        if tzolkin_number * tzolkin_day_number == 0:
+            return 'error parsing date "{date}"'.format(date=date_str)
+
+        __writeTzolkin(
+            writer,
+            cmdline_args.list_size,
+            date_str,
+            start_date,
+            Tzolkin(number=tzolkin_number, name_number=tzolkin_day_number),
+        )
+        return ""
+    except (TzolkinException, ValueError, OverflowError) as excp:
+        return 'error "{error}" parsing date "{date}"'.format(error=excp, date=date_str)
 
 
 ################################################################################
-def __errorParsingDate(
-    cmd_line_parser: argparse.ArgumentParser, parsed_date: str, excp: TzolkinException
-) -> None:
-    """Print the error message of `TzolkinException` and exit.
+def __startDate(cmdline_args: argparse.Namespace) -> datetime.date:
+    """Return the start date of the search for Tzolkin dates, the date of today if
+    no start date has been given.
 
     Args:
-        cmd_line_parser (argparse.ArgumentParser): The command line parser object.
-        parsed_date (str): The string that failed to be parsed.
-        excp (TzolkinException): The raised exception.
+        cmdline_args (argparse.Namespace): The object holding all command line arguments.
+
+    Raises:
+        TzolkinException: If the start date is not a valid gregorian date.
+
+    Returns:
+        datetime.date: The start date of the search.
     """
-    print(
-        'error "{error}" parsing date "{date}". Exiting'.format(
-            error=excp, date=parsed_date
-        ),
-        file=sys.stderr,
-    )
-    cmd_line_parser.print_help()
-    sys.exit(2)
+    if cmdline_args.start_date is None:
+        return today()
+
+    try:
+        start_date = parseGregorianDate(cmdline_args.start_date)
+    except ValueError as excp:
+        raise TzolkinException(
+            'invalid start date "{date}": {error}'.format(
+                date=cmdline_args.start_date, error=excp
+            )
+        ) from excp
+
+    if start_date is None:
+        raise TzolkinException(
+            'invalid start date "{date}"'.format(date=cmdline_args.start_date)
+        )
+
+    return start_date
 
 
 ################################################################################
-def __errorParsingTzolkin(
-    cmd_line_parser: argparse.ArgumentParser, date_str: str, excp: TzolkinException
-) -> None:
-    """Display the error message of the TzolkinException and exit.
+def __date2Tzolkin(
+    cmd_line_parser: argparse.ArgumentParser,
+    cmdline_args: argparse.Namespace,
+    date_str: str,
+    writer: ResultWriter,
+) -> Optional[int]:
+    """Try to parse the given date string as a Tzolkin date and display the next and
+    last gregorian dates with the same Tzolkin date.
 
     Args:
         cmd_line_parser (argparse.ArgumentParser): The command line parser object.
-        date_str (str): The string that failed to be parsed.
-        excp (TzolkinException): The raised exception.
+        cmdline_args (argparse.Namespace): The object holding all command line arguments.
+        date_str (str): The Tzolkin date string to parse.
+        writer (ResultWriter): The writer of the output format.
+
+    Returns:
+        Optional[int]: The exit code if `date_str` is a Tzolkin date, `None` if no
+                       Tzolkin date could be parsed.
     """
-    print(
-        'error "{error}" parsing Tzolk’in date "{date}"'.format(
-            error=excp,
-            date=date_str,
-        ),
-        file=sys.stderr,
+    tzolkin_number, tzolkin_day_number = parseTzolkin(date_str=date_str)
+    if tzolkin_number * tzolkin_day_number == 0:
+        return None
+
+    return __searchTzolkinDates(
+        cmd_line_parser,
+        cmdline_args,
+        date_str,
+        TzolkinDate(number=tzolkin_number, name=tzolkin_day_number),
+        writer,
     )
-    cmd_line_parser.print_help()
-    sys.exit(2)
 
 
 ################################################################################
-def __printTzolkinSingle(date_str: str, parsed_date: str) -> None:
-    """Print the converted gregorian date as Tzolkin date and exit.
+def __searchTzolkinDates(
+    cmd_line_parser: argparse.ArgumentParser,
+    cmdline_args: argparse.Namespace,
+    date_str: str,
+    tzolkin_date: TzolkinDate,
+    writer: ResultWriter,
+) -> int:
+    """Search for gregorian dates with the same Tzolkin date as the given one.
 
     Args:
-        date_str (str): The given gregorian string.
-        parsed_date (str): The parsed result of the given gregorian string.
+        cmd_line_parser (argparse.ArgumentParser): The command line parser object.
+        cmdline_args (argparse.Namespace): The object holding all command line arguments.
+        date_str (str): The Tzolkin date string to parse.
+        tzolkin_date (TzolkinDate): The Tzolkin date to search for.
+        writer (ResultWriter): The writer of the output format.
+
+    Returns:
+        int: The exit code, 0 on success, 2 on errors.
     """
-    print(
-        'Gregorian "{greg}" is "{tzolk}" as Tzolk’in'.format(
-            greg=date_str,
-            tzolk=Tzolkin.fromDateString(date_str=parsed_date, fmt="%d.%m.%Y"),
+    from tzolkin_calendar.tzolkin import Tzolkin
+
+    try:
+        __writeTzolkin(
+            writer,
+            cmdline_args.list_size,
+            date_str,
+            __startDate(cmdline_args),
+            Tzolkin(number=tzolkin_date.number, name_number=tzolkin_date.name),
         )
-    )
-    sys.exit(0)
+        return 0
+    except TzolkinException as excp:
+        return __errorParsingTzolkin(cmd_line_parser, date_str, excp, writer)
 
 
 ################################################################################
-def __parseTzolkin(date_str: str) -> Tuple[int, int]:
-    """Parse the given string to find a Tzolkin date string.
+def __date2gregorian(
+    cmd_line_parser: argparse.ArgumentParser, date_str: str, writer: ResultWriter
+) -> Optional[int]:
+    """Try to parse the given date as a gregorian date and convert it to a Tzolkin date.
 
     Args:
-        date_str (str): The string to parse for a Tzolkin day string of the form
-                        'NUMBER DAY_NAME'
+        cmd_line_parser (argparse.ArgumentParser): The command line parser object.
+        date_str (str): The string to try to parse as a gregorian date.
+        writer (ResultWriter): The writer of the output format.
+
     Returns:
-        Tuple[int, int]: Returns the Tzolkin day number and Tzolkin day name number as a
-                        Tuple.
+        Optional[int]: The exit code if `date_str` is a gregorian date, `None` if no
+                       gregorian date could be parsed.
     """
-    tzolkin_number = 0
-    tzolkin_day_number = 0
-    result = __tzolkin_regex1.search(date_str)
+    parsed_date = parseGregorian(date_str=date_str)
+    if parsed_date is None:
+        return None
 
-    if result:
-        tzolkin_number = int(result.group(1))
-        tzolkin_day_number = int(result.group(2))
+    try:
+        __writeGregorian(writer, date_str, parsed_date)
+        return 0
+    except Exception as excp:
+        return __errorParsingDate(cmd_line_parser, date_str, parsed_date, excp, writer)
 
-        return tzolkin_number, tzolkin_day_number
 
-    result = __tzolkin_regex2.search(date_str)
-    if result:
-        tzolkin_number = int(result.group(1))
-        tzolkin_day_name = result.group(2)
-        tzolkin_day_number = parseTzolkinName(tzolkin_day_name)
+################################################################################
+def __writeGregorian(writer: ResultWriter, date_str: str, parsed_date: str) -> None:
+    """Write the converted gregorian date as Tzolkin date.
+
+    Args:
+        writer (ResultWriter): The writer of the output format.
+        date_str (str): The given gregorian string.
+        parsed_date (str): The parsed result of the given gregorian string.
 
-    return tzolkin_number, tzolkin_day_number
+    Raises:
+        ValueError: If `parsed_date` is not a valid date.
+    """
+    date = datetime.datetime.strptime(parsed_date, USED_DATEFMT).date()
+    writer.writeGregorian(date_str, date, ordinal2TzolkinDay(date.toordinal()))
 
 
 ################################################################################
-def __printTzolkin(
+def __writeTzolkin(
+    writer: ResultWriter,
+    list_size: Optional[int],
+    date_str: str,
     start_date: datetime.date,
     tzolkin: Tzolkin,
 ) -> None:
-    """Print the next and last dates with the same tzolkin date as the given one.
+    """Write the next and last dates with the same Tzolkin date as the given one.
+    The dates are generated while they are written.
 
     Args:
-        tzolkin_number (int): [description]
-        tzolkin_day_number (int): [description]
-        start_date (datetime.date): [description]
-        tzolkin (Tzolkin): [description]
+        writer (ResultWriter): The writer of the output format.
+        list_size (Optional[int]): The number of next and last dates to write, `None`
+                                   for a single next and last date.
+        date_str (str): The given Tzolkin date string.
+        start_date (datetime.date): The gregorian date to start the search on.
+        tzolkin (Tzolkin): The Tzolkin date to search for.
+
+    Raises:
+        TzolkinException: If not all dates to write are in the range of
+                          `datetime.date`.
     """
-    last_date = tzolkin.getLastDate(start_date=start_date).strftime(USED_DATEFMT)
-    next_date = tzolkin.getNextDate(start_date=start_date).strftime(USED_DATEFMT)
-    print(
-        'Tzolk’in date "{tzolk}" next date is "{next}", last date has been "{last}"'.format(
-            tzolk=tzolkin, next=next_date, last=last_date
-        )
+    num_dates = 1 if list_size is None else max(list_size, 0)
+    if num_dates > 0:
+        __checkDateRange(start_date, tzolkin, num_dates)
+
+    writer.writeTzolkin(
+        date_str,
+        tzolkin.getTzolkinYearDay(),
+        start_date,
+        itertools.islice(tzolkin.iterNextDates(start_date=start_date), num_dates),
+        itertools.islice(tzolkin.iterLastDates(start_date=start_date), num_dates),
+        as_list=list_size is not None,
     )
-    sys.exit(0)
 
 
 ################################################################################
-def __printTzolkinList(
-    cmdline_args: argparse.Namespace,
-    start_date: datetime.date,
-    tzolkin: Tzolkin,
+def __checkDateRange(
+    start_date: datetime.date, tzolkin: Tzolkin, num_dates: int
 ) -> None:
-    """Print the list of dates with the same Tzolkin date as the given one.
+    """Check that the `num_dates` next and last dates with the same Tzolkin date as
+    the given one are in the range of `datetime.date`, before any of them is
+    written. The iterators of the dates stop at the end of the range without an
+    error.
 
     Args:
-        cmdline_args (argparse.Namespace): The command line arguments in a `Namespace` object.
-        tzolkin_number (int): The number of the Tzolkin day to search.
-        tzolkin_day_number (int): The day name number of the tzolkin day to search.
         start_date (datetime.date): The gregorian date to start the search on.
-        tzolkin (Tzolkin): [description]
+        tzolkin (Tzolkin): The Tzolkin date to search for.
+        num_dates (int): The number of next and last dates, at least 1.
+
+    Raises:
+        TzolkinException: If not all dates are in the range of `datetime.date`.
     """
-    last_date_list = tzolkin.getLastDateList(
-        start_date=start_date, list_size=cmdline_args.list_size
-    )
-    next_date_list = tzolkin.getNextDateList(
-        start_date=start_date, list_size=cmdline_args.list_size
-    )
-    print(
-        'Tzolk’in date "{tzolk}"\n next dates are {next}\n last dates have been {last}'.format(
-            tzolk=tzolkin,
-            next=[a.strftime(USED_DATEFMT) for a in next_date_list],
-            last=[a.strftime(USED_DATEFMT) for a in last_date_list],
+    span = (num_dates - 1) * TZOLKIN_YEAR_LENGTH
+    try:
+        in_range = (
+            tzolkin.getNextDate(start_date=start_date).toordinal() + span
+            <= datetime.date.max.toordinal()
+            and tzolkin.getLastDate(start_date=start_date).toordinal() - span
+            >= datetime.date.min.toordinal()
+        )
+    except OverflowError:
+        in_range = False
+
+    if not in_range:
+        raise TzolkinException(
+            "not all {num} next and last dates of {tzolkin} are between {min} and {max}".format(
+                num=num_dates,
+                tzolkin=tzolkin,
+                min=datetime.date.min.isoformat(),
+                max=datetime.date.max.isoformat(),
+            )
         )
-    )
-    sys.exit(0)
 
 
 ################################################################################
-def __nothingFound(
+def __errorParsingDate(
     cmd_line_parser: argparse.ArgumentParser,
     date_str: str,
-    tzolkin_number: int,
-    tzolkin_day_number: int,
-) -> None:
-    """Exit with an error if no date has been found.
+    parsed_date: str,
+    excp: Exception,
+    writer: ResultWriter,
+) -> int:
+    """Print the error message of the exception `excp` and the help text.
 
     Args:
-        cmd_line_parser (argparse.ArgumentParser): The command line parser instance.
-        date_str (str): The date string to parse.
-        tzolkin_number (int): The Tzolkin day number.
-        tzolkin_day_number (int): The number of the Tzolkin day name.
+        cmd_line_parser (argparse.ArgumentParser): The command line parser object.
+        date_str (str): The given gregorian string.
+        parsed_date (str): The string that failed to be parsed.
+        excp (Exception): The raised exception.
+        writer (ResultWriter): The writer of the output format.
+
+    Returns:
+        int: The exit code 2.
     """
-    if tzolkin_number * tzolkin_day_number == 0:
-        print('Error parsing date "{date}"'.format(date=date_str), file=sys.stderr)
-        cmd_line_parser.print_help()
-        sys.exit(2)
+    error = 'error "{error}" parsing date "{date}". Exiting'.format(
+        error=excp, date=parsed_date
+    )
+    print(error, file=sys.stderr)
+    return __printHelp(cmd_line_parser, writer, date_str, error)
 
 
 ################################################################################
-def __parseGregorian(date_str: str) -> Optional[str]:
-    """Tries to parse the given string as a gregorian date.
-    Return the string 'DD.MM.YYYY' on success, `None`else.
+def __errorParsingTzolkin(
+    cmd_line_parser: argparse.ArgumentParser,
+    date_str: str,
+    excp: TzolkinException,
+    writer: ResultWriter,
+) -> int:
+    """Display the error message of the TzolkinException and the help text.
 
     Args:
-        date_str (str): The string to parse
+        cmd_line_parser (argparse.ArgumentParser): The command line parser object.
+        date_str (str): The string that failed to be parsed.
+        excp (TzolkinException): The raised exception.
+        writer (ResultWriter): The writer of the output format.
 
     Returns:
-        Optional[str]: The string 'DD.MM.YYYY' on success, `None`else.
+        int: The exit code 2.
     """
-    day = ""
-    month = ""
-    year = ""
-    result = __gregorian_regex1.search(date_str)
-    if result:
-        day = result.group(1)
-        month = result.group(2)
-        year = result.group(3)
-        return ".".join([day, month, year])
-
-    result = __gregorian_regex2.search(date_str)
-    if result:
-        day = result.group(3)
-        month = result.group(2)
-        year = result.group(1)
-        return ".".join([day, month, year])
-
-    result = __gregorian_regex3.search(date_str)
-    if result:
-        day = result.group(2)
-        month = result.group(1)
-        year = result.group(3)
-        return ".".join([day, month, year])
-
-    return None
+    error = 'error "{error}" parsing Tzolk’in date "{date}"'.format(
+        error=excp,
+        date=date_str,
+    )
+    print(error, file=sys.stderr)
+    return __printHelp(cmd_line_parser, writer, date_str, error)
 
 
 ################################################################################
-def __displayYear(cmdline_args: argparse.Namespace) -> None:
-    """If the argument 'show year' has been given, display all days of a Tzolkin year.
+def __nothingFound(
+    cmd_line_parser: argparse.ArgumentParser, date_str: str, writer: ResultWriter
+) -> int:
+    """Print an error if no date has been found.
 
     Args:
-        cmdline_args (argparse.Namespace): The object holding all command line
-                            arguments.
-    """
-    if cmdline_args.display_year:
-        year_dict = makeLookUpTable()
+        cmd_line_parser (argparse.ArgumentParser): The command line parser instance.
+        date_str (str): The date string to parse.
+        writer (ResultWriter): The writer of the output format.
 
-        __displayYearList(year_dict)
+    Returns:
+        int: The exit code 2.
+    """
+    error = 'Error parsing date "{date}"'.format(date=date_str)
+    print(error, file=sys.stderr)
+    return __printHelp(cmd_line_parser, writer, date_str, error)
 
 
 ################################################################################
-def __displayYearList(year_dict: Dict[int, TzolkinDate]) -> None:
-    """Display the list of Tzolkin days in a Tzolkin year.
+def __printHelp(
+    cmd_line_parser: argparse.ArgumentParser,
+    writer: ResultWriter,
+    date_str: str,
+    error: str,
+) -> int:
+    """Print the help text after an error, or write the error using `writer` if the
+    output format is machine-readable.
 
     Args:
-        year_dict (Dict[int, TzolkinDate]): The dictionary of days in a Tzolkin year.
+        cmd_line_parser (argparse.ArgumentParser): The command line parser instance.
+        writer (ResultWriter): The writer of the output format.
+        date_str (str): The date string that failed to be parsed.
+        error (str): The error message.
+
+    Returns:
+        int: The exit code 2.
     """
-    key_string = ""
-    for key in year_dict:
-        key_string = " ".join([key_string, year_dict[key].__repr__()])
-        if key % 13 == 0:
-            print(key_string)
-            key_string = ""
+    if writer.machine_readable:
+        writer.writeError(date_str, error)
+    else:
+        cmd_line_parser.print_help(file=writer.out_file)
+
+    return 2
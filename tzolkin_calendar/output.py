@@ -0,0 +1,550 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     output.py
+# Date:     18.Oct.2026
+###############################################################################
+"""The output formats of the command line client: text, JSON, NDJSON and CSV.
+
+Each format is written by a `ResultWriter`, returned by `makeResultWriter`. The
+results are written to the output file as soon as they are calculated, lists of
+dates are written date by date from the iterators they are generated by. The
+machine-readable formats use ISO dates 'YYYY-MM-DD'.
+
+JSON and NDJSON records are objects with the key `type`:
+
+=========== ==================================================================
+type        Keys
+=========== ==================================================================
+gregorian   query, date, tzolkin, year_day, number, name
+tzolkin     query, tzolkin, year_day, number, name, start, next, last
+year        tzolkin, year_day, number, name
+error       query, error
+=========== ==================================================================
+
+`next` and `last` are lists of dates. JSON writes all records as a single array,
+NDJSON one record per line. CSV writes a row per date with the columns of
+`CSV_COLUMNS`, the next and last dates of a Tzolkin date are rows of the types
+`next` and `last`.
+
+Example:
+
+>>> import datetime
+>>> import sys
+>>> from tzolkin_calendar.output import makeResultWriter
+>>> writer = makeResultWriter("ndjson", sys.stdout)
+>>> writer.writeGregorian("20.03.2021", datetime.date(2021, 3, 20), 51)
+{"type": "gregorian", "query": "20.03.2021", "date": "2021-03-20", "tzolkin": "12 Chuwen", "year_day": 51, "number": 12, "name": "Chuwen"}
+"""
+
+from __future__ import annotations
+
+import abc
+import csv
+import datetime
+import json
+from typing import Any, Dict, Iterable, TextIO
+
+from tzolkin_calendar import USED_DATEFMT, TzolkinDate, TzolkinException, day_names
+from tzolkin_calendar.calculate import makeLabelTable
+
+# The names of the output formats, the first one is the default.
+OUTPUT_FORMATS = ("text", "json", "ndjson", "csv")
+
+# The columns of the CSV format.
+CSV_COLUMNS = (
+    "type",
+    "query",
+    "date",
+    "tzolkin",
+    "year_day",
+    "number",
+    "name",
+    "error",
+)
+
+# The Tzolkin date strings, index is the day in the Tzolkin year.
+_tzolkin_labels = makeLabelTable()
+
+
+################################################################################
+def makeResultWriter(fmt: str, out_file: TextIO, batch: bool = False) -> ResultWriter:
+    """Return the writer of the output format `fmt`.
+
+    Args:
+        fmt (str): The output format, one of `OUTPUT_FORMATS`.
+        out_file (TextIO): The file to write the results to.
+        batch (bool, optional): Write the text format of batch mode, a single line
+                                per result. Defaults to False.
+
+    Raises:
+        TzolkinException: If `fmt` is not one of `OUTPUT_FORMATS`.
+
+    Returns:
+        ResultWriter: The writer of the output format.
+    """
+    if fmt == "text":
+        return TextWriter(out_file, batch=batch)
+    if fmt == "json":
+        return JsonWriter(out_file, lines=False)
+    if fmt == "ndjson":
+        return JsonWriter(out_file, lines=True)
+    if fmt == "csv":
+        return CsvWriter(out_file)
+
+    raise TzolkinException(
+        'unknown output format "{fmt}", not one of {formats}'.format(
+            fmt=fmt, formats=", ".join(OUTPUT_FORMATS)
+        )
+    )
+
+
+################################################################################
+def _tzolkinFields(year_day: int) -> Dict[str, Any]:
+    """Return the fields of the Tzolkin date of the day `year_day` in the Tzolkin
+    year, as used by the machine-readable formats.
+
+    Args:
+        year_day (int): The day in the Tzolkin year, between 1 and 260.
+
+    Returns:
+        Dict[str, Any]: The Tzolkin date string, the day in the Tzolkin year, the
+                        day number and the day name.
+    """
+    tzolkin_date = TzolkinDate.fromYearDay(year_day)
+    return {
+        "tzolkin": _tzolkin_labels[year_day],
+        "year_day": year_day,
+        "number": tzolkin_date.number,
+        "name": day_names[tzolkin_date.name],
+    }
+
+
+################################################################################
+class ResultWriter(abc.ABC):
+    """The base class of the writers of the output formats."""
+
+    # `True` for the formats meant to be read by programs. Errors are written as
+    # records of these instead of printing the help text.
+    machine_readable = False
+
+    ############################################################################
+    def __init__(self, out_file: TextIO) -> None:
+        """Generate a writer writing to `out_file`.
+
+        Args:
+            out_file (TextIO): The file to write the results to.
+        """
+        self.out_file = out_file
+
+    ############################################################################
+    @abc.abstractmethod
+    def writeGregorian(self, query: str, date: datetime.date, year_day: int) -> None:
+        """Write the Tzolkin date of the gregorian date `date`.
+
+        Args:
+            query (str): The date string given by the user.
+            date (datetime.date): The parsed gregorian date.
+            year_day (int): The day in the Tzolkin year of `date`.
+        """
+
+    ############################################################################
+    @abc.abstractmethod
+    def writeTzolkin(
+        self,
+        query: str,
+        year_day: int,
+        start_date: datetime.date,
+        next_dates: Iterable[datetime.date],
+        last_dates: Iterable[datetime.date],
+        as_list: bool,
+    ) -> None:
+        """Write the next and last gregorian dates with the Tzolkin date of the day
+        `year_day` in the Tzolkin year.
+
+        Args:
+            query (str): The Tzolkin date string given by the user.
+            year_day (int): The day in the Tzolkin year searched for.
+            start_date (datetime.date): The gregorian date the search started on.
+            next_dates (Iterable[datetime.date]): The next dates, written one by one.
+            last_dates (Iterable[datetime.date]): The last dates, written one by one.
+            as_list (bool): `True` if a list of dates has been asked for, not a single
+                            next and last date.
+        """
+
+    ############################################################################
+    @abc.abstractmethod
+    def writeYear(self) -> None:
+        """Write all Tzolkin dates of a Tzolkin year."""
+
+    ############################################################################
+    @abc.abstractmethod
+    def writeError(self, query: str, error: str) -> None:
+        """Write the error of a query that can't be answered.
+
+        Args:
+            query (str): The date string given by the user.
+            error (str): The error message.
+        """
+
+    ############################################################################
+    def writeEmpty(self) -> None:
+        """Write the result of an empty query in batch mode, nothing but in the text
+        format.
+        """
+
+    ############################################################################
+    def close(self) -> None:
+        """Write the end of the output, does not close the output file."""
+
+
+################################################################################
+class TextWriter(ResultWriter):
+    """The writer of the text format meant to be read by humans, the default."""
+
+    ############################################################################
+    def __init__(self, out_file: TextIO, batch: bool = False) -> None:
+        """Generate a writer of the text format writing to `out_file`.
+
+        Args:
+            out_file (TextIO): The file to write the results to.
+            batch (bool, optional): Write a single line per result, as used in batch
+                                    mode. Defaults to False.
+        """
+        super().__init__(out_file)
+        self.__separator = ", " if batch else "\n "
+
+    ############################################################################
+    def writeGregorian(self, query: str, date: datetime.date, year_day: int) -> None:
+        """Write the Tzolkin date of the gregorian date `date`.
+
+        Args:
+            query (str): The date string given by the user.
+            date (datetime.date): The parsed gregorian date.
+            year_day (int): The day in the Tzolkin year of `date`.
+        """
+        self.out_file.write(
+            'Gregorian "{greg}" is "{tzolk}" as Tzolk’in\n'.format(
+                greg=query, tzolk=_tzolkin_labels[year_day]
+            )
+        )
+
+    ############################################################################
+    def writeTzolkin(
+        self,
+        query: str,
+        year_day: int,
+        start_date: datetime.date,
+        next_dates: Iterable[datetime.date],
+        last_dates: Iterable[datetime.date],
+        as_list: bool,
+    ) -> None:
+        """Write the next and last gregorian dates with the Tzolkin date of the day
+        `year_day` in the Tzolkin year.
+
+        Args:
+            query (str): The Tzolkin date string given by the user.
+            year_day (int): The day in the Tzolkin year searched for.
+            start_date (datetime.date): The gregorian date the search started on.
+            next_dates (Iterable[datetime.date]): The next dates, written one by one.
+            last_dates (Iterable[datetime.date]): The last dates, written one by one.
+            as_list (bool): `True` if a list of dates has been asked for, not a single
+                            next and last date.
+        """
+        tzolkin = _tzolkin_labels[year_day]
+        if not as_list:
+            next_date = next(iter(next_dates), None)
+            last_date = next(iter(last_dates), None)
+            if next_date is None or last_date is None:
+                self.writeError(
+                    query, "no next or last date of {tzolk}".format(tzolk=tzolkin)
+                )
+                return
+
+            self.out_file.write(
+                'Tzolk’in date "{tzolk}" next date is "{next}", last date has been "{last}"\n'.format(
+                    tzolk=tzolkin,
+                    next=next_date.strftime(USED_DATEFMT),
+                    last=last_date.strftime(USED_DATEFMT),
+                )
+            )
+            return
+
+        self.out_file.write(
+            'Tzolk’in date "{tzolk}"{sep}next dates are '.format(
+                tzolk=tzolkin, sep=self.__separator
+            )
+        )
+        self.__writeDates(next_dates)
+        self.out_file.write("{sep}last dates have been ".format(sep=self.__separator))
+        self.__writeDates(last_dates)
+        self.out_file.write("\n")
+
+    ############################################################################
+    def __writeDates(self, dates: Iterable[datetime.date]) -> None:
+        """Write the dates like the `repr` of a list of date strings.
+
+        Args:
+            dates (Iterable[datetime.date]): The dates to write.
+        """
+        separator = "['"
+        for date in dates:
+            self.out_file.write(separator)
+            self.out_file.write(date.strftime(USED_DATEFMT))
+            separator = "', '"
+
+        self.out_file.write("[]" if separator == "['" else "']")
+
+    ############################################################################
+    def writeYear(self) -> None:
+        """Write all Tzolkin dates of a Tzolkin year, 13 per line."""
+        for first_day in range(1, len(_tzolkin_labels), 13):
+            days = slice(first_day, first_day + 13)
+            self.out_file.write(" ")
+            self.out_file.write(" ".join(_tzolkin_labels[days]))
+            self.out_file.write("\n")
+
+    ############################################################################
+    def writeError(self, query: str, error: str) -> None:
+        """Write the empty line of a query that can't be answered, the error message
+        is printed to stderr.
+
+        Args:
+            query (str): The date string given by the user.
+            error (str): The error message.
+        """
+        self.out_file.write("\n")
+
+    ############################################################################
+    def writeEmpty(self) -> None:
+        """Write the empty line of an empty query in batch mode."""
+        self.out_file.write("\n")
+
+
+################################################################################
+class JsonWriter(ResultWriter):
+    """The writer of the JSON and NDJSON formats."""
+
+    machine_readable = True
+
+    ############################################################################
+    def __init__(self, out_file: TextIO, lines: bool = False) -> None:
+        """Generate a writer of the JSON or NDJSON format writing to `out_file`.
+
+        Args:
+            out_file (TextIO): The file to write the results to.
+            lines (bool, optional): Write NDJSON, a record per line, instead of a
+                                    single JSON array. Defaults to False.
+        """
+        super().__init__(out_file)
+        self.__lines = lines
+        self.__num_records = 0
+
+    ############################################################################
+    def __beginRecord(self) -> None:
+        """Write the separator before the next record."""
+        if not self.__lines:
+            self.out_file.write(",\n" if self.__num_records else "[\n")
+        self.__num_records += 1
+
+    ############################################################################
+    def __writeRecord(self, record: Dict[str, Any]) -> None:
+        """Write the record `record`.
+
+        Args:
+            record (Dict[str, Any]): The record to write.
+        """
+        self.__beginRecord()
+        self.out_file.write(json.dumps(record, ensure_ascii=False))
+        if self.__lines:
+            self.out_file.write("\n")
+
+    ############################################################################
+    def writeGregorian(self, query: str, date: datetime.date, year_day: int) -> None:
+        """Write the Tzolkin date of the gregorian date `date`.
+
+        Args:
+            query (str): The date string given by the user.
+            date (datetime.date): The parsed gregorian date.
+            year_day (int): The day in the Tzolkin year of `date`.
+        """
+        record = {"type": "gregorian", "query": query, "date": date.isoformat()}
+        record.update(_tzolkinFields(year_day))
+        self.__writeRecord(record)
+
+    ############################################################################
+    def writeTzolkin(
+        self,
+        query: str,
+        year_day: int,
+        start_date: datetime.date,
+        next_dates: Iterable[datetime.date],
+        last_dates: Iterable[datetime.date],
+        as_list: bool,
+    ) -> None:
+        """Write the next and last gregorian dates with the Tzolkin date of the day
+        `year_day` in the Tzolkin year. `next` and `last` are always lists.
+
+        Args:
+            query (str): The Tzolkin date string given by the user.
+            year_day (int): The day in the Tzolkin year searched for.
+            start_date (datetime.date): The gregorian date the search started on.
+            next_dates (Iterable[datetime.date]): The next dates, written one by one.
+            last_dates (Iterable[datetime.date]): The last dates, written one by one.
+            as_list (bool): Not used, the dates are always written as lists.
+        """
+        record: Dict[str, Any] = {"type": "tzolkin", "query": query}
+        record.update(_tzolkinFields(year_day))
+        record["start"] = start_date.isoformat()
+
+        self.__beginRecord()
+        # The record without its closing brace, the lists of dates follow.
+        self.out_file.write(json.dumps(record, ensure_ascii=False)[:-1])
+        self.out_file.write(', "next": ')
+        self.__writeDates(next_dates)
+        self.out_file.write(', "last": ')
+        self.__writeDates(last_dates)
+        self.out_file.write("}\n" if self.__lines else "}")
+
+    ############################################################################
+    def __writeDates(self, dates: Iterable[datetime.date]) -> None:
+        """Write the dates as JSON array of ISO date strings.
+
+        Args:
+            dates (Iterable[datetime.date]): The dates to write.
+        """
+        separator = '["'
+        for date in dates:
+            self.out_file.write(separator)
+            self.out_file.write(date.isoformat())
+            separator = '", "'
+
+        self.out_file.write("[]" if separator == '["' else '"]')
+
+    ############################################################################
+    def writeYear(self) -> None:
+        """Write all Tzolkin dates of a Tzolkin year, a record per day."""
+        for year_day in range(1, len(_tzolkin_labels)):
+            record = {"type": "year"}
+            record.update(_tzolkinFields(year_day))
+            self.__writeRecord(record)
+
+    ############################################################################
+    def writeError(self, query: str, error: str) -> None:
+        """Write the error record of a query that can't be answered.
+
+        Args:
+            query (str): The date string given by the user.
+            error (str): The error message.
+        """
+        self.__writeRecord({"type": "error", "query": query, "error": error})
+
+    ############################################################################
+    def close(self) -> None:
+        """Write the end of the JSON array, nothing for NDJSON."""
+        if not self.__lines:
+            self.out_file.write("\n]\n" if self.__num_records else "[]\n")
+
+
+################################################################################
+class CsvWriter(ResultWriter):
+    """The writer of the CSV format, with a header of the columns `CSV_COLUMNS`."""
+
+    machine_readable = True
+
+    ############################################################################
+    def __init__(self, out_file: TextIO) -> None:
+        """Generate a writer of the CSV format writing to `out_file` and write the
+        header.
+
+        Args:
+            out_file (TextIO): The file to write the results to.
+        """
+        super().__init__(out_file)
+        self.__writer = csv.writer(out_file, lineterminator="\n")
+        self.__writer.writerow(CSV_COLUMNS)
+
+    ############################################################################
+    def __writeRow(
+        self, row_type: str, query: str, date: str, year_day: int, error: str = ""
+    ) -> None:
+        """Write a row of the Tzolkin date of the day `year_day` in the Tzolkin year.
+
+        Args:
+            row_type (str): The type of the row.
+            query (str): The date string given by the user.
+            date (str): The gregorian date as ISO date string.
+            year_day (int): The day in the Tzolkin year, 0 for error rows.
+            error (str, optional): The error message. Defaults to "".
+        """
+        if year_day == 0:
+            self.__writer.writerow([row_type, query, date, "", "", "", "", error])
+            return
+
+        tzolkin_date = TzolkinDate.fromYearDay(year_day)
+        self.__writer.writerow(
+            [
+                row_type,
+                query,
+                date,
+                _tzolkin_labels[year_day],
+                year_day,
+                tzolkin_date.number,
+                day_names[tzolkin_date.name],
+                error,
+            ]
+        )
+
+    ############################################################################
+    def writeGregorian(self, query: str, date: datetime.date, year_day: int) -> None:
+        """Write the row of the Tzolkin date of the gregorian date `date`.
+
+        Args:
+            query (str): The date string given by the user.
+            date (datetime.date): The parsed gregorian date.
+            year_day (int): The day in the Tzolkin year of `date`.
+        """
+        self.__writeRow("gregorian", query, date.isoformat(), year_day)
+
+    ############################################################################
+    def writeTzolkin(
+        self,
+        query: str,
+        year_day: int,
+        start_date: datetime.date,
+        next_dates: Iterable[datetime.date],
+        last_dates: Iterable[datetime.date],
+        as_list: bool,
+    ) -> None:
+        """Write a row per next and last gregorian date with the Tzolkin date of the
+        day `year_day` in the Tzolkin year, of the types `next` and `last`.
+
+        Args:
+            query (str): The Tzolkin date string given by the user.
+            year_day (int): The day in the Tzolkin year searched for.
+            start_date (datetime.date): The gregorian date the search started on.
+            next_dates (Iterable[datetime.date]): The next dates, written one by one.
+            last_dates (Iterable[datetime.date]): The last dates, written one by one.
+            as_list (bool): Not used, a row is written per date.
+        """
+        for date in next_dates:
+            self.__writeRow("next", query, date.isoformat(), year_day)
+        for date in last_dates:
+            self.__writeRow("last", query, date.isoformat(), year_day)
+
+    ############################################################################
+    def writeYear(self) -> None:
+        """Write all Tzolkin dates of a Tzolkin year, a row per day."""
+        for year_day in range(1, len(_tzolkin_labels)):
+            self.__writeRow("year", "", "", year_day)
+
+    ############################################################################
+    def writeError(self, query: str, error: str) -> None:
+        """Write the error row of a query that can't be answered.
+
+        Args:
+            query (str): The date string given by the user.
+            error (str): The error message.
+        """
+        self.__writeRow("error", query, "", 0, error)
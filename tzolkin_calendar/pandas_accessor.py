@@ -0,0 +1,277 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     pandas_accessor.py
+# Date:     18.Oct.2026
+###############################################################################
+"""The pandas Series accessor `tzolkin`, to get the Tzolkin dates of Series of
+datetime values.
+
+pandas is an optional dependency of tzolkin-calendar, install it using
+`pip install tzolkin-calendar[pandas]`. Importing this module registers the
+accessor. All values are calculated at once using the functions of
+`tzolkin_calendar.vectorized`, missing values (`NaT`) yield missing values. The
+days in the Tzolkin year are calculated on first use of an attribute needing them.
+
+Example:
+
+>>> import pandas as pd
+>>> import tzolkin_calendar.pandas_accessor
+>>> dates = pd.Series(pd.to_datetime(["2014-05-23", "2021-03-20"]))
+>>> dates.tzolkin.number
+0     2
+1    12
+dtype: UInt8
+>>> dates.tzolkin.name
+0    Etzʼnabʼ
+1      Chuwen
+dtype: category
+Categories (20, str): ['Imix', 'Ikʼ', 'Akʼbʼal', 'Kʼan', ..., 'Kabʼan', 'Etzʼnabʼ', 'Kawak', 'Ajaw']
+>>> dates.tzolkin.next(tzolkin_calendar.TzolkinDate(number=13, name=20))
+0   2014-09-02
+1   2021-10-15
+dtype: datetime64[s]
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, List
+
+from tzolkin_calendar import TzolkinDate, day_names
+from tzolkin_calendar.calculate import getTzolkinDay, makeLabelTable
+
+try:
+    import numpy as np
+    import pandas as pd
+
+    from tzolkin_calendar import vectorized
+except ImportError as excp:  # pragma: no cover
+    raise ImportError(
+        "tzolkin_calendar.pandas_accessor needs pandas, install it using 'pip install tzolkin-calendar[pandas]'"
+    ) from excp
+
+# The categories of the Tzolkin day names, in the order of their numbers.
+_name_categories: List[str] = list(day_names.values())
+
+# The categories of the Tzolkin dates, in the order of the days in the Tzolkin year.
+_label_categories: List[str] = list(makeLabelTable()[1:])
+
+
+################################################################################
+@pd.api.extensions.register_series_accessor("tzolkin")
+class TzolkinAccessor:
+    """The Series accessor `tzolkin` of Series of datetime values."""
+
+    ############################################################################
+    def __init__(self, series: pd.Series) -> None:
+        """Generate the accessor of the Series `series`.
+
+        Args:
+            series (pd.Series): The Series of datetime values.
+
+        Raises:
+            AttributeError: If `series` does not hold datetime values.
+        """
+        if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+            raise AttributeError(
+                "the .tzolkin accessor can only be used with datetime values"
+            )
+
+        if getattr(series.dtype, "tz", None) is not None:
+            series = series.dt.tz_localize(None)
+
+        self.__series = series
+        self.__dates = series.to_numpy().astype("datetime64[D]")
+        self.__missing = np.isnat(self.__dates)
+
+    ############################################################################
+    @functools.cached_property
+    def __year_days(self) -> np.ndarray:
+        """The days in the Tzolkin year of the dates, calculated on first use.
+
+        Returns:
+            np.ndarray: The `uint16` array of days in the Tzolkin year, 1 where the
+                        dates are missing.
+        """
+        return vectorized.gregorian2TzolkinDay(self.__validDates())
+
+    ############################################################################
+    @property
+    def year_day(self) -> pd.Series:
+        """The days in the Tzolkin year, between 1 and 260.
+
+        Returns:
+            pd.Series: The Series of days in the Tzolkin year, of type `UInt16`.
+        """
+        return self.__integerSeries(self.__year_days)
+
+    ############################################################################
+    @property
+    def number(self) -> pd.Series:
+        """The Tzolkin day numbers, between 1 and 13.
+
+        Returns:
+            pd.Series: The Series of Tzolkin day numbers, of type `UInt8`.
+        """
+        numbers, _ = vectorized.tzolkinDays2tzolkin(self.__year_days)
+        return self.__integerSeries(numbers)
+
+    ############################################################################
+    @property
+    def name_number(self) -> pd.Series:
+        """The Tzolkin day name numbers, between 1 and 20.
+
+        Returns:
+            pd.Series: The Series of Tzolkin day name numbers, of type `UInt8`.
+        """
+        _, names = vectorized.tzolkinDays2tzolkin(self.__year_days)
+        return self.__integerSeries(names)
+
+    ############################################################################
+    @property
+    def name(self) -> pd.Series:
+        """The Tzolkin day names.
+
+        Returns:
+            pd.Series: The categorical Series of Tzolkin day names, the categories
+                        are the 20 day names.
+        """
+        _, names = vectorized.tzolkinDays2tzolkin(self.__year_days)
+        return self.__categoricalSeries(names, _name_categories)
+
+    ############################################################################
+    @property
+    def label(self) -> pd.Series:
+        """The Tzolkin dates as strings, like '8 Chuwen'.
+
+        Returns:
+            pd.Series: The categorical Series of Tzolkin dates, the categories are
+                        the 260 Tzolkin dates.
+        """
+        return self.__categoricalSeries(self.__year_days, _label_categories)
+
+    ############################################################################
+    def next(self, target: Any) -> pd.Series:
+        """Return the next dates with the Tzolkin date `target`.
+        If a date already has the Tzolkin date `target`, the date 260 days later is
+        returned, see `tzolkin_calendar.vectorized.nextOccurrence`.
+
+        Args:
+            target (Any): The Tzolkin date to search for, as `TzolkinDate`, day in
+                          the Tzolkin year or array of days in the Tzolkin year.
+
+        Raises:
+            TzolkinException: If a day in the Tzolkin year is not between 1 and 260.
+
+        Returns:
+            pd.Series: The Series of the found dates.
+        """
+        return self.__dateSeries(
+            vectorized.nextOccurrence(self.__targetDays(target), self.__validDates())
+        )
+
+    ############################################################################
+    def last(self, target: Any) -> pd.Series:
+        """Return the last dates before the dates with the Tzolkin date `target`.
+        If a date already has the Tzolkin date `target`, the date 260 days before is
+        returned, see `tzolkin_calendar.vectorized.lastOccurrence`.
+
+        Args:
+            target (Any): The Tzolkin date to search for, as `TzolkinDate`, day in
+                          the Tzolkin year or array of days in the Tzolkin year.
+
+        Raises:
+            TzolkinException: If a day in the Tzolkin year is not between 1 and 260.
+
+        Returns:
+            pd.Series: The Series of the found dates.
+        """
+        return self.__dateSeries(
+            vectorized.lastOccurrence(self.__targetDays(target), self.__validDates())
+        )
+
+    ############################################################################
+    @staticmethod
+    def __targetDays(target: Any) -> Any:
+        """Return the days in the Tzolkin year of `target`.
+
+        Args:
+            target (Any): The `TzolkinDate`, day or days in the Tzolkin year.
+
+        Returns:
+            Any: The day or array of days in the Tzolkin year.
+        """
+        if isinstance(target, TzolkinDate):
+            return getTzolkinDay(target)
+
+        if isinstance(target, pd.Series):
+            return target.to_numpy()
+
+        return target
+
+    ############################################################################
+    def __validDates(self) -> np.ndarray:
+        """Return the dates with missing values replaced by a valid date.
+
+        Returns:
+            np.ndarray: The `datetime64[D]` array of dates without `NaT`.
+        """
+        return np.where(self.__missing, np.datetime64(0, "D"), self.__dates)
+
+    ############################################################################
+    def __integerSeries(self, values: np.ndarray) -> pd.Series:
+        """Return the values as Series of nullable integers, missing where the dates
+        are missing.
+
+        Args:
+            values (np.ndarray): The unsigned integer array of values.
+
+        Returns:
+            pd.Series: The Series of nullable integers.
+        """
+        return pd.Series(
+            pd.arrays.IntegerArray(values, self.__missing.copy()),
+            index=self.__series.index,
+            name=self.__series.name,
+        )
+
+    ############################################################################
+    def __categoricalSeries(
+        self, values: np.ndarray, categories: List[str]
+    ) -> pd.Series:
+        """Return the values as categorical Series, the value 1 is the first
+        category.
+
+        Args:
+            values (np.ndarray): The one based indices of the categories.
+            categories (List[str]): The categories.
+
+        Returns:
+            pd.Series: The categorical Series, missing where the dates are missing.
+        """
+        codes = np.where(self.__missing, -1, values.astype(np.int16) - 1)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=categories),
+            index=self.__series.index,
+            name=self.__series.name,
+        )
+
+    ############################################################################
+    def __dateSeries(self, dates: np.ndarray) -> pd.Series:
+        """Return the dates as Series, missing where the start dates are missing.
+
+        Args:
+            dates (np.ndarray): The `datetime64[D]` array of dates.
+
+        Returns:
+            pd.Series: The Series of dates.
+        """
+        return pd.Series(
+            np.where(self.__missing, np.datetime64("NaT"), dates).astype(
+                "datetime64[s]"
+            ),
+            index=self.__series.index,
+            name=self.__series.name,
+        )
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     parse.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Functions to parse gregorian and Tzolkin date strings, as given on the command
+line or in files to convert.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import re
+from typing import Optional, Pattern, Tuple
+
+from tzolkin_calendar.calculate import parseTzolkinName
+
+# Regexes to parse date strings, gregorian and Tzolkin dates. Compiled on first use
+# by `__regex`.
+__gregorian_regex1 = (
+    r"^([0-3]?[0-9])[\t .\-]([0-1]?[0-9])[\t .\-]([0-9][0-9][0-9][0-9])"
+)
+__gregorian_regex2 = (
+    r"^([0-9][0-9][0-9][0-9])[\t .\-/]([0-1]?[0-9])[\t .\-/]([0-3]?[0-9])"
+)
+__gregorian_regex3 = r"^([0-1]?[0-9])/([0-3]?[0-9])/([0-9][0-9][0-9][0-9])"
+__tzolkin_regex1 = r"([0-1]?[0-9])[\t .\-/]([0-2]?[0-9])"
+__tzolkin_regex2 = r"([0-1]?[0-9])[\t .\-/](\S+)"
+
+
+################################################################################
+@functools.lru_cache(maxsize=None)
+def __regex(pattern: str) -> Pattern[str]:
+    """Return the compiled regex of `pattern`, compiled only once.
+
+    Args:
+        pattern (str): The regex to compile.
+
+    Returns:
+        Pattern[str]: The compiled regex.
+    """
+    return re.compile(pattern)
+
+
+################################################################################
+def parseGregorian(date_str: str) -> Optional[str]:
+    """Tries to parse the given string as a gregorian date.
+    Return the string 'DD.MM.YYYY' on success, `None`else.
+
+    Args:
+        date_str (str): The string to parse
+
+    Returns:
+        Optional[str]: The string 'DD.MM.YYYY' on success, `None`else.
+    """
+    result = __searchGregorian(date_str=date_str)
+    if result is None:
+        return None
+
+    day, month, year = result
+    return ".".join([day, month, year])
+
+
+################################################################################
+def parseGregorianDate(date_str: str) -> Optional[datetime.date]:
+    """Tries to parse the given string as a gregorian date.
+    Accepts the same formats as `parseGregorian`.
+
+    Args:
+        date_str (str): The string to parse.
+
+    Raises:
+        ValueError: If the string has the format of a gregorian date, but isn't a
+                    valid date, like '36.10.2000'.
+
+    Returns:
+        Optional[datetime.date]: The parsed date on success, `None` if `date_str`
+                                doesn't look like a gregorian date.
+    """
+    result = __searchGregorian(date_str=date_str)
+    if result is None:
+        return None
+
+    day, month, year = result
+    return datetime.date(int(year), int(month), int(day))
+
+
+################################################################################
+def __searchGregorian(date_str: str) -> Optional[Tuple[str, str, str]]:
+    """Search the given string for a gregorian date.
+
+    Args:
+        date_str (str): The string to parse.
+
+    Returns:
+        Optional[Tuple[str, str, str]]: The strings of day, month and year on success,
+                                        `None` else.
+    """
+    result = __regex(__gregorian_regex1).search(date_str)
+    if result:
+        return result.group(1), result.group(2), result.group(3)
+
+    result = __regex(__gregorian_regex2).search(date_str)
+    if result:
+        return result.group(3), result.group(2), result.group(1)
+
+    result = __regex(__gregorian_regex3).search(date_str)
+    if result:
+        return result.group(2), result.group(1), result.group(3)
+
+    return None
+
+
+################################################################################
+def parseTzolkin(date_str: str) -> Tuple[int, int]:
+    """Parse the given string to find a Tzolkin date string.
+
+    Args:
+        date_str (str): The string to parse for a Tzolkin day string of the form
+                        'NUMBER DAY_NAME'
+    Returns:
+        Tuple[int, int]: Returns the Tzolkin day number and Tzolkin day name number as a
+                        Tuple. (0, 0) if no Tzolkin date has been found.
+    """
+    tzolkin_number = 0
+    tzolkin_day_number = 0
+    result = __regex(__tzolkin_regex1).search(date_str)
+
+    if result:
+        tzolkin_number = int(result.group(1))
+        tzolkin_day_number = int(result.group(2))
+
+        return tzolkin_number, tzolkin_day_number
+
+    result = __regex(__tzolkin_regex2).search(date_str)
+    if result:
+        tzolkin_number = int(result.group(1))
+        tzolkin_day_name = result.group(2)
+        tzolkin_day_number = parseTzolkinName(tzolkin_day_name)
+
+    return tzolkin_number, tzolkin_day_number
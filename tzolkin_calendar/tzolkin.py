@@ -10,30 +10,54 @@
 from __future__ import annotations
 
 import datetime
-from typing import List, Optional
+import warnings
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from tzolkin_calendar.calculate import (
-    calculateTzolkinName,
-    calculateTzolkinNumber,
+    TZOLKIN_YEAR_LENGTH,
+    countTzolkinBetween,
     getTzolkinDay,
     getTzolkinDiff,
-    gregorian2tzolkin,
+    iterTzolkin2gregorian,
     lastTzolkin,
-    makeLookUpTable,
+    makeLabelTable,
     nextTzolkin,
+    ordinal2TzolkinDay,
     parseTzolkinName,
     tzolkin2gregorian,
+    tzolkinDatesBetween,
 )
+from tzolkin_calendar.clock import today
 
-from . import TzolkinDate, TzolkinException, TzolkinName, day_names, day_numbers
+from . import TzolkinDate, TzolkinException, _tzolkin_dates, day_names, day_numbers
+
+# The Tzolkin date string of each day in the Tzolkin year, index 0 is not used.
+_tzolkin_labels: Tuple[str, ...] = makeLabelTable()
+
+# The day in the Tzolkin year of each pair of day number and day name number.
+_tzolkin_year_days: Dict[Tuple[int, int], int] = {
+    (tzolkin.number, tzolkin.name): getTzolkinDay(tzolkin)
+    for tzolkin in _tzolkin_dates[1:]
+}
+
+# The number of each Tzolkin day name, the name is the key.
+_day_name_numbers: Dict[str, int] = {name: num for num, name in day_names.items()}
 
 
 class Tzolkin:
     """A representation of a Tzolkin date.
     Use to do calculations and conversions from and to gregorian dates to Tzolkin dates
     and search for days.
+
+    `Tzolkin` instances are immutable, they only hold the day in the Tzolkin year.
+    They compare equal if they hold the same Tzolkin date, are ordered by the day in
+    the Tzolkin year and can be used as keys of dicts and in sets. Adding or
+    subtracting days, as `int` or `datetime.timedelta`, returns a new `Tzolkin`
+    instance: `Tzolkin(number=8, name_str="Chuwen") + 5`.
     """
 
+    __slots__ = ("__year_day",)
+
     ############################################################################
     def __init__(
         self,
@@ -45,7 +69,8 @@ class Tzolkin:
         Tzolkin day name `name_str` or `name_number`.
         The valid day names for `name_str` are: "Imix", "Ikʼ", "Akʼbʼal", "Kʼan",
         "Chikchan", "Kimi", "Manikʼ", "Lamat", "Muluk", "Ok", "Chuwen", "Ebʼ", "Bʼen",
-        "Ix", "Men", "Kʼibʼ", "Kabʼan", "Etzʼnabʼ", "Kawak" and "Ajaw".
+        "Ix", "Men", "Kʼibʼ", "Kabʼan", "Etzʼnabʼ", "Kawak" and "Ajaw", ignoring lower-
+        and uppercase, or one of their aliases, see `getNameNumberFromName`.
 
         You can also set the Tzolkin day name using the argument `name_number`, which
         takes an integer between 1 and 20 (including 1 and 20).
@@ -58,17 +83,20 @@ class Tzolkin:
                                 That means, if `number` is not in [1,13], `name_number`
                                 is not in [1, 20] or `name_str` is not a valid Tzolkin
                                 day name.
+            AttributeError: if called on an already initialized instance, `Tzolkin`
+                            instances are immutable and may be shared.
 
         Args:
             number (TzolkinNumber): [description]
             name_str (Optional[TzolkinName], optional): [description]. Defaults to None.
             name_number (Optional[TzolkinNameNumber], optional): [description]. Defaults to None.
         """
+        if hasattr(self, "_Tzolkin__year_day"):
+            raise AttributeError("Tzolkin instances are immutable")
+
         name_num: int = 1
         num_num = number
         if name_str is not None:
-            self.__checkNameString(name_str)
-
             name_num = self.getNameNumberFromName(name_str)
 
         elif name_number is not None:
@@ -77,7 +105,32 @@ class Tzolkin:
 
         self.__checkDayNumber(number)
 
-        self.__tzolkin_date = TzolkinDate(number=num_num, name=name_num)
+        object.__setattr__(
+            self, "_Tzolkin__year_day", _tzolkin_year_days[(num_num, name_num)]
+        )
+
+    ############################################################################
+    @classmethod
+    def _fromYearDay(cls, year_day: int) -> Tzolkin:
+        """Return the `Tzolkin` instance of the day in the Tzolkin year `year_day`,
+        without validating it. Only for callers that already hold a valid day, like
+        the result of `calculate.ordinal2TzolkinDay`.
+        `Tzolkin` instances are immutable, so the shared instance of the day is
+        returned, instances of subclasses are generated.
+
+        Args:
+            year_day (int): The day in the Tzolkin year, between 1 and 260 (including
+                            1 and 260).
+
+        Returns:
+            Tzolkin: The `Tzolkin` instance of the day in the Tzolkin year.
+        """
+        if cls is Tzolkin:
+            return _tzolkin_instances[year_day]
+
+        ret_val = object.__new__(cls)
+        object.__setattr__(ret_val, "_Tzolkin__year_day", year_day)
+        return ret_val
 
     ############################################################################
     @classmethod
@@ -90,11 +143,7 @@ class Tzolkin:
         Returns:
             Tzolkin: The gregorion date `date` converted to a Tzolkin date.
         """
-        tzolkin = gregorian2tzolkin(date)
-
-        ret_val = cls(number=tzolkin.number, name_number=tzolkin.name)
-
-        return ret_val
+        return cls._fromYearDay(ordinal2TzolkinDay(date.toordinal()))
 
     ############################################################################
     @classmethod
@@ -112,11 +161,7 @@ class Tzolkin:
             Tzolkin: The gregorion date `date_str` converted to a Tzolkin date.
         """
         date = datetime.datetime.strptime(date_str, fmt).date()
-        tzolkin = gregorian2tzolkin(date)
-
-        ret_val = cls(number=tzolkin.number, name_number=tzolkin.name)
-
-        return ret_val
+        return cls._fromYearDay(ordinal2TzolkinDay(date.toordinal()))
 
     ############################################################################
     @classmethod
@@ -133,11 +178,7 @@ class Tzolkin:
             Tzolkin: The gregorion date `date_str` converted to a Tzolkin date.
         """
         date = datetime.date.fromisoformat(date_str)
-        tzolkin = gregorian2tzolkin(date)
-
-        ret_val = cls(number=tzolkin.number, name_number=tzolkin.name)
-
-        return ret_val
+        return cls._fromYearDay(ordinal2TzolkinDay(date.toordinal()))
 
     ############################################################################
     @classmethod
@@ -147,7 +188,7 @@ class Tzolkin:
         Returns:
             Tzolkin: The current day (today) as a Tzolkin date.
         """
-        return cls.fromDate(datetime.date.today())
+        return cls.fromDate(today())
 
     ############################################################################
     def getTzolkinDate(self) -> TzolkinDate:
@@ -157,7 +198,7 @@ class Tzolkin:
         Returns:
             TzolkinDate: The `TzolkinDate` instance of this Tzolkin date.
         """
-        return self.__tzolkin_date
+        return _tzolkin_dates[self.__year_day]
 
     ############################################################################
     def getDayNumber(self) -> int:
@@ -166,7 +207,7 @@ class Tzolkin:
         Returns:
             int: The day number of this Tzolkin date.
         """
-        return self.__tzolkin_date.number
+        return _tzolkin_dates[self.__year_day].number
 
     ############################################################################
     def getDayName(self) -> str:
@@ -175,7 +216,7 @@ class Tzolkin:
         Returns:
             str: The day name of this Tzolkin date.
         """
-        return day_names[self.__tzolkin_date.name]
+        return day_names[_tzolkin_dates[self.__year_day].name]
 
     ############################################################################
     def getDayNameNumber(self) -> int:
@@ -184,7 +225,7 @@ class Tzolkin:
         Returns:
             int: The number of the Tzolkin day name of this Tzolkin date.
         """
-        return self.__tzolkin_date.name
+        return _tzolkin_dates[self.__year_day].name
 
     ############################################################################
     def getTzolkinYearDay(self) -> int:
@@ -196,29 +237,28 @@ class Tzolkin:
              int: The day of this Tzolkin date in the Tzolkin year, an integer between
                  1 and 260 (including 1 and 260).
         """
-        return getTzolkinDay(self.__tzolkin_date)
+        return self.__year_day
 
     ############################################################################
-    def getNextDate(
-        self, start_date: datetime.date = datetime.date.today()
-    ) -> datetime.date:
+    def getNextDate(self, start_date: Optional[datetime.date] = None) -> datetime.date:
         """Return the next gregorian date with the Tzolkin date of this Tzolkin instance.
         Next means the first gregorian date with the same Tzolkin date as this `Tzolkin`
         instance after (forward in time) `start_date`.
 
         Args:
-            start_date (datetime.date, optional): The date to start searching for a day
-                        with the same Tzolkin date. Defaults to `datetime.date.today()`.
+            start_date (Optional[datetime.date], optional): The date to start
+                        searching for a day with the same Tzolkin date. Defaults to
+                        None, the date of today, see `clock.today`.
 
         Returns:
             datetime.date: The gregorian date of the day with the same Tzolkin date as
                             this `Tzolkin` instance after `start_date`.
         """
-        return nextTzolkin(tzolkin=self.__tzolkin_date, starting=start_date)
+        return nextTzolkin(tzolkin=self.getTzolkinDate(), starting=start_date)
 
     ############################################################################
     def getNextDateList(
-        self, start_date: datetime.date = datetime.date.today(), list_size: int = 50
+        self, start_date: Optional[datetime.date] = None, list_size: int = 50
     ) -> List[datetime.date]:
         """Return a list of dates with the same Tzolkin date as this `Tzolkin` instance
         after `start_date`.
@@ -228,8 +268,9 @@ class Tzolkin:
         returned.
 
         Args:
-            start_date (datetime.date, optional): The date to start searching for a day
-                            with the same Tzolkin date. Defaults to datetime.date.today().
+            start_date (Optional[datetime.date], optional): The date to start
+                        searching for a day with the same Tzolkin date. Defaults to
+                        None, the date of today, see `clock.today`.
             list_size (int, optional): The number of elements in the returned list of
                                         dates. Defaults to 50.
 
@@ -238,33 +279,62 @@ class Tzolkin:
                             same Tzolkin date as this instance after `start_date`.
         """
         return tzolkin2gregorian(
-            tzolkin=self.__tzolkin_date,
-            start=start_date,
+            tzolkin=self.getTzolkinDate(),
+            start=today() if start_date is None else start_date,
             num_results=list_size,
             forward=True,
         )
 
     ############################################################################
-    def getLastDate(
-        self, start_date: datetime.date = datetime.date.today()
-    ) -> datetime.date:
+    def iterNextDates(
+        self,
+        start_date: Optional[datetime.date] = None,
+        stop_date: Optional[datetime.date] = None,
+    ) -> Iterator[datetime.date]:
+        """Return an iterator over the dates with the same Tzolkin date as this
+        `Tzolkin` instance after `start_date`.
+        Searches forwards in time, starting with `start_date`. The dates are generated
+        on demand, until `stop_date` (including `stop_date`) is reached. If `stop_date`
+        is `None`, until the last date `datetime.date` can hold.
+
+        Args:
+            start_date (Optional[datetime.date], optional): The date to start
+                        searching for a day with the same Tzolkin date. Defaults to
+                        None, the date of today, see `clock.today`.
+            stop_date (Optional[datetime.date], optional): The last date to return.
+                                        Defaults to None.
+
+        Returns:
+            Iterator[datetime.date]: The iterator over the days with the same Tzolkin
+                            date as this instance after `start_date`.
+        """
+        return iterTzolkin2gregorian(
+            tzolkin=self.getTzolkinDate(),
+            start=today() if start_date is None else start_date,
+            forward=True,
+            stop=stop_date,
+        )
+
+    ############################################################################
+    def getLastDate(self, start_date: Optional[datetime.date] = None) -> datetime.date:
         """Return the last gregorian date with the Tzolkin date of this Tzolkin instance.
         Last means the first gregorian date with the same Tzolkin date as this `Tzolkin`
         instance before (backwards in time) `start_date`.
 
         Args:
-            start_date (datetime.date, optional):  The date to start searching for a day
-                          with the same Tzolkin date. Defaults to datetime.date.today().
+            start_date (Optional[datetime.date], optional): The date to start
+                        searching for a day with the same Tzolkin date. Defaults to
+                        None, the date of today, see `clock.today`.
 
         Returns:
             datetime.date: The gregorian date of the day with the same Tzolkin date as
                             this `Tzolkin` instance before `start_date`.
         """
-        return lastTzolkin(tzolkin=self.__tzolkin_date, starting=start_date)
+        return lastTzolkin(tzolkin=self.getTzolkinDate(), starting=start_date)
 
     ############################################################################
     def getLastDateList(
-        self, start_date: datetime.date = datetime.date.today(), list_size: int = 50
+        self, start_date: Optional[datetime.date] = None, list_size: int = 50
     ) -> List[datetime.date]:
         """Return a list of dates with the same Tzolkin date as this `Tzolkin` instance
         before`start_date`.
@@ -274,8 +344,9 @@ class Tzolkin:
         returned.
 
         Args:
-            start_date (datetime.date, optional): The date to start searching for a day
-                            with the same Tzolkin date. Defaults to datetime.date.today().
+            start_date (Optional[datetime.date], optional): The date to start
+                        searching for a day with the same Tzolkin date. Defaults to
+                        None, the date of today, see `clock.today`.
             list_size (int, optional): The number of elements in the returned list of
                                         dates. Defaults to 50.
 
@@ -284,45 +355,170 @@ class Tzolkin:
                             same Tzolkin date as this instance before `start_date`.
         """
         return tzolkin2gregorian(
-            tzolkin=self.__tzolkin_date,
-            start=start_date,
+            tzolkin=self.getTzolkinDate(),
+            start=today() if start_date is None else start_date,
             num_results=list_size,
             forward=False,
         )
 
+    ############################################################################
+    def iterLastDates(
+        self,
+        start_date: Optional[datetime.date] = None,
+        stop_date: Optional[datetime.date] = None,
+    ) -> Iterator[datetime.date]:
+        """Return an iterator over the dates with the same Tzolkin date as this
+        `Tzolkin` instance before `start_date`.
+        Searches backwards in time, starting with `start_date`. The dates are
+        generated on demand, until `stop_date` (including `stop_date`) is reached. If
+        `stop_date` is `None`, until the first date `datetime.date` can hold.
+
+        Args:
+            start_date (Optional[datetime.date], optional): The date to start
+                        searching for a day with the same Tzolkin date. Defaults to
+                        None, the date of today, see `clock.today`.
+            stop_date (Optional[datetime.date], optional): The last date to return.
+                                        Defaults to None.
+
+        Returns:
+            Iterator[datetime.date]: The iterator over the days with the same Tzolkin
+                            date as this instance before `start_date`.
+        """
+        return iterTzolkin2gregorian(
+            tzolkin=self.getTzolkinDate(),
+            start=today() if start_date is None else start_date,
+            forward=False,
+            stop=stop_date,
+        )
+
+    ############################################################################
+    def getDatesBetween(
+        self, start_date: datetime.date, end_date: datetime.date
+    ) -> List[datetime.date]:
+        """Return the list of all dates between `start_date` and `end_date` with the
+        same Tzolkin date as this `Tzolkin` instance.
+        Both `start_date` and `end_date` are included. If `end_date` is before
+        `start_date`, an empty list is returned.
+
+        Args:
+            start_date (datetime.date): The first date of the search interval.
+            end_date (datetime.date): The last date of the search interval.
+
+        Returns:
+            List[datetime.date]: The list of days with the same Tzolkin date as this
+                    instance between `start_date` and `end_date`, sorted forward in
+                    time.
+        """
+        return tzolkinDatesBetween(
+            tzolkin=self.getTzolkinDate(), start=start_date, end=end_date
+        )
+
+    ############################################################################
+    def countDatesBetween(
+        self, start_date: datetime.date, end_date: datetime.date
+    ) -> int:
+        """Return the number of dates between `start_date` and `end_date` with the
+        same Tzolkin date as this `Tzolkin` instance.
+        Both `start_date` and `end_date` are included. If `end_date` is before
+        `start_date`, 0 is returned.
+
+        Args:
+            start_date (datetime.date): The first date of the search interval.
+            end_date (datetime.date): The last date of the search interval.
+
+        Returns:
+            int: The number of days with the same Tzolkin date as this instance between
+                `start_date` and `end_date`.
+        """
+        return countTzolkinBetween(
+            tzolkin=self.getTzolkinDate(), start=start_date, end=end_date
+        )
+
     ############################################################################
     def addDays(self, days: int) -> Tzolkin:
-        """Add the number of days to this Tzolkin date and return this instance too.
+        """Return the Tzolkin date `days` days after this Tzolkin date.
+        `Tzolkin` instances are immutable, this instance is not changed. Same as
+        `self + days`.
+
+        Deprecated: emits a `DeprecationWarning`, because it does not change this
+        instance anymore. Use the returned instance or `self + days`.
 
         Args:
             days (int): The number of days to add (or subtract, if < 0) to this
                         `Tzolkin` instance.
 
         Returns:
-            Tzolkin: This instance with the number of days added (or subtracted) to it.
+            Tzolkin: The Tzolkin date with the number of days added (or subtracted).
         """
-        added_name = calculateTzolkinName(
-            start_name=self.__tzolkin_date.name, to_add=days
-        )
-        added_number = calculateTzolkinNumber(
-            start_number=self.__tzolkin_date.number, to_add=days
+        warnings.warn(
+            "Tzolkin.addDays does not change the instance it is called on, use the returned instance or `+`",
+            DeprecationWarning,
+            stacklevel=2,
         )
-        self.__tzolkin_date = TzolkinDate(number=added_number, name=added_name)
-        return self
+        return self + days
 
     ############################################################################
     def addTimedelta(self, delta: datetime.timedelta) -> Tzolkin:
-        """Add the number of days given in the `datetime.timedelta` object to this
-        Tzolkin date.
-        Returns this `Tzolkin` instance with the days added to or subtracted from.
+        """Return the Tzolkin date the number of days given in the `datetime.timedelta`
+        object after this Tzolkin date.
+        `Tzolkin` instances are immutable, this instance is not changed. Same as
+        `self + delta`.
+
+        Deprecated: emits a `DeprecationWarning`, because it does not change this
+        instance anymore. Use the returned instance or `self + delta`.
 
         Args:
             delta (datetime.timedelta): The number of days to add (or subtrace, if < 0).
 
         Returns:
-            Tzolkin: This instance with the number of days added or subtracted.
+            Tzolkin: The Tzolkin date with the number of days added or subtracted.
         """
-        return self.addDays(days=delta.days)
+        warnings.warn(
+            "Tzolkin.addTimedelta does not change the instance it is called on, use the returned instance or `+`",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self + delta
+
+    ############################################################################
+    def __add__(self, other: Union[int, datetime.timedelta]) -> Tzolkin:
+        """Return the Tzolkin date `other` days after this Tzolkin date.
+
+        Args:
+            other (Union[int, datetime.timedelta]): The number of days to add.
+
+        Returns:
+            Tzolkin: The Tzolkin date with the number of days added.
+        """
+        if isinstance(other, datetime.timedelta):
+            other = other.days
+        elif not isinstance(other, int):
+            return NotImplemented
+
+        return type(self)._fromYearDay(
+            (self.__year_day - 1 + other) % TZOLKIN_YEAR_LENGTH + 1
+        )
+
+    __radd__ = __add__
+
+    ############################################################################
+    def __sub__(self, other: Union[int, datetime.timedelta]) -> Tzolkin:
+        """Return the Tzolkin date `other` days before this Tzolkin date.
+
+        Args:
+            other (Union[int, datetime.timedelta]): The number of days to subtract.
+
+        Returns:
+            Tzolkin: The Tzolkin date with the number of days subtracted.
+        """
+        if isinstance(other, datetime.timedelta):
+            other = other.days
+        elif not isinstance(other, int):
+            return NotImplemented
+
+        return type(self)._fromYearDay(
+            (self.__year_day - 1 - other) % TZOLKIN_YEAR_LENGTH + 1
+        )
 
     ############################################################################
     def getDayDiff(self, other: Tzolkin) -> int:
@@ -340,7 +536,7 @@ class Tzolkin:
             int: The number of days between the Tzolkin date of this `Tzolkin` instance
                 and the Tzolkin date `other`.
         """
-        return getTzolkinDiff(start=self.__tzolkin_date, end=other.__tzolkin_date)
+        return getTzolkinDiff(start=self.getTzolkinDate(), end=other.getTzolkinDate())
 
     ############################################################################
     def getDayTimedelta(self, other: Tzolkin) -> datetime.timedelta:
@@ -359,7 +555,7 @@ class Tzolkin:
             datetime.timedelta: The number of days between the Tzolkin date of this `Tzolkin` instance
                 and the Tzolkin date `other` as a `datetime.timedelta` object.
         """
-        days = getTzolkinDiff(start=self.__tzolkin_date, end=other.__tzolkin_date)
+        days = getTzolkinDiff(start=self.getTzolkinDate(), end=other.getTzolkinDate())
         return datetime.timedelta(days=days)
 
     ############################################################################
@@ -367,6 +563,9 @@ class Tzolkin:
     def getNameNumberFromName(name_str: str) -> int:
         """Return the day name's number (between 1 and 20) of the Tzolkin day name.
         Imix yields the number 1, Ikʼ 2, ... , Ajaw yields 20.
+        Ignores lower- and uppercase and all non-alphanumberic characters and accepts
+        the colonial Yucatec, Kʼicheʼ and Nahuatl names and the aliases added by
+        `calculate.registerTzolkinAlias` too, like "Ahau", "Ajpu" or "Xochitl".
 
         Args:
             name_str (TzolkinName): The day name to convert to a number.
@@ -381,9 +580,11 @@ class Tzolkin:
             int: The number of the Tzolkin day name, between 1 and 20 (including 1 and
                 20).
         """
-        for num, name in day_names.items():
-            if name.upper() == name_str.upper():
-                return num
+        ret_val = 0
+        if isinstance(name_str, str):
+            ret_val = _day_name_numbers.get(name_str) or parseTzolkinName(name_str)
+        if ret_val != 0:
+            return ret_val
 
         raise TzolkinException(
             'string "{name}" is not a valid Tzolkin day name, one of {list}'.format(
@@ -417,12 +618,7 @@ class Tzolkin:
         Returns:
             List[str]: All days with day number and name in a list of strings.
         """
-        ret_val: List[str] = []
-        tzolkin_list = makeLookUpTable()
-        for tzolkin_date in tzolkin_list.values():
-            ret_val.append(tzolkin_date.__repr__())
-
-        return ret_val
+        return list(makeLabelTable()[1:])
 
     ############################################################################
     @staticmethod
@@ -436,7 +632,7 @@ class Tzolkin:
         Raises:
             TzolkinException: If `number` is not in [1, 13] (including 1 and 13)
         """
-        if number not in day_numbers.keys():
+        if number not in day_numbers:
             raise TzolkinException(
                 "number {num} is not a valid Tzolkin day number, not between 1 and 13 (including 1 and 13)".format(
                     num=number
@@ -463,33 +659,172 @@ class Tzolkin:
             )
 
     ############################################################################
-    @staticmethod
-    def __checkNameString(name_str: TzolkinName) -> None:
-        """Check, if the given string is a valid Tzolkin day name.
-         The valid day names for `name_str` are: "Imix", "Ikʼ", "Akʼbʼal", "Kʼan",
-        "Chikchan", "Kimi", "Manikʼ", "Lamat", "Muluk", "Ok", "Chuwen", "Ebʼ", "Bʼen",
-        "Ix", "Men", "Kʼibʼ", "Kabʼan", "Etzʼnabʼ", "Kawak" and "Ajaw".
+    def __repr__(self) -> str:
+        """Return the string representation of a Tzolkin date.
+        Return a string containing day number, day name and the day name'S glyph in
+        Unicode - that works as soon as the Maya glyphs are added to the standard.
+
+        Returns:
+            str: The string representation of a Tzolkin date.
+        """
+        return _tzolkin_labels[self.__year_day]
+
+    __str__ = __repr__
+
+    ############################################################################
+    def __eq__(self, other: object) -> bool:
+        """Return `True`, if `other` is a `Tzolkin` instance with the same Tzolkin date.
+
+        Args:
+            other (object): The object to compare to.
+
+        Returns:
+            bool: `True`, if both are the same Tzolkin date.
+        """
+        if not isinstance(other, Tzolkin):
+            return NotImplemented
+
+        return self.__year_day == other.__year_day
+
+    ############################################################################
+    def __lt__(self, other: Tzolkin) -> bool:
+        """Return `True`, if this Tzolkin date is earlier in the Tzolkin year than
+        `other`.
+
+        Args:
+            other (Tzolkin): The Tzolkin date to compare to.
+
+        Returns:
+            bool: `True`, if the day in the Tzolkin year is less than that of `other`.
+        """
+        if not isinstance(other, Tzolkin):
+            return NotImplemented
+
+        return self.__year_day < other.__year_day
+
+    ############################################################################
+    def __le__(self, other: Tzolkin) -> bool:
+        """Return `True`, if this Tzolkin date is not later in the Tzolkin year than
+        `other`.
+
+        Args:
+            other (Tzolkin): The Tzolkin date to compare to.
+
+        Returns:
+            bool: `True`, if the day in the Tzolkin year is less than or equal to that
+                of `other`.
+        """
+        if not isinstance(other, Tzolkin):
+            return NotImplemented
+
+        return self.__year_day <= other.__year_day
+
+    ############################################################################
+    def __gt__(self, other: Tzolkin) -> bool:
+        """Return `True`, if this Tzolkin date is later in the Tzolkin year than
+        `other`.
 
         Args:
-            name_str (TzolkinName): The string to check.
+            other (Tzolkin): The Tzolkin date to compare to.
+
+        Returns:
+            bool: `True`, if the day in the Tzolkin year is greater than that of
+                `other`.
+        """
+        if not isinstance(other, Tzolkin):
+            return NotImplemented
+
+        return self.__year_day > other.__year_day
+
+    ############################################################################
+    def __ge__(self, other: Tzolkin) -> bool:
+        """Return `True`, if this Tzolkin date is not earlier in the Tzolkin year than
+        `other`.
+
+        Args:
+            other (Tzolkin): The Tzolkin date to compare to.
+
+        Returns:
+            bool: `True`, if the day in the Tzolkin year is greater than or equal to
+                that of `other`.
+        """
+        if not isinstance(other, Tzolkin):
+            return NotImplemented
+
+        return self.__year_day >= other.__year_day
+
+    ############################################################################
+    def __hash__(self) -> int:
+        """Return the hash of the Tzolkin date.
+
+        Returns:
+            int: The hash of the day in the Tzolkin year.
+        """
+        return hash(self.__year_day)
+
+    ############################################################################
+    def __index__(self) -> int:
+        """Return the day in the Tzolkin year, to use a `Tzolkin` instance as index.
+
+        Returns:
+            int: The day in the Tzolkin year, between 1 and 260.
+        """
+        return self.__year_day
+
+    ############################################################################
+    def __setattr__(self, name: str, value: Any) -> None:
+        """`Tzolkin` instances are immutable, setting attributes raises an exception.
+
+        Args:
+            name (str): The name of the attribute.
+            value (Any): The value to set.
 
         Raises:
-            TzolkinException: If `name_str` is not a valid Tzolkin day name.
+            AttributeError: Always.
         """
-        if name_str not in day_names.values():
-            raise TzolkinException(
-                'string "{name}" is not a valid Tzolkin day name, one of: {list}'.format(
-                    name=name_str, list=day_names.values()
-                )
-            )
+        raise AttributeError("Tzolkin instances are immutable")
 
     ############################################################################
-    def __repr__(self) -> str:
-        """Return the string representation of a Tzolkin date.
-        Return a string containing day number, day name and the day name'S glyph in
-        Unicode - that works as soon as the Maya glyphs are added to the standard.
+    def __delattr__(self, name: str) -> None:
+        """`Tzolkin` instances are immutable, deleting attributes raises an exception.
+
+        Args:
+            name (str): The name of the attribute.
+
+        Raises:
+            AttributeError: Always.
+        """
+        raise AttributeError("Tzolkin instances are immutable")
+
+    ############################################################################
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Return the arguments to recreate this instance, used by `pickle` and
+        `copy`.
 
         Returns:
-            str: The string representation of a Tzolkin date.
+            Tuple[Any, ...]: The class and the arguments of the constructor.
         """
-        return self.__tzolkin_date.__repr__()
+        tzolkin = _tzolkin_dates[self.__year_day]
+        return self.__class__, (tzolkin.number, None, tzolkin.name)
+
+
+################################################################################
+def __buildInstances() -> Tuple[Tzolkin, ...]:
+    """Return the `Tzolkin` instances of all days in the Tzolkin year.
+
+    Returns:
+        Tuple[Tzolkin, ...]: The `Tzolkin` instance of each day in the Tzolkin year,
+                            index 0 is not used.
+    """
+    instances = []
+    for year_day in range(TZOLKIN_YEAR_LENGTH + 1):
+        instance = object.__new__(Tzolkin)
+        object.__setattr__(instance, "_Tzolkin__year_day", max(year_day, 1))
+        instances.append(instance)
+
+    return tuple(instances)
+
+
+# The `Tzolkin` instance of each day in the Tzolkin year, returned by
+# `Tzolkin._fromYearDay`. Index 0 is not used.
+_tzolkin_instances: Tuple[Tzolkin, ...] = __buildInstances()
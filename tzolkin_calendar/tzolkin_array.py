@@ -0,0 +1,415 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     tzolkin_array.py
+# Date:     18.Oct.2026
+###############################################################################
+"""Compact container of Tzolkin dates.
+
+A `TzolkinArray` holds the days in the Tzolkin year (1 to 260) of its Tzolkin dates
+in an `array.array` of unsigned shorts, that is two bytes per date. Indexing returns
+`TzolkinDate` instances.
+`TzolkinArray.fromBuffer` returns a `TzolkinArray` using a buffer like a memory
+mapped file as storage without copying it. Such an array is copied to an
+`array.array` when appending to it.
+
+Example:
+
+>>> import datetime
+>>> from tzolkin_calendar.tzolkin_array import TzolkinArray
+>>> tzolkin_array = TzolkinArray.fromDates([datetime.date(2014, 5, 23), datetime.date(2021, 3, 20)])
+>>> tzolkin_array
+TzolkinArray([2 Etzʼnabʼ, 12 Chuwen])
+>>> tzolkin_array[1]
+12 Chuwen
+"""
+
+from __future__ import annotations
+
+import collections
+import datetime
+import operator
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, Optional, Union, overload
+
+from tzolkin_calendar import TzolkinDate, TzolkinException, _tzolkin_dates
+from tzolkin_calendar.calculate import (
+    TZOLKIN_YEAR_LENGTH,
+    getTzolkinDay,
+    ordinal2TzolkinDay,
+)
+
+
+################################################################################
+class TzolkinArray(Sequence):
+    """A sequence of Tzolkin dates, stored as days in the Tzolkin year in an
+    `array.array` of type 'H', two bytes per date.
+    """
+
+    __slots__ = ("__data",)
+
+    ############################################################################
+    def __init__(self, tzolkin_dates: Iterable[TzolkinDate] = ()) -> None:
+        """Generate a `TzolkinArray` holding the given Tzolkin dates.
+
+        Args:
+            tzolkin_dates (Iterable[TzolkinDate], optional): The Tzolkin dates to
+                                                        store. Defaults to ().
+
+        Raises:
+            TzolkinException: If one of the given dates is not a valid Tzolkin date.
+        """
+        self.__data = array("H", map(self.__toYearDay, tzolkin_dates))
+
+    ############################################################################
+    @classmethod
+    def fromYearDays(cls, year_days: Iterable[int]) -> TzolkinArray:
+        """Return a `TzolkinArray` holding the Tzolkin dates with the given days in
+        the Tzolkin year.
+
+        Args:
+            year_days (Iterable[int]): The days in the Tzolkin year, between 1 and 260
+                                    (including 1 and 260).
+
+        Raises:
+            TzolkinException: If one of the days is not between 1 and 260.
+
+        Returns:
+            TzolkinArray: The Tzolkin dates with the days in the Tzolkin year
+                        `year_days`.
+        """
+        try:
+            data = array("H", year_days)
+        except OverflowError as excp:
+            raise TzolkinException(
+                "the days in the Tzolkin year must be between 1 and 260 (including 1 and 260)"
+            ) from excp
+
+        if data and (min(data) < 1 or max(data) > TZOLKIN_YEAR_LENGTH):
+            raise TzolkinException(
+                "the days in the Tzolkin year must be between 1 and 260 (including 1 and 260)"
+            )
+
+        return cls.__fromArray(data)
+
+    ############################################################################
+    @classmethod
+    def fromDates(cls, dates: Iterable[datetime.date]) -> TzolkinArray:
+        """Return a `TzolkinArray` holding the Tzolkin dates of the given gregorian
+        dates.
+
+        Args:
+            dates (Iterable[datetime.date]): The gregorian dates to convert.
+
+        Returns:
+            TzolkinArray: The Tzolkin dates of the gregorian dates `dates`.
+        """
+        return cls.fromOrdinals(map(datetime.date.toordinal, dates))
+
+    ############################################################################
+    @classmethod
+    def fromOrdinals(cls, ordinals: Iterable[int]) -> TzolkinArray:
+        """Return a `TzolkinArray` holding the Tzolkin dates of the gregorian dates
+        with the given ordinals, as returned by `datetime.date.toordinal`.
+
+        Args:
+            ordinals (Iterable[int]): The ordinals of the gregorian dates to convert.
+
+        Returns:
+            TzolkinArray: The Tzolkin dates of the gregorian dates with the ordinals
+                        `ordinals`.
+        """
+        return cls.__fromArray(array("H", map(ordinal2TzolkinDay, ordinals)))
+
+    ############################################################################
+    @classmethod
+    def fromBuffer(cls, buffer: Any, validate: bool = True) -> TzolkinArray:
+        """Return a `TzolkinArray` using the buffer `buffer` of days in the Tzolkin
+        year as storage, without copying it.
+        The buffer must not be changed while the `TzolkinArray` uses it.
+
+        Args:
+            buffer (Any): An object supporting the buffer protocol holding unsigned
+                          shorts in native byte order, like a `memoryview` of format
+                          'H' or 'B'.
+            validate (bool, optional): Check that all days are between 1 and 260,
+                                       which reads the whole buffer. Only pass
+                                       `False` for buffers that have already been
+                                       checked. Defaults to True.
+
+        Raises:
+            TzolkinException: If `validate` is `True` and one of the days is not
+                            between 1 and 260, or the buffer does not hold
+                            unsigned shorts.
+
+        Returns:
+            TzolkinArray: The Tzolkin dates with the days in the Tzolkin year of
+                        `buffer`.
+        """
+        data = memoryview(buffer).toreadonly()
+        if data.format != "H":
+            try:
+                data = data.cast("B").cast("H")
+            except TypeError as excp:
+                raise TzolkinException(
+                    "the buffer does not hold unsigned shorts"
+                ) from excp
+
+        if validate and data and (min(data) < 1 or max(data) > TZOLKIN_YEAR_LENGTH):
+            raise TzolkinException(
+                "the days in the Tzolkin year must be between 1 and 260 (including 1 and 260)"
+            )
+
+        return cls.__fromArray(data)
+
+    ############################################################################
+    @classmethod
+    def __fromArray(cls, data: Union[array, memoryview]) -> TzolkinArray:
+        """Return a `TzolkinArray` using the given array as storage, without checking
+        the values.
+
+        Args:
+            data (Union[array, memoryview]): The days in the Tzolkin year, an array or
+                                            read-only `memoryview` of type 'H'.
+
+        Returns:
+            TzolkinArray: The `TzolkinArray` using `data` as storage.
+        """
+        ret_val = cls.__new__(cls)
+        ret_val.__data = data
+        return ret_val
+
+    ############################################################################
+    def toYearDays(self) -> array:
+        """Return a copy of the days in the Tzolkin year of the stored dates.
+
+        Returns:
+            array: The days in the Tzolkin year, an `array.array` of type 'H'.
+        """
+        return array("H", self.__data)
+
+    ############################################################################
+    def getBuffer(self) -> memoryview:
+        """Return a read-only `memoryview` of the stored days in the Tzolkin year,
+        without copying them.
+
+        Returns:
+            memoryview: The read-only view of the days in the Tzolkin year, of format
+                        'H'.
+        """
+        return memoryview(self.__data).toreadonly()
+
+    ############################################################################
+    def __buffer__(self, flags: int) -> memoryview:
+        """Return a read-only view of the stored days in the Tzolkin year, this is the
+        buffer protocol of Python 3.12 and newer.
+
+        Args:
+            flags (int): The buffer flags.
+
+        Returns:
+            memoryview: The read-only view of the days in the Tzolkin year.
+        """
+        return self.getBuffer()
+
+    ############################################################################
+    def append(self, tzolkin: TzolkinDate) -> None:
+        """Append the Tzolkin date `tzolkin`.
+
+        Args:
+            tzolkin (TzolkinDate): The Tzolkin date to append.
+
+        Raises:
+            TzolkinException: If `tzolkin` is not a valid Tzolkin date.
+        """
+        self.__writableData().append(self.__toYearDay(tzolkin))
+
+    ############################################################################
+    def extend(self, tzolkin_dates: Iterable[TzolkinDate]) -> None:
+        """Append all Tzolkin dates of `tzolkin_dates`.
+
+        Args:
+            tzolkin_dates (Iterable[TzolkinDate]): The Tzolkin dates to append.
+
+        Raises:
+            TzolkinException: If one of the Tzolkin dates is not valid.
+        """
+        if isinstance(tzolkin_dates, TzolkinArray):
+            self.__writableData().extend(tzolkin_dates.__data)
+        else:
+            self.__writableData().extend(map(self.__toYearDay, tzolkin_dates))
+
+    ############################################################################
+    def __writableData(self) -> array:
+        """Return the storage, after copying it to an `array.array` if it is a
+        read-only buffer.
+
+        Returns:
+            array: The `array.array` holding the days in the Tzolkin year.
+        """
+        if not isinstance(self.__data, array):
+            self.__data = array("H", self.__data)
+
+        return self.__data
+
+    ############################################################################
+    def count(self, tzolkin: TzolkinDate) -> int:
+        """Return the number of times the Tzolkin date `tzolkin` is stored.
+
+        Args:
+            tzolkin (TzolkinDate): The Tzolkin date to count.
+
+        Returns:
+            int: The number of occurrences of `tzolkin`.
+        """
+        return operator.countOf(self.__data, getTzolkinDay(tzolkin))
+
+    ############################################################################
+    def countAll(self) -> Dict[TzolkinDate, int]:
+        """Return the number of times each stored Tzolkin date occurs.
+
+        Returns:
+            Dict[TzolkinDate, int]: The stored Tzolkin dates as keys and the number of
+                                    their occurrences as values.
+        """
+        return {
+            _tzolkin_dates[year_day]: num
+            for year_day, num in sorted(collections.Counter(self.__data).items())
+        }
+
+    ############################################################################
+    def index(
+        self, tzolkin: TzolkinDate, start: int = 0, stop: Optional[int] = None
+    ) -> int:
+        """Return the index of the first occurrence of the Tzolkin date `tzolkin`.
+
+        Args:
+            tzolkin (TzolkinDate): The Tzolkin date to search.
+            start (int, optional): The index to start the search at. Defaults to 0.
+            stop (int, optional): The index to stop the search at. Defaults to None,
+                                the end of the array.
+
+        Raises:
+            ValueError: If `tzolkin` isn't found.
+
+        Returns:
+            int: The index of the first occurrence of `tzolkin`.
+        """
+        year_day = getTzolkinDay(tzolkin)
+        positions = range(len(self.__data))[start:stop]
+        first, end = positions.start, positions.stop
+
+        return first + operator.indexOf(memoryview(self.__data)[first:end], year_day)
+
+    ############################################################################
+    def __len__(self) -> int:
+        """Return the number of stored Tzolkin dates.
+
+        Returns:
+            int: The number of stored Tzolkin dates.
+        """
+        return len(self.__data)
+
+    ############################################################################
+    @overload
+    def __getitem__(self, index: int) -> TzolkinDate:  # noqa: D418
+        """Return the Tzolkin date at index `index`."""
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TzolkinArray:  # noqa: D418
+        """Return a new `TzolkinArray` holding the slice `index`."""
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TzolkinDate, TzolkinArray]:
+        """Return the Tzolkin date at index `index` or a new `TzolkinArray` holding
+        the slice `index`.
+
+        Args:
+            index (Union[int, slice]): The index or slice to return.
+
+        Returns:
+            Union[TzolkinDate, TzolkinArray]: The Tzolkin date at `index`, or the
+                                            Tzolkin dates of the slice `index`.
+        """
+        if isinstance(index, slice):
+            return self.__fromArray(self.__data[index])
+
+        return _tzolkin_dates[self.__data[index]]
+
+    ############################################################################
+    def __iter__(self) -> Iterator[TzolkinDate]:
+        """Return an iterator over the stored Tzolkin dates.
+
+        Returns:
+            Iterator[TzolkinDate]: The iterator over the stored Tzolkin dates.
+        """
+        return map(_tzolkin_dates.__getitem__, self.__data)
+
+    ############################################################################
+    def __contains__(self, tzolkin: object) -> bool:
+        """Return `True` if the Tzolkin date `tzolkin` is stored, `False` else.
+
+        Args:
+            tzolkin (object): The Tzolkin date to search.
+
+        Returns:
+            bool: `True`, if `tzolkin` is stored in this array.
+        """
+        if not isinstance(tzolkin, TzolkinDate):
+            return False
+
+        return getTzolkinDay(tzolkin) in self.__data
+
+    ############################################################################
+    def __eq__(self, other: object) -> bool:
+        """Return `True`, if both arrays hold the same Tzolkin dates in the same
+        order.
+
+        Args:
+            other (object): The object to compare to.
+
+        Returns:
+            bool: `True`, if both arrays hold the same Tzolkin dates.
+        """
+        if not isinstance(other, TzolkinArray):
+            return NotImplemented
+
+        return self.__data == other.__data
+
+    __hash__ = None  # type: ignore
+
+    ############################################################################
+    def __repr__(self) -> str:
+        """Return the string representation of the Tzolkin dates.
+
+        Returns:
+            str: The string representation of the Tzolkin dates.
+        """
+        return "TzolkinArray([{dates}])".format(
+            dates=", ".join(tzolkin.__repr__() for tzolkin in self)
+        )
+
+    ############################################################################
+    @staticmethod
+    def __toYearDay(tzolkin: TzolkinDate) -> int:
+        """Return the day in the Tzolkin year of the given Tzolkin date.
+
+        Args:
+            tzolkin (TzolkinDate): The Tzolkin date to convert.
+
+        Raises:
+            TzolkinException: If `tzolkin` is not a valid Tzolkin date.
+
+        Returns:
+            int: The day in the Tzolkin year of `tzolkin`.
+        """
+        year_day = getTzolkinDay(tzolkin)
+        if year_day == 0:
+            raise TzolkinException(
+                "{tzolkin} is not a valid Tzolkin date".format(tzolkin=tuple(tzolkin))
+            )
+
+        return year_day
@@ -0,0 +1,264 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2021 Roland Csaszar
+#
+# Project:  tzolkin-calendar
+# File:     vectorized.py
+# Date:     18.Oct.2026
+###############################################################################
+"""This module holds functions to convert whole arrays of gregorian dates to Tzolkin
+dates at once, using NumPy.
+
+NumPy is an optional dependency of tzolkin-calendar, install it using
+`pip install tzolkin-calendar[numpy]`.
+The gregorian dates are either NumPy `datetime64` arrays or integer arrays of date
+ordinals, as returned by `datetime.date.toordinal`. The results are the same as
+those of `tzolkin_calendar.calculate.gregorian2tzolkin`.
+
+Example:
+
+>>> import numpy
+>>> import tzolkin_calendar.vectorized
+>>> dates = numpy.array(["2014-05-23", "2021-03-20"], dtype="datetime64[D]")
+>>> tzolkin_calendar.vectorized.gregorian2tzolkin(dates)
+(array([ 2, 12], dtype=uint8), array([18, 11], dtype=uint8))
+
+>>> tzolkin_calendar.vectorized.gregorian2TzolkinDay(dates)
+array([158,  51], dtype=uint16)
+
+>>> tzolkin_calendar.vectorized.nextOccurrence(
+        tzolkin_calendar.TzolkinDate(number=13, name=20), dates
+    )
+array(['2014-09-02', '2021-10-15'], dtype='datetime64[D]')
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, Tuple
+
+from tzolkin_calendar import TzolkinDate, TzolkinException, day_names, day_numbers
+from tzolkin_calendar.calculate import (
+    ORDINAL_OFFSET,
+    TZOLKIN_YEAR_LENGTH,
+    getTzolkinDay,
+)
+
+try:
+    import numpy as np
+except ImportError as excp:  # pragma: no cover
+    raise ImportError(
+        "tzolkin_calendar.vectorized needs NumPy, install it using 'pip install tzolkin-calendar[numpy]'"
+    ) from excp
+
+# The ordinal of the first day of NumPy's `datetime64`, "1970-01-01".
+__datetime64_epoch: int = datetime.date(1970, 1, 1).toordinal()
+
+
+################################################################################
+def toOrdinals(dates: Any) -> np.ndarray:
+    """Return the ordinals of the given gregorian dates as an `int64` array.
+    The ordinal of a date is the one returned by `datetime.date.toordinal`.
+
+    Args:
+        dates (Any): An array (or anything NumPy can convert to an array) of
+                     `datetime64` values, of `datetime.date` objects or integer
+                     ordinals. Integers are returned unchanged.
+
+    Raises:
+        TzolkinException: If `dates` can't be interpreted as dates or ordinals.
+
+    Returns:
+        np.ndarray: The `int64` array of the ordinals of `dates`.
+    """
+    date_array = np.asarray(dates)
+    if date_array.size == 0:
+        return np.empty(date_array.shape, dtype=np.int64)
+
+    if date_array.dtype.kind == "O":
+        date_array = date_array.astype("datetime64[D]")
+
+    if date_array.dtype.kind == "M":
+        return date_array.astype("datetime64[D]").astype(np.int64) + __datetime64_epoch
+
+    if date_array.dtype.kind in "iu":
+        return date_array.astype(np.int64, copy=False)
+
+    raise TzolkinException(
+        "array of type {dtype} does not hold dates or date ordinals".format(
+            dtype=date_array.dtype
+        )
+    )
+
+
+################################################################################
+def gregorian2TzolkinDay(dates: Any) -> np.ndarray:
+    """Return the days in the Tzolkin year of the given gregorian dates.
+    See `tzolkin_calendar.calculate.getTzolkinDay`.
+
+    Args:
+        dates (Any): The gregorian dates to convert, see `toOrdinals`.
+
+    Returns:
+        np.ndarray: The `uint16` array of days in the Tzolkin year, between 1 and 260
+                    (including 1 and 260).
+    """
+    ordinals = toOrdinals(dates)
+
+    return ((ordinals + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH + 1).astype(np.uint16)
+
+
+################################################################################
+def gregorian2tzolkin(dates: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the Tzolkin dates of the given gregorian dates as two arrays, the Tzolkin
+    day numbers and the Tzolkin day name numbers.
+    See `tzolkin_calendar.calculate.gregorian2tzolkin`.
+
+    Args:
+        dates (Any): The gregorian dates to convert, see `toOrdinals`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The `uint8` arrays of Tzolkin day numbers
+                (between 1 and 13) and Tzolkin day name numbers (between 1 and 20).
+    """
+    ordinals = toOrdinals(dates)
+
+    return __splitTzolkinDays((ordinals + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH)
+
+
+################################################################################
+def nextOccurrence(targets: Any, starts: Any) -> np.ndarray:
+    """Return the next gregorian dates after `starts` that have the Tzolkin dates
+    `targets`.
+    `targets` and `starts` are broadcast against each other, so either may be a
+    single value. Same as `tzolkin_calendar.calculate.nextTzolkin`, if a start date
+    already has the Tzolkin date to search for, the date 260 days later is returned.
+
+    Args:
+        targets (Any): The Tzolkin dates to search for, as days in the Tzolkin year
+                       (between 1 and 260) or a single `TzolkinDate`.
+        starts (Any): The gregorian dates to start the search, see `toOrdinals`.
+
+    Raises:
+        TzolkinException: If a day in the Tzolkin year is not between 1 and 260.
+
+    Returns:
+        np.ndarray: The found dates, as `datetime64[D]` array or, if `starts` are
+                    integer ordinals, as `int64` array of ordinals.
+    """
+    start_array = np.asarray(starts)
+    ordinals = toOrdinals(start_array)
+    start_days = (ordinals + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH + 1
+
+    found = (
+        ordinals + (__targetDays(targets) - start_days - 1) % TZOLKIN_YEAR_LENGTH + 1
+    )
+
+    return __fromOrdinals(found, start_array)
+
+
+################################################################################
+def lastOccurrence(targets: Any, starts: Any) -> np.ndarray:
+    """Return the last gregorian dates before `starts` that have the Tzolkin dates
+    `targets`.
+    `targets` and `starts` are broadcast against each other, so either may be a
+    single value. Same as `tzolkin_calendar.calculate.lastTzolkin`, if a start date
+    already has the Tzolkin date to search for, the date 260 days before is returned.
+
+    Args:
+        targets (Any): The Tzolkin dates to search for, as days in the Tzolkin year
+                       (between 1 and 260) or a single `TzolkinDate`.
+        starts (Any): The gregorian dates to start the search, see `toOrdinals`.
+
+    Raises:
+        TzolkinException: If a day in the Tzolkin year is not between 1 and 260.
+
+    Returns:
+        np.ndarray: The found dates, as `datetime64[D]` array or, if `starts` are
+                    integer ordinals, as `int64` array of ordinals.
+    """
+    start_array = np.asarray(starts)
+    ordinals = toOrdinals(start_array)
+    start_days = (ordinals + ORDINAL_OFFSET) % TZOLKIN_YEAR_LENGTH + 1
+
+    found = (
+        ordinals - (start_days - __targetDays(targets) - 1) % TZOLKIN_YEAR_LENGTH - 1
+    )
+
+    return __fromOrdinals(found, start_array)
+
+
+################################################################################
+def __targetDays(targets: Any) -> np.ndarray:
+    """Return the days in the Tzolkin year to search for as `int64` array.
+
+    Args:
+        targets (Any): The days in the Tzolkin year or a single `TzolkinDate`.
+
+    Raises:
+        TzolkinException: If a day in the Tzolkin year is not between 1 and 260.
+
+    Returns:
+        np.ndarray: The days in the Tzolkin year as `int64` array.
+    """
+    if isinstance(targets, TzolkinDate):
+        targets = getTzolkinDay(targets)
+
+    year_days = np.asarray(targets, dtype=np.int64)
+    if np.any((year_days < 1) | (year_days > TZOLKIN_YEAR_LENGTH)):
+        raise TzolkinException(
+            "the days in the Tzolkin year to search for must be between 1 and 260 (including 1 and 260)"
+        )
+
+    return year_days
+
+
+################################################################################
+def __fromOrdinals(ordinals: np.ndarray, like: np.ndarray) -> np.ndarray:
+    """Return the ordinals as `datetime64[D]` array, or unchanged, if the array `like`
+    holds integer ordinals too.
+
+    Args:
+        ordinals (np.ndarray): The `int64` array of ordinals to convert.
+        like (np.ndarray): The array of the given dates.
+
+    Returns:
+        np.ndarray: The dates as `datetime64[D]` array or `int64` array of ordinals.
+    """
+    if like.dtype.kind in "iu":
+        return ordinals
+
+    return (ordinals - __datetime64_epoch).astype("datetime64[D]")
+
+
+################################################################################
+def tzolkinDays2tzolkin(year_days: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the Tzolkin day numbers and day name numbers of the given days in the
+    Tzolkin year.
+
+    Args:
+        year_days (Any): The days in the Tzolkin year, between 1 and 260 (including 1
+                         and 260).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The `uint8` arrays of Tzolkin day numbers
+                (between 1 and 13) and Tzolkin day name numbers (between 1 and 20).
+    """
+    return __splitTzolkinDays(np.asarray(year_days, dtype=np.int64) - 1)
+
+
+################################################################################
+def __splitTzolkinDays(zero_days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the Tzolkin day numbers and day name numbers of the given zero based days
+    in the Tzolkin year.
+
+    Args:
+        zero_days (np.ndarray): The days in the Tzolkin year, between 0 and 259.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The `uint8` arrays of Tzolkin day numbers
+                                        and Tzolkin day name numbers.
+    """
+    numbers = (zero_days % len(day_numbers) + 1).astype(np.uint8)
+    names = (zero_days % len(day_names) + 1).astype(np.uint8)
+
+    return numbers, names